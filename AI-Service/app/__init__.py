@@ -4,7 +4,9 @@ from flask import Flask
 from flask_cors import CORS
 from app.core.config import settings
 from app.core.logging import setup_logging
-from app.database.init import init_db
+from app.database.init import init_db, register_cli
+from app.database.database import init_request_session
+from app.database.instrumentation import init_query_instrumentation
 from app.utils.error import handle_api_error, APIError, safe_json_response
 
 # 새로운 구조의 블루프린트 import
@@ -52,7 +54,9 @@ def create_app() -> Flask:
                     "parent_hint": "/parent/hint",
                     "parent_daily_hint": "/parent/daily-hint",
                     "child_request": "/child/request",
-                    "child_report": "/child/report"
+                    "child_report": "/child/report",
+                    "child_glucose": "/child/glucose",
+                    "child_glucose_batch": "/child/glucose/batch"
                 },
                 "api_v1": {
                     "health": "/api/v1/health",
@@ -63,7 +67,16 @@ def create_app() -> Flask:
             }
         })
     
-    # 데이터베이스 초기화
+    # 요청 범위 DB 세션 정리 훅 등록
+    init_request_session(app)
+    
+    # 쿼리 계측 (요청별 쿼리 수/시간 Server-Timing 헤더, 느린 쿼리 로그)
+    init_query_instrumentation(app)
+    
+    # 데이터베이스 초기화 (기본은 부팅 시 DB 왕복 없음 - DB_INIT_ON_BOOT 참고)
     init_db()
     
+    # flask init-db / check-db 명령
+    register_cli(app)
+    
     return app
@@ -1,25 +1,44 @@
 """아이 관련 API 엔드포인트 - 기존 구조 유지"""
 
-from flask import Blueprint, request, g, jsonify
+from flask import Blueprint, Response, request, g, jsonify, stream_with_context
 from app.utils.error import (
     log_request_info, safe_json_response, ValidationError, NotFoundError, DatabaseError,
     DataIntegrityError, TimeoutError, ServiceUnavailableError, QuestError, ConflictError,
-    get_user_friendly_error, get_user_friendly_success
+    get_user_friendly_error, get_user_friendly_success, validate_date_format
 )
 from app.utils.auth import jwt_auth_member_id
-from app.database import get_member_info, get_quests_by_date, get_weekly_glucose_data
+from app.database import (
+    get_member_info, get_quests_by_date, get_weekly_glucose_series,
+    iter_glucose_history, ingest_glucose_readings
+)
 from app.utils.business import (
-    format_glucose_data, calculate_weekly_glucose_summary,
-    get_default_date_range
+    calculate_weekly_glucose_summary,
+    get_default_date_range, parse_glucose_readings
 )
 from app.services.glucose_service import calculate_glucose_metrics, analyze_glucose
+from app.services.ingestion_events import GlucoseIngestedEvent, emit_glucose_ingested
 from app.utils.common import load_text
 from app.database import SessionLocal
 from app.models.database_models import Quest
 from datetime import datetime
+import base64
+import binascii
+import json
+import logging
+
+logger = logging.getLogger(__name__)
 
 children_bp = Blueprint('children', __name__)
 
+# 혈당 이력 페이지 크기 (스트리밍이므로 큰 페이지도 메모리 사용량은 일정)
+GLUCOSE_HISTORY_DEFAULT_LIMIT = 10000
+GLUCOSE_HISTORY_MAX_LIMIT = 200000
+
+# 혈당 일괄 적재 요청당 최대 측정값 수 (5분 간격 CGM 기준 약 17일)
+GLUCOSE_BATCH_MAX_READINGS = 5000
+# 응답에 포함할 거부 사유 최대 개수
+GLUCOSE_BATCH_MAX_ERRORS = 50
+
 
 @children_bp.route("/request", methods=["POST"])
 @jwt_auth_member_id
@@ -92,21 +111,21 @@ def child_report_api():
         member_id = g.member_id
         member_info = g.member_info
         
-        start_date = request.args.get("start_date")
-        end_date = request.args.get("end_date")
+        start_date = validate_date_format(request.args.get("start_date"), "start_date")
+        end_date = validate_date_format(request.args.get("end_date"), "end_date")
         
         if not start_date or not end_date:
             start_date, end_date = get_default_date_range()
         
         # 주간 혈당 데이터 조회
         try:
-            glucose_data = get_weekly_glucose_data(member_id, start_date, end_date)
+            glucose_data = get_weekly_glucose_series(member_id, start_date, end_date)
             if not glucose_data:
                 raise DataIntegrityError("혈당 데이터가 없습니다")
         except Exception as e:
             raise DatabaseError(f"혈당 데이터 조회 실패: {str(e)}")
         
-        # 혈당 요약 계산
+        # 혈당 요약 계산 (이미 조회한 시계열 사용 - 지표와 같은 원본 기준)
         try:
             summary = calculate_weekly_glucose_summary(glucose_data)
         except Exception as e:
@@ -114,8 +133,7 @@ def child_report_api():
         
         # RAG 강화된 LLM 분석
         try:
-            formatted_data = format_glucose_data(glucose_data)
-            glucose_metrics = calculate_glucose_metrics(formatted_data)
+            glucose_metrics = calculate_glucose_metrics(glucose_data)
             prompt_text = load_text("app/prompts/child_report_prompt.txt")
             analysis_result = analyze_glucose(glucose_metrics, prompt_text, member_info.get('age'), member_id, use_rag=True)
         except TimeoutError as e:
@@ -166,4 +184,163 @@ def child_report_api():
     except DatabaseError as e:
         return safe_json_response(get_user_friendly_error("DATABASE_ERROR", str(e)), 500)
     except Exception as e:
-        return safe_json_response(get_user_friendly_error("INTERNAL_SERVER_ERROR", str(e)), 500)
\ No newline at end of file
+        return safe_json_response(get_user_friendly_error("INTERNAL_SERVER_ERROR", str(e)), 500)
+
+def _encode_history_cursor(row) -> str:
+    """마지막 행의 (date, time, id)를 불투명한 페이지 커서로 인코딩"""
+    raw = json.dumps([row.date, row.time, row.id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _decode_history_cursor(cursor: str):
+    """페이지 커서를 (date, time, id)로 디코딩"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        row_date, row_time, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return str(row_date), str(row_time), int(row_id)
+    except (binascii.Error, ValueError, TypeError):
+        raise ValidationError("cursor가 올바르지 않습니다")
+
+
+def _glucose_history_stream(rows, limit: int, ndjson: bool):
+    """혈당 이력을 NDJSON 또는 JSON 응답 조각으로 생성 (limit+1번째 행이 있으면 next_cursor 포함)"""
+    count, last_row, has_more = 0, None, False
+    error = None
+    if not ndjson:
+        yield '{"success":true,"data":{"readings":['
+    try:
+        for row in rows:
+            if count == limit:
+                has_more = True
+                break
+            reading = json.dumps({
+                "id": row.id, "date": row.date, "time": row.time, "glucose_mg_dl": row.glucose_mg_dl
+            }, ensure_ascii=False)
+            if ndjson:
+                yield reading + "\n"
+            else:
+                yield reading if count == 0 else "," + reading
+            count += 1
+            last_row = row
+    except Exception as e:
+        # 응답 상태 코드는 이미 전송되었으므로 마지막 조각에 오류를 담아 종료
+        logger.error(f"혈당 이력 스트리밍 실패: {e}")
+        error = "혈당 이력 조회 중 오류가 발생했습니다"
+    finally:
+        if hasattr(rows, "close"):
+            rows.close()
+
+    meta = {
+        "count": count,
+        "next_cursor": _encode_history_cursor(last_row) if has_more and error is None else None,
+    }
+    if error:
+        meta["error"] = error
+    if ndjson:
+        yield json.dumps(meta, ensure_ascii=False) + "\n"
+    else:
+        yield "]," + json.dumps(meta, ensure_ascii=False)[1:-1] + "}"
+        yield ',"timestamp":' + json.dumps(datetime.now().isoformat()) + "}"
+
+
+@children_bp.route("/glucose", methods=["GET"])
+@jwt_auth_member_id
+@log_request_info
+def child_glucose_history_api():
+    """아이 혈당 이력 API - (date, time, id) 키셋 페이지네이션 + 스트리밍 응답
+
+    Query:
+        start_date, end_date: 조회 기간 (기본 최근 7일)
+        limit: 페이지 크기 (기본 10000, 최대 200000)
+        cursor: 이전 응답의 next_cursor
+        format: json(기본) 또는 ndjson (Accept: application/x-ndjson도 지원)
+    
+    ndjson은 측정값 한 줄씩, 마지막 줄에 {"count", "next_cursor"}를 보냅니다.
+    """
+    try:
+        member_id = g.member_id
+        
+        start_date = validate_date_format(request.args.get("start_date"), "start_date")
+        end_date = validate_date_format(request.args.get("end_date"), "end_date")
+        if not start_date or not end_date:
+            start_date, end_date = get_default_date_range()
+        if start_date > end_date:
+            raise ValidationError("start_date는 end_date보다 이후일 수 없습니다")
+        
+        try:
+            limit = int(request.args.get("limit", GLUCOSE_HISTORY_DEFAULT_LIMIT))
+        except ValueError:
+            raise ValidationError("limit은 숫자여야 합니다")
+        if not 1 <= limit <= GLUCOSE_HISTORY_MAX_LIMIT:
+            raise ValidationError(f"limit은 1~{GLUCOSE_HISTORY_MAX_LIMIT} 사이여야 합니다")
+        
+        cursor = request.args.get("cursor")
+        after = _decode_history_cursor(cursor) if cursor else None
+        
+        ndjson = (
+            request.args.get("format") == "ndjson"
+            or request.accept_mimetypes.best == "application/x-ndjson"
+        )
+        
+        # 다음 페이지 여부 확인용으로 한 행 더 조회
+        rows = iter_glucose_history(member_id, start_date, end_date, after=after, limit=limit + 1)
+        return Response(
+            stream_with_context(_glucose_history_stream(rows, limit, ndjson)),
+            mimetype="application/x-ndjson" if ndjson else "application/json"
+        )
+        
+    except ValidationError as e:
+        return safe_json_response(get_user_friendly_error("VALIDATION_ERROR", str(e)), 400)
+    except DatabaseError as e:
+        return safe_json_response(get_user_friendly_error("DATABASE_ERROR", str(e)), 500)
+    except Exception as e:
+        return safe_json_response(get_user_friendly_error("INTERNAL_SERVER_ERROR", str(e)), 500)
+
+
+@children_bp.route("/glucose/batch", methods=["POST"])
+@jwt_auth_member_id
+@log_request_info
+def child_glucose_batch_api():
+    """아이 혈당 일괄 적재 API (센서 브리지용)
+
+    Body:
+        {"readings": [{"measured_at": "2025-09-01T08:05:00", "glucose_mg_dl": 112}, ...]}
+        (measured_at 대신 "date" + "time"도 허용, 측정 시각은 분 단위로 저장)
+    
+    형식/범위가 틀린 측정값은 거부 목록으로 돌려주고 나머지는 적재합니다.
+    같은 시각 측정값은 (member_id, date, time) 기준으로 upsert합니다.
+    """
+    try:
+        if not request.is_json:
+            raise ValidationError("JSON 형식의 데이터가 필요합니다")
+        
+        data = request.get_json(silent=True)
+        readings = data.get("readings") if isinstance(data, dict) else None
+        if not isinstance(readings, list) or not readings:
+            raise ValidationError("readings 배열이 필요합니다")
+        if len(readings) > GLUCOSE_BATCH_MAX_READINGS:
+            raise ValidationError(f"한 번에 최대 {GLUCOSE_BATCH_MAX_READINGS}개까지 적재할 수 있습니다")
+        
+        member_id = g.member_id
+        valid, rejected = parse_glucose_readings(readings)
+        result = ingest_glucose_readings(member_id, valid)
+        emit_glucose_ingested(GlucoseIngestedEvent(member_id, result.dates, result.inserted, result.updated))
+        
+        return safe_json_response({
+            "received": len(readings),
+            "accepted": len(valid),
+            "rejected": len(rejected),
+            "duplicates": result.duplicates,
+            "inserted": result.inserted,
+            "updated": result.updated,
+            "unchanged": result.unchanged,
+            "dates": list(result.dates),
+            "errors": rejected[:GLUCOSE_BATCH_MAX_ERRORS]
+        })
+        
+    except ValidationError as e:
+        return safe_json_response(get_user_friendly_error("VALIDATION_ERROR", str(e)), 400)
+    except DatabaseError as e:
+        return safe_json_response(get_user_friendly_error("DATABASE_ERROR", str(e)), 500)
+    except Exception as e:
+        return safe_json_response(get_user_friendly_error("INTERNAL_SERVER_ERROR", str(e)), 500)
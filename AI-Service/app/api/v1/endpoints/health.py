@@ -5,7 +5,8 @@ from app.utils.error import (
     log_request_info, safe_json_response, ValidationError, DatabaseError, 
     ServiceUnavailableError, TimeoutError, get_user_friendly_error
 )
-from app.database import SessionLocal
+from app.database import SessionLocal, get_query_stats, get_pool_stats, get_glucose_series_cache_stats
+from app.utils.auth import get_member_cache_stats
 from app.models.database_models import Member
 from datetime import datetime
 import psutil
@@ -137,7 +138,11 @@ def metrics():
     try:
         metrics_data = {
             "timestamp": datetime.now().isoformat(),
-            "monitoring_available": MONITORING_AVAILABLE
+            "monitoring_available": MONITORING_AVAILABLE,
+            "database_queries": get_query_stats(),
+            "database_pools": get_pool_stats(),
+            "member_cache": get_member_cache_stats(),
+            "glucose_series_cache": get_glucose_series_cache_stats()
         }
         
         if MONITORING_AVAILABLE:
@@ -7,15 +7,16 @@ from app.utils.error import (
     TimeoutError, DataIntegrityError, QuestError, handle_ai_service_error,
     handle_database_error, handle_glucose_data_error, handle_quest_error,
     validate_glucose_value, validate_quest_status, validate_approval_status,
-    validate_age, validate_diabetes_type, get_user_friendly_error, get_user_friendly_success
+    validate_age, validate_diabetes_type, validate_date_format, get_user_friendly_error, get_user_friendly_success
 )
 from app.utils.auth import jwt_auth_code, require_permission, Permission
 from app.database import (
-    get_member_info, get_quests_by_date, get_weekly_glucose_data, get_glucose_data,
-    get_food_data, get_exercise_data, get_glucose_food_correlation, get_glucose_exercise_correlation
+    get_member_info, get_quests_by_date, get_weekly_glucose_series, get_glucose_data,
+    get_glucose_food_correlation, get_glucose_exercise_correlation,
+    get_daily_bundle
 )
 from app.utils.business import (
-    format_glucose_data, calculate_weekly_glucose_summary,
+    calculate_weekly_glucose_summary,
     get_default_date_range, analyze_food_glucose_impact, analyze_exercise_glucose_impact, 
     generate_daily_glucose_analysis
 )
@@ -39,21 +40,20 @@ def parent_report_api():
         member_info = g.member_info
         code = member_info.get('code')  # member 테이블의 code 정보로 해당 아이의 부모 인증
         
-        start_date = request.args.get("start_date")
-        end_date = request.args.get("end_date")
+        start_date = validate_date_format(request.args.get("start_date"), "start_date")
+        end_date = validate_date_format(request.args.get("end_date"), "end_date")
         
         if not start_date or not end_date:
             start_date, end_date = get_default_date_range()
         
         # 주간 혈당 데이터 조회
-        glucose_data = get_weekly_glucose_data(member_id, start_date, end_date)
+        glucose_data = get_weekly_glucose_series(member_id, start_date, end_date)
         
-        # 혈당 요약 계산
+        # 혈당 요약 계산 (이미 조회한 시계열 사용 - 지표와 같은 원본 기준)
         summary = calculate_weekly_glucose_summary(glucose_data)
         
         # RAG 강화된 LLM 분석
-        formatted_data = format_glucose_data(glucose_data)
-        glucose_metrics = calculate_glucose_metrics(formatted_data)
+        glucose_metrics = calculate_glucose_metrics(glucose_data)
         prompt_text = load_text("app/prompts/parent_report_prompt.txt")
         analysis_result = analyze_glucose(glucose_metrics, prompt_text, member_info.get('age'), member_id, use_rag=True)
         
@@ -108,21 +108,20 @@ def parent_analyze_api():
         member_info = g.member_info
         code = member_info.get('code')  # 부모의 code 정보
         
-        start_date = request.args.get("start_date")
-        end_date = request.args.get("end_date")
+        start_date = validate_date_format(request.args.get("start_date"), "start_date")
+        end_date = validate_date_format(request.args.get("end_date"), "end_date")
         
         if not start_date or not end_date:
             start_date, end_date = get_default_date_range()
         
         # 주간 혈당 데이터 조회
-        glucose_data = get_weekly_glucose_data(member_id, start_date, end_date)
+        glucose_data = get_weekly_glucose_series(member_id, start_date, end_date)
         
-        # 혈당 요약 계산
+        # 혈당 요약 계산 (이미 조회한 시계열 사용 - 지표와 같은 원본 기준)
         summary = calculate_weekly_glucose_summary(glucose_data)
         
         # RAG 강화된 LLM 분석
-        formatted_data = format_glucose_data(glucose_data)
-        glucose_metrics = calculate_glucose_metrics(formatted_data)
+        glucose_metrics = calculate_glucose_metrics(glucose_data)
         prompt_text = load_text("app/prompts/parent_analyze_prompt.txt")
         analysis_result = analyze_glucose(glucose_metrics, prompt_text, member_info.get('age'), member_id, use_rag=True)
         
@@ -235,7 +234,7 @@ def parent_daily_hint_api():
         member_info = g.member_info
         code = member_info.get('code')  # 부모의 code 정보
         
-        date = request.args.get("date")  # YYYY-MM-DD 형식
+        date = validate_date_format(request.args.get("date"), "date")  # YYYY-MM-DD 형식
         
         # 날짜 설정 (기본값: 오늘)
         if not date:
@@ -799,13 +798,12 @@ def parent_glucose_analysis_api():
         from datetime import datetime
         date = datetime.now().strftime("%Y-%m-%d")
         
-        # 해당 날짜의 모든 데이터 조회
+        # 해당 날짜의 모든 데이터 조회 (한 번의 왕복)
         try:
-            food_data = get_food_data(member_id, date)
-            exercise_data = get_exercise_data(member_id, date)
-            glucose_data = get_glucose_data(member_id, date)
+            bundle = get_daily_bundle(member_id, date)
         except Exception as e:
             raise DatabaseError(f"데이터 조회 중 오류가 발생했습니다: {str(e)}")
+        food_data, exercise_data, glucose_data = bundle.food, bundle.exercise, bundle.glucose
         
         # 혈당 데이터 유효성 검증
         handle_glucose_data_error(glucose_data, member_id)
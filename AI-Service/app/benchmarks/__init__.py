@@ -0,0 +1 @@
+"""성능 측정용 벤치마크 모듈 (python -m app.benchmarks.<모듈명> 으로 실행)"""
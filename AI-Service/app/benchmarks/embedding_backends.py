@@ -0,0 +1,156 @@
+"""임베딩 백엔드 정확도/지연시간/메모리 벤치마크
+
+사용법:
+    python -m app.benchmarks.embedding_backends
+    python -m app.benchmarks.embedding_backends --backends sentence_transformers onnx_int8 --k 3 --min-overlap 0.8
+
+각 백엔드는 별도 프로세스에서 실행해 RSS를 독립적으로 측정하고,
+onnx_int8 백엔드의 top-k 검색 결과가 fp32 기준(sentence_transformers)과 얼마나 겹치는지 확인합니다.
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import time
+from typing import Any, Dict, List
+
+import numpy as np
+import psutil
+
+EMBEDDING_DATA_PATH = os.path.join(os.path.dirname(__file__), "..", "embedding_data")
+REFERENCE_BACKEND = "sentence_transformers"
+
+# generate_rag_enhanced_analysis가 실제로 만드는 쿼리 형태 + 자주 묻는 주제
+SAMPLE_QUERIES = [
+    "정상 혈당 관리 혈당 105.3mg/dL 스파이크 0회",
+    "정상 혈당 관리 혈당 118.0mg/dL 스파이크 2회",
+    "경계 혈당 관리 혈당 131.5mg/dL 스파이크 3회",
+    "경계 혈당 관리 혈당 139.9mg/dL 스파이크 5회",
+    "고혈당 관리 혈당 165.2mg/dL 스파이크 4회",
+    "고혈당 관리 혈당 212.7mg/dL 스파이크 8회",
+    "저혈당 응급처치 방법",
+    "아이 식후 혈당이 급하게 올라가요",
+    "운동 전후 혈당 관리",
+    "탄수화물 섭취와 혈당 지수",
+]
+
+
+def load_corpus() -> Dict[str, List[Any]]:
+    """embedding_data의 문서를 ChromaDB 적재 형식으로 로드"""
+    documents, metadatas, ids = [], [], []
+    for json_file in sorted(f for f in os.listdir(EMBEDDING_DATA_PATH) if f.endswith('.json')):
+        with open(os.path.join(EMBEDDING_DATA_PATH, json_file), 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        for i, doc in enumerate(data.get('documents', [])):
+            documents.append(doc['content'])
+            metadatas.append({'title': doc['title'], 'category': data.get('category', '기타'), 'source_file': json_file})
+            ids.append(f"{json_file}_{i}")
+    return {"documents": documents, "metadatas": metadatas, "ids": ids}
+
+
+def _current_rss_mb() -> float:
+    return psutil.Process(os.getpid()).memory_info().rss / (1024 * 1024)
+
+
+def _percentile(values: List[float], q: float) -> float:
+    return float(np.percentile(values, q)) if values else 0.0
+
+
+def run_backend(backend: str, queries: List[str], k: int, repeat: int) -> Dict[str, Any]:
+    """단일 백엔드 측정 (별도 프로세스에서 실행)"""
+    import chromadb
+    from chromadb.utils.embedding_functions import DefaultEmbeddingFunction
+    from app.services.embedding_backends import get_embedding_function
+
+    rss_before = _current_rss_mb()
+    load_start = time.perf_counter()
+    embedding_function = get_embedding_function(backend) or DefaultEmbeddingFunction()
+    embedding_function(["워밍업"])
+    load_seconds = time.perf_counter() - load_start
+    rss_after_load = _current_rss_mb()
+
+    corpus = load_corpus()
+    index_start = time.perf_counter()
+    corpus_embeddings = embedding_function(corpus["documents"])
+    index_seconds = time.perf_counter() - index_start
+
+    client = chromadb.EphemeralClient()
+    collection = client.create_collection(name=f"bench_{backend}", metadata={"hnsw:space": "cosine"})
+    collection.add(ids=corpus["ids"], embeddings=corpus_embeddings, metadatas=corpus["metadatas"])
+
+    # 쿼리 임베딩 지연시간 (요청당 1개 쿼리, 실제 서빙 형태)
+    latencies_ms = []
+    for _ in range(repeat):
+        for query in queries:
+            start = time.perf_counter()
+            embedding_function([query])
+            latencies_ms.append((time.perf_counter() - start) * 1000)
+
+    query_embeddings = embedding_function(queries)
+    results = collection.query(query_embeddings=query_embeddings, n_results=k)
+
+    return {
+        "backend": backend,
+        "load_seconds": round(load_seconds, 3),
+        "corpus_embed_seconds": round(index_seconds, 3),
+        "query_embed_ms": {
+            "p50": round(_percentile(latencies_ms, 50), 3),
+            "p95": round(_percentile(latencies_ms, 95), 3),
+            "p99": round(_percentile(latencies_ms, 99), 3),
+        },
+        "rss_mb": {
+            "before_load": round(rss_before, 1),
+            "after_load": round(rss_after_load, 1),
+            "peak": round(_current_rss_mb(), 1),
+        },
+        "top_k_ids": results["ids"],
+    }
+
+
+def top_k_overlap(reference_ids: List[List[str]], candidate_ids: List[List[str]]) -> float:
+    """쿼리별 top-k 결과 교집합 비율의 평균"""
+    overlaps = []
+    for reference, candidate in zip(reference_ids, candidate_ids):
+        if reference:
+            overlaps.append(len(set(reference) & set(candidate)) / len(reference))
+    return sum(overlaps) / len(overlaps) if overlaps else 0.0
+
+
+def _run_isolated(args):
+    backend, queries, k, repeat = args
+    return run_backend(backend, queries, k, repeat)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="RAG 임베딩 백엔드 벤치마크")
+    parser.add_argument("--backends", nargs="+", default=[REFERENCE_BACKEND, "onnx_int8"])
+    parser.add_argument("--k", type=int, default=3)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--min-overlap", type=float, default=0.8, help="fp32 대비 최소 top-k 일치율")
+    args = parser.parse_args(argv)
+
+    context = multiprocessing.get_context("spawn")
+    reports = {}
+    for backend in args.backends:
+        with context.Pool(1) as pool:
+            reports[backend] = pool.apply(_run_isolated, ((backend, SAMPLE_QUERIES, args.k, args.repeat),))
+
+    exit_code = 0
+    reference = reports.get(REFERENCE_BACKEND)
+    for backend, report in reports.items():
+        if reference is not None and backend != REFERENCE_BACKEND:
+            overlap = top_k_overlap(reference["top_k_ids"], report["top_k_ids"])
+            report[f"top{args.k}_overlap_vs_fp32"] = round(overlap, 3)
+            if overlap < args.min_overlap:
+                print(f"[FAIL] {backend} top-{args.k} 일치율 {overlap:.3f} < {args.min_overlap}", file=sys.stderr)
+                exit_code = 1
+        report.pop("top_k_ids")
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
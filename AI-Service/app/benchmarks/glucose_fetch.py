@@ -0,0 +1,141 @@
+"""주간/장기 혈당 조회 경로 벤치마크 (ORM 객체 vs 컬럼형 GlucoseSeries)
+
+사용법:
+    python -m app.benchmarks.glucose_fetch
+    python -m app.benchmarks.glucose_fetch --days 90 --interval 5 --repeat 20 --database-url sqlite:////tmp/glucose_bench.db
+
+회원 1명의 CGM 데이터(기본 90일 × 5분 간격 ≈ 26k행)를 적재한 뒤
+"조회 → calculate_weekly_glucose_summary → calculate_glucose_metrics" 전체 경로의
+지연시간(p50/p95)과 tracemalloc 기준 최대 메모리를 비교하고, 두 경로의 결과가 같은지 확인합니다.
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from typing import Any, Dict
+
+from sqlalchemy import create_engine, insert
+
+from app.benchmarks.embedding_backends import _percentile
+
+BENCH_MEMBER_ID = 1
+
+
+def load_cgm_rows(engine, days: int, interval_minutes: int, seed: int = 7) -> int:
+    """벤치마크용 CGM 데이터 적재"""
+    from app.models.database_models import Base, Glucose, GlucoseArchive
+
+    # 기간 조회가 glucose_archive에 보관된 행이 있는지도 확인하므로 보관 테이블도 생성
+    Base.metadata.create_all(bind=engine, tables=[Glucose.__table__, GlucoseArchive.__table__])
+    rng = random.Random(seed)
+    start = datetime(2025, 6, 1)
+    rows = []
+    for minute in range(0, days * 24 * 60, interval_minutes):
+        moment = start + timedelta(minutes=minute)
+        rows.append({
+            "member_id": BENCH_MEMBER_ID,
+            "date": moment.strftime("%Y-%m-%d"),
+            "time": moment.strftime("%H:%M"),
+            "measured_at": moment,
+            "glucose_mg_dl": round(max(40.0, rng.gauss(130, 35)), 1),
+        })
+
+    with engine.begin() as conn:
+        conn.execute(Glucose.__table__.delete().where(Glucose.member_id == BENCH_MEMBER_ID))
+        for offset in range(0, len(rows), 5000):
+            conn.execute(insert(Glucose.__table__), rows[offset:offset + 5000])
+    return len(rows)
+
+
+def _orm_path(start_date: str, end_date: str):
+    from app.database import get_weekly_glucose_data
+    from app.services.glucose_service import calculate_glucose_metrics
+    from app.utils.business import calculate_weekly_glucose_summary, format_glucose_data
+
+    readings = get_weekly_glucose_data(BENCH_MEMBER_ID, start_date, end_date)
+    return calculate_weekly_glucose_summary(readings), calculate_glucose_metrics(format_glucose_data(readings))
+
+
+def _series_path(start_date: str, end_date: str):
+    from app.database import get_weekly_glucose_series
+    from app.services.glucose_service import calculate_glucose_metrics
+    from app.utils.business import calculate_weekly_glucose_summary
+
+    series = get_weekly_glucose_series(BENCH_MEMBER_ID, start_date, end_date)
+    return calculate_weekly_glucose_summary(series), calculate_glucose_metrics(series)
+
+
+def measure(path, start_date: str, end_date: str, repeat: int) -> Dict[str, Any]:
+    """경로별 지연시간/메모리 측정"""
+    path(start_date, end_date)  # 워밍업
+
+    latencies_ms = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        path(start_date, end_date)
+        latencies_ms.append((time.perf_counter() - start) * 1000)
+
+    tracemalloc.start()
+    result = path(start_date, end_date)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "latency_ms": {
+            "p50": round(_percentile(latencies_ms, 50), 2),
+            "p95": round(_percentile(latencies_ms, 95), 2),
+        },
+        "peak_alloc_mb": round(peak / (1024 * 1024), 2),
+        "result": result,
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="혈당 조회 경로 벤치마크")
+    parser.add_argument("--days", type=int, default=90)
+    parser.add_argument("--interval", type=int, default=5, help="측정 간격(분)")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--database-url", default=None, help="기본값: 임시 SQLite 파일")
+    args = parser.parse_args(argv)
+
+    database_url = args.database_url or f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'glucose_bench.db')}"
+    engine = create_engine(database_url)
+    row_count = load_cgm_rows(engine, args.days, args.interval)
+
+    # 데이터 접근 함수들이 벤치마크 DB를 사용하도록 세션 바인딩 변경
+    from app.database import database
+    database.SessionLocal.configure(bind=engine)
+    # 결과 캐시 없이 조회 경로 자체를 비교 (캐시 효과는 app.benchmarks.series_cache)
+    from app.database import glucose_series_cache
+    glucose_series_cache.max_entries = 0
+
+    start_date = "2025-06-01"
+    end_date = (datetime(2025, 6, 1) + timedelta(days=args.days - 1)).strftime("%Y-%m-%d")
+
+    orm = measure(_orm_path, start_date, end_date, args.repeat)
+    series = measure(_series_path, start_date, end_date, args.repeat)
+    results_match = orm.pop("result") == series.pop("result")
+
+    print(json.dumps({
+        "database_url": database_url,
+        "rows": row_count,
+        "orm": orm,
+        "series": series,
+        "speedup_p50": round(orm["latency_ms"]["p50"] / series["latency_ms"]["p50"], 2) if series["latency_ms"]["p50"] else None,
+        "results_match": results_match,
+    }, ensure_ascii=False, indent=2))
+
+    if not results_match:
+        print("[FAIL] ORM 경로와 GlucoseSeries 경로의 결과가 다릅니다", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,194 @@
+"""커넥션 풀 크기 × 워커/스레드 수 스윕 벤치마크
+
+사용법:
+    python -m app.benchmarks.pool_sweep
+    python -m app.benchmarks.pool_sweep --pool-sizes 1,2,4,8,16 --workers 1,2 --threads 4,16,32 \\
+        --requests 200 --hold-ms 5 --database-url mysql+pymysql://user:pw@host/db
+
+워커(프로세스)마다 엔진/풀을 따로 만들고, 각 스레드가 "커넥션 체크아웃 → 주간 혈당 조회 →
+hold-ms 동안 커넥션 유지(네트워크 왕복/후속 쿼리 가정)"를 반복합니다.
+조합별 처리량, 요청 지연(p50/p95), 풀 대기 시간 p95, 타임아웃 수를 출력하고,
+워커/스레드 조합마다 최대 처리량의 95%에 처음 도달하는 풀 크기(knee)를 표시합니다.
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+from sqlalchemy import create_engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from app.benchmarks.embedding_backends import _percentile
+from app.benchmarks.glucose_fetch import BENCH_MEMBER_ID, load_cgm_rows
+
+KNEE_THRESHOLD = 0.95
+BENCH_DAYS = 7
+
+
+def _worker(database_url: str, pool_size: int, threads: int, requests: int, hold_ms: float,
+            pool_timeout: float, results) -> None:
+    """워커 프로세스 하나 - 자체 풀로 threads개 스레드에서 requests번씩 조회"""
+    from app.database.database_utils import _WEEKLY_GLUCOSE_SERIES_QUERY, _period_params
+    from app.database.pool_metrics import TimedQueuePool, instrument_pool
+
+    engine = create_engine(
+        database_url, poolclass=TimedQueuePool, pool_size=pool_size, max_overflow=0, pool_timeout=pool_timeout
+    )
+    telemetry = instrument_pool(engine, f"sweep-{pool_size}")
+    start_date = "2025-06-01"
+    end_date = (datetime(2025, 6, 1) + timedelta(days=BENCH_DAYS - 1)).strftime("%Y-%m-%d")
+    params = _period_params(BENCH_MEMBER_ID, start_date, end_date)
+
+    latencies_ms: List[float] = []
+    timeouts = [0]
+    lock = threading.Lock()
+
+    def run():
+        local = []
+        for _ in range(requests):
+            started = time.perf_counter()
+            try:
+                with engine.connect() as connection:
+                    connection.execute(_WEEKLY_GLUCOSE_SERIES_QUERY, params).all()
+                    time.sleep(hold_ms / 1000)
+            except PoolTimeoutError:
+                with lock:
+                    timeouts[0] += 1
+                continue
+            local.append((time.perf_counter() - started) * 1000)
+        with lock:
+            latencies_ms.extend(local)
+
+    thread_list = [threading.Thread(target=run) for _ in range(threads)]
+    for thread in thread_list:
+        thread.start()
+    for thread in thread_list:
+        thread.join()
+    engine.dispose()
+
+    wait = telemetry.wait_ms
+    results.put({
+        "latencies_ms": latencies_ms,
+        "timeouts": timeouts[0],
+        "wait_p95_bucket_ms": _histogram_percentile(wait.buckets, wait.counts, 95),
+    })
+
+
+def _histogram_percentile(buckets, counts, percentile: float):
+    """히스토그램 버킷 상한 기준 백분위수 (마지막 버킷이면 None = 최대 버킷 초과)"""
+    total = sum(counts)
+    if not total:
+        return 0
+    target = total * percentile / 100
+    running = 0
+    for bound, count in zip(list(buckets) + [None], counts):
+        running += count
+        if running >= target:
+            return bound
+    return None
+
+
+def run_combination(database_url: str, pool_size: int, workers: int, threads: int, requests: int,
+                    hold_ms: float, pool_timeout: float) -> Dict[str, Any]:
+    """풀 크기/워커/스레드 조합 하나 실행"""
+    results = multiprocessing.Queue()
+    processes = [
+        multiprocessing.Process(
+            target=_worker, args=(database_url, pool_size, threads, requests, hold_ms, pool_timeout, results)
+        )
+        for _ in range(workers)
+    ]
+    started = time.perf_counter()
+    for process in processes:
+        process.start()
+    worker_results = [results.get() for _ in processes]
+    for process in processes:
+        process.join()
+    elapsed = time.perf_counter() - started
+
+    latencies = [latency for result in worker_results for latency in result["latencies_ms"]]
+    wait_p95 = [result["wait_p95_bucket_ms"] for result in worker_results]
+    return {
+        "pool_size": pool_size,
+        "workers": workers,
+        "threads": threads,
+        "throughput_rps": round(len(latencies) / elapsed, 1),
+        "latency_ms": {
+            "p50": round(_percentile(latencies, 50), 2) if latencies else None,
+            "p95": round(_percentile(latencies, 95), 2) if latencies else None,
+        },
+        "pool_wait_p95_le_ms": None if None in wait_p95 else max(wait_p95),
+        "timeouts": sum(result["timeouts"] for result in worker_results),
+        "db_connections": pool_size * workers,
+    }
+
+
+def find_knees(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """워커/스레드 조합별로 최대 처리량의 95%에 처음 도달하는 풀 크기"""
+    knees = []
+    for workers, threads in sorted({(row["workers"], row["threads"]) for row in rows}):
+        group = sorted(
+            (row for row in rows if row["workers"] == workers and row["threads"] == threads),
+            key=lambda row: row["pool_size"],
+        )
+        best = max(row["throughput_rps"] for row in group)
+        knee = next(
+            (row for row in group if row["throughput_rps"] >= best * KNEE_THRESHOLD and not row["timeouts"]),
+            group[-1],
+        )
+        knees.append({
+            "workers": workers,
+            "threads": threads,
+            "knee_pool_size": knee["pool_size"],
+            "throughput_rps": knee["throughput_rps"],
+            "max_throughput_rps": best,
+        })
+    return knees
+
+
+def _int_list(value: str) -> List[int]:
+    return [int(item) for item in value.split(",") if item.strip()]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="커넥션 풀 크기 스윕 벤치마크")
+    parser.add_argument("--pool-sizes", type=_int_list, default=[1, 2, 4, 8, 16])
+    parser.add_argument("--workers", type=_int_list, default=[1, 2])
+    parser.add_argument("--threads", type=_int_list, default=[4, 16])
+    parser.add_argument("--requests", type=int, default=50, help="스레드당 요청 수")
+    parser.add_argument("--hold-ms", type=float, default=5, help="조회 후 커넥션을 유지하는 시간")
+    parser.add_argument("--pool-timeout", type=float, default=30)
+    parser.add_argument("--database-url", default=None, help="기본값: 임시 SQLite 파일")
+    args = parser.parse_args(argv)
+
+    database_url = args.database_url or f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'pool_sweep.db')}"
+    load_cgm_rows(create_engine(database_url), BENCH_DAYS, 5)
+
+    rows = []
+    for workers in args.workers:
+        for threads in args.threads:
+            for pool_size in args.pool_sizes:
+                row = run_combination(
+                    database_url, pool_size, workers, threads, args.requests, args.hold_ms, args.pool_timeout
+                )
+                print(json.dumps(row, ensure_ascii=False), file=sys.stderr)
+                rows.append(row)
+
+    print(json.dumps({
+        "database_url": database_url,
+        "hold_ms": args.hold_ms,
+        "results": rows,
+        "knees": find_knees(rows),
+    }, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,195 @@
+"""RAG 검색 벤치마크 및 recall 회귀 검사
+
+사용법:
+    python -m app.benchmarks.rag_retrieval
+    python -m app.benchmarks.rag_retrieval --backends default onnx_int8 --queries 500 --k 3 --min-recall 0.6
+
+1. calculate_glucose_metrics → build_search_query 경로로 실제 서비스와 같은 분포의 쿼리를 생성하고
+   백엔드별 검색 지연시간(p50/p95/p99), QPS(단건/배치), RSS를 측정합니다.
+2. rag_relevance.jsonl(9개 embedding_data 카테고리별 라벨)로 분석 타입별 recall@k를 계산하고
+   한 타입이라도 --min-recall 미만이면 종료 코드 1로 실패합니다.
+단건 검색과 recall은 서비스와 같은 search_for_analysis(카테고리 필터 + 결과가 없을 때 전체 재검색) 경로를
+분석 타입별로 실행하므로, 라우팅 규칙이 관련 카테고리를 가리면 recall 검사에서 드러납니다.
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Tuple
+
+from app.benchmarks.embedding_backends import _current_rss_mb, _percentile
+
+RELEVANCE_FILE = os.path.join(os.path.dirname(__file__), "rag_relevance.jsonl")
+ANALYSIS_TYPES = ("child", "parent")
+# 라벨에 metrics가 없을 때 사용하는 정상 범위 지표 (응급 카테고리가 추가되지 않음)
+IN_RANGE_METRICS = {"max_glucose": 170, "min_glucose": 80}
+
+
+def generate_daily_readings(rng: random.Random, day: datetime, interval_minutes: int = 15) -> List[Dict[str, Any]]:
+    """하루치 CGM 형식 혈당 데이터 생성 (기저 혈당 + 식후 상승 + 노이즈)"""
+    baseline = rng.gauss(115, 20)
+    meal_hours = [rng.uniform(7, 9), rng.uniform(12, 13.5), rng.uniform(18, 19.5)]
+    meal_peaks = [rng.uniform(20, 90) for _ in meal_hours]
+
+    readings = []
+    for minute in range(0, 24 * 60, interval_minutes):
+        hour = minute / 60
+        glucose = baseline
+        for meal_hour, peak in zip(meal_hours, meal_peaks):
+            elapsed = hour - meal_hour
+            if 0 <= elapsed <= 3:
+                glucose += peak * max(0.0, 1 - abs(elapsed - 1) / 2)
+        glucose += rng.gauss(0, 8)
+        readings.append({
+            "time": (day + timedelta(minutes=minute)).strftime("%Y-%m-%dT%H:%M"),
+            "glucose_mg_dl": round(max(40.0, glucose), 1)
+        })
+    return readings
+
+
+def generate_query_distribution(service, count: int, seed: int = 42) -> List[Tuple[str, Dict[str, Any]]]:
+    """generate_rag_enhanced_analysis와 같은 경로로 (검색 쿼리, 혈당 지표) 생성"""
+    from app.services.glucose_service import calculate_glucose_metrics
+
+    rng = random.Random(seed)
+    start_day = datetime(2025, 9, 1)
+    queries = []
+    for i in range(count):
+        readings = generate_daily_readings(rng, start_day + timedelta(days=i % 90))
+        metrics = calculate_glucose_metrics({"cgm_data": {"readings": readings}})
+        queries.append((service.build_search_query(metrics), metrics))
+    return queries
+
+
+def load_relevance_labels(path: str = RELEVANCE_FILE) -> List[Dict[str, Any]]:
+    """라벨링된 관련 문서 목록 로드
+
+    {"query", "category", "relevant": [doc_id, ...], "analysis_types": [...], "metrics": {...}}
+    analysis_types는 쿼리가 나올 수 있는 분석 타입, metrics는 카테고리 필터를 정하는 혈당 지표 (없으면 정상 범위)
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def score_recall(service, labels: List[Dict[str, Any]], k: int, analysis_type: str) -> Dict[str, Any]:
+    """분석 타입의 검색 경로로 recall@k 계산 (전체 평균 + 카테고리별 평균 + 누락 쿼리 + 전체 재검색 횟수)"""
+    per_category: Dict[str, List[float]] = {}
+    misses = []
+    fallbacks = 0
+    for label in labels:
+        if analysis_type not in label.get("analysis_types", ANALYSIS_TYPES):
+            continue
+        documents, _, category_fallback = service.search_for_analysis(
+            label["query"], label.get("metrics", IN_RANGE_METRICS), analysis_type, n_results=k
+        )
+        fallbacks += category_fallback
+        retrieved = {doc.get("id") for doc in documents}
+        relevant = set(label["relevant"])
+        recall = len(retrieved & relevant) / len(relevant)
+        per_category.setdefault(label["category"], []).append(recall)
+        if recall == 0:
+            misses.append(label["query"])
+
+    all_scores = [score for scores in per_category.values() for score in scores]
+    return {
+        f"recall@{k}": round(sum(all_scores) / len(all_scores), 3) if all_scores else 0.0,
+        "by_category": {
+            category: round(sum(scores) / len(scores), 3)
+            for category, scores in sorted(per_category.items())
+        },
+        "zero_recall_queries": misses,
+        "category_fallbacks": fallbacks,
+    }
+
+
+def run_backend(backend: str, query_count: int, k: int, batch_size: int) -> Dict[str, Any]:
+    """단일 백엔드 측정 (별도 프로세스에서 실행)"""
+    from app.services.chroma_rag_service import ChromaRAGService
+
+    rss_before = _current_rss_mb()
+    load_start = time.perf_counter()
+    service = ChromaRAGService(embedding_backend=backend)
+    service._search_relevant_documents("워밍업", n_results=k)
+    load_seconds = time.perf_counter() - load_start
+    rss_after_load = _current_rss_mb()
+
+    queries = generate_query_distribution(service, query_count)
+
+    # 단건 검색 (요청당 1회, 서비스와 같은 카테고리 필터 + 전체 재검색 경로)
+    latency_ms, qps = {}, {}
+    for analysis_type in ANALYSIS_TYPES:
+        latencies_ms = []
+        sequential_start = time.perf_counter()
+        for query, metrics in queries:
+            start = time.perf_counter()
+            service.search_for_analysis(query, metrics, analysis_type, n_results=k)
+            latencies_ms.append((time.perf_counter() - start) * 1000)
+        sequential_seconds = time.perf_counter() - sequential_start
+        latency_ms[analysis_type] = {
+            "p50": round(_percentile(latencies_ms, 50), 3),
+            "p95": round(_percentile(latencies_ms, 95), 3),
+            "p99": round(_percentile(latencies_ms, 99), 3),
+        }
+        qps[f"sequential_{analysis_type}"] = round(len(queries) / sequential_seconds, 1) if sequential_seconds else 0.0
+
+    # 배치 검색 (search_many, 필터 없이 임베딩/검색 처리량만 비교)
+    batch_start = time.perf_counter()
+    for offset in range(0, len(queries), batch_size):
+        chunk = queries[offset:offset + batch_size]
+        service.search_many({i: query for i, (query, _) in enumerate(chunk)}, n_results=k)
+    batch_seconds = time.perf_counter() - batch_start
+    qps[f"batch_{batch_size}"] = round(len(queries) / batch_seconds, 1) if batch_seconds else 0.0
+
+    labels = load_relevance_labels()
+    return {
+        "backend": service.embedding_backend,
+        "queries": len(queries),
+        "unique_queries": len({query for query, _ in queries}),
+        "load_seconds": round(load_seconds, 3),
+        "latency_ms": latency_ms,
+        "qps": qps,
+        "rss_mb": {
+            "before_load": round(rss_before, 1),
+            "after_load": round(rss_after_load, 1),
+            "peak": round(_current_rss_mb(), 1),
+        },
+        "recall": {analysis_type: score_recall(service, labels, k, analysis_type) for analysis_type in ANALYSIS_TYPES},
+    }
+
+
+def _run_isolated(args):
+    return run_backend(*args)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="RAG 검색 벤치마크 및 recall 회귀 검사")
+    parser.add_argument("--backends", nargs="+", default=["default"])
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=3)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--min-recall", type=float, default=0.6, help="이 값 미만의 recall@k는 실패로 처리")
+    args = parser.parse_args(argv)
+
+    context = multiprocessing.get_context("spawn")
+    exit_code = 0
+    for backend in args.backends:
+        with context.Pool(1) as pool:
+            report = pool.apply(_run_isolated, ((backend, args.queries, args.k, args.batch_size),))
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+
+        for analysis_type, scores in report["recall"].items():
+            recall = scores[f"recall@{args.k}"]
+            if recall < args.min_recall:
+                print(f"[FAIL] {backend} {analysis_type} recall@{args.k} {recall:.3f} < {args.min_recall}", file=sys.stderr)
+                exit_code = 1
+
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
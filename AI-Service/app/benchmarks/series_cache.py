@@ -0,0 +1,171 @@
+"""기간 혈당 시계열 결과 캐시 벤치마크 (반복 리포트 조회)
+
+사용법:
+    python -m app.benchmarks.series_cache
+    python -m app.benchmarks.series_cache --days 90 --interval 5 --window 7 --repeat 50 --database-url sqlite:////tmp/series_cache.db
+
+회원 1명의 CGM 데이터를 적재한 뒤 같은 기간의 get_weekly_glucose_series를 반복 호출해
+지연시간(p50/p95)을 비교합니다.
+    uncached  캐시 사용 안 함 (범위 스캔 + 시계열 변환)
+    miss      매번 캐시를 비운 상태 (버전 쿼리 + 범위 스캔 + 저장)
+    hit       같은 기간 반복 조회 (버전 쿼리만)
+정확성도 함께 확인합니다.
+    - 적재 이벤트로 무효화된 뒤에는 새 측정값이 보이는지
+    - 적재 훅도 updated_at 갱신도 거치지 않은 직접 UPDATE(다른 서비스의 쓰기와 같은 상황)를
+      버전 비교로 감지하는지 (값 변경, 시간만 바뀐 수정, 두 행의 값 맞바꿈)
+    - TTL이 지난 항목은 버전이 같아도 다시 읽는지
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict
+
+from sqlalchemy import create_engine, select, update
+
+from app.benchmarks.embedding_backends import _percentile
+from app.benchmarks.glucose_fetch import BENCH_MEMBER_ID, load_cgm_rows
+
+
+def measure(call: Callable[[], Any], repeat: int, before: Callable[[], None] = None) -> Dict[str, float]:
+    """반복 호출 지연시간 (before는 매 호출 전에 실행하며 측정에서 제외)"""
+    call()  # 워밍업
+    latencies_ms = []
+    for _ in range(repeat):
+        if before is not None:
+            before()
+        started = time.perf_counter()
+        call()
+        latencies_ms.append((time.perf_counter() - started) * 1000)
+    return {
+        "p50": round(_percentile(latencies_ms, 50), 3),
+        "p95": round(_percentile(latencies_ms, 95), 3),
+    }
+
+
+def _same(left, right) -> bool:
+    return len(left) == len(right) and bool((left.timestamps == right.timestamps).all()) \
+        and bool((left.values == right.values).all())
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="혈당 시계열 결과 캐시 벤치마크")
+    parser.add_argument("--days", type=int, default=90)
+    parser.add_argument("--interval", type=int, default=5, help="측정 간격(분)")
+    parser.add_argument("--window", type=int, default=7, help="조회 기간(일)")
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--database-url", default=None, help="기본값: 임시 SQLite 파일")
+    args = parser.parse_args(argv)
+
+    database_url = args.database_url or f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'series_cache.db')}"
+    engine = create_engine(database_url)
+    from app.models.database_models import Base, Glucose
+    Base.metadata.create_all(bind=engine)
+    row_count = load_cgm_rows(engine, args.days, args.interval)
+
+    # 데이터 접근 함수들이 벤치마크 DB를 사용하도록 세션 바인딩 변경
+    from app.database import database, get_weekly_glucose_series, glucose_series_cache, ingest_glucose_readings
+    from app.services.ingestion_events import GlucoseIngestedEvent, emit_glucose_ingested
+    database.SessionLocal.configure(bind=engine)
+
+    start = datetime(2025, 6, 1) + timedelta(days=args.days - args.window)
+    start_date = start.strftime("%Y-%m-%d")
+    end_date = (start + timedelta(days=args.window - 1)).strftime("%Y-%m-%d")
+
+    def fetch():
+        return get_weekly_glucose_series(BENCH_MEMBER_ID, start_date, end_date)
+
+    max_entries = glucose_series_cache.max_entries
+    glucose_series_cache.max_entries = 0
+    uncached = measure(fetch, args.repeat)
+    baseline = fetch()
+    glucose_series_cache.max_entries = max_entries or 512
+    miss = measure(fetch, args.repeat, before=glucose_series_cache.clear)
+    glucose_series_cache.clear()
+    hit = measure(fetch, args.repeat)
+
+    checks = {"hit_matches_uncached": _same(fetch(), baseline)}
+
+    # 적재 이벤트 → 무효화 → 새 측정값 반영
+    result = ingest_glucose_readings(BENCH_MEMBER_ID, [{"date": end_date, "time": "23:58", "glucose_mg_dl": 222.0}])
+    emit_glucose_ingested(GlucoseIngestedEvent(BENCH_MEMBER_ID, result.dates, result.inserted, result.updated))
+    checks["ingest_visible"] = len(fetch()) == len(baseline) + 1
+
+    def direct_update(connection, row_id: int, **values):
+        # updated_at을 그대로 두어 onupdate가 적용되지 않게 함
+        connection.execute(
+            update(Glucose.__table__).where(Glucose.id == row_id).values(updated_at=Glucose.updated_at, **values)
+        )
+
+    def fresh():
+        max_entries = glucose_series_cache.max_entries
+        glucose_series_cache.max_entries = 0
+        try:
+            return fetch()
+        finally:
+            glucose_series_cache.max_entries = max_entries
+
+    def detected() -> bool:
+        """캐시된 버전이 낡은 것으로 판정되고 결과가 캐시 없이 읽은 값과 같은지"""
+        stale_before = glucose_series_cache.stats()["stale"]
+        series = fetch()
+        return glucose_series_cache.stats()["stale"] == stale_before + 1 and _same(series, fresh())
+
+    with engine.connect() as connection:
+        day_rows = connection.execute(
+            select(Glucose.id, Glucose.glucose_mg_dl)
+            .where(Glucose.member_id == BENCH_MEMBER_ID, Glucose.date == end_date)
+            .order_by(Glucose.measured_at.asc())
+        ).all()
+    (late_id, _), (first_id, first_value) = day_rows[-1], day_rows[0]
+    second_id, second_value = next((row_id, value) for row_id, value in day_rows[1:] if value != first_value)
+
+    # 적재 훅을 거치지 않은 값 변경 → 버전 변경으로 감지
+    with engine.begin() as connection:
+        direct_update(connection, late_id, glucose_mg_dl=111.0)
+    checks["direct_update_detected"] = detected()
+
+    # 시간만 바뀐 수정 (건수/혈당 합계는 그대로)
+    with engine.begin() as connection:
+        direct_update(connection, late_id, time="23:59",
+                      measured_at=datetime.strptime(f"{end_date} 23:59", "%Y-%m-%d %H:%M"))
+    checks["time_only_edit_detected"] = detected()
+
+    # 두 행의 값 맞바꿈 (건수/혈당 합계는 그대로)
+    with engine.begin() as connection:
+        direct_update(connection, first_id, glucose_mg_dl=second_value)
+        direct_update(connection, second_id, glucose_mg_dl=first_value)
+    checks["value_swap_detected"] = detected()
+
+    # 버전이 같아도 TTL이 지나면 다시 읽음
+    ttl_seconds = glucose_series_cache.ttl_seconds
+    glucose_series_cache.ttl_seconds = 0
+    glucose_series_cache.clear()
+    fetch()
+    expired_before = glucose_series_cache.stats()["expired"]
+    checks["ttl_expiry"] = _same(fetch(), fetch()) and glucose_series_cache.stats()["expired"] > expired_before
+    glucose_series_cache.ttl_seconds = ttl_seconds
+
+    print(json.dumps({
+        "database_url": database_url,
+        "rows": row_count,
+        "window": [start_date, end_date],
+        "window_rows": len(baseline),
+        "latency_ms": {"uncached": uncached, "miss": miss, "hit": hit},
+        "speedup_hit_vs_uncached_p50": round(uncached["p50"] / hit["p50"], 2) if hit["p50"] else None,
+        "checks": checks,
+        "cache": glucose_series_cache.stats(),
+    }, ensure_ascii=False, indent=2))
+
+    if not all(checks.values()):
+        print(f"[FAIL] 캐시 정확성 검사 실패: {checks}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,115 @@
+"""워커 부팅 시간 벤치마크 (DB_INIT_ON_BOOT 모드별)
+
+사용법:
+    python -m app.benchmarks.startup
+    python -m app.benchmarks.startup --modes off,check,create --runs 5 --database-url mysql+pymysql://user:pw@host/db
+
+모드마다 새 파이썬 프로세스를 띄워 "app import → create_app() → 첫 DB 쿼리" 구간을 재고
+(프로세스 기동 자체는 제외), 반복 실행의 중앙값/최댓값을 출력합니다.
+off 모드는 DB 왕복이 첫 쿼리로 밀리므로 boot_ms와 first_query_ms를 함께 봐야 합니다.
+--import-profile을 주면 -X importtime으로 패키지별 import 시간 상위 목록도 출력합니다.
+--database-url은 하위 프로세스의 DATABASE_URL 환경 변수로 전달됩니다.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+from typing import Any, Dict, List
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+CHILD_SCRIPT = """
+import json, time
+started = time.perf_counter()
+from app import create_app
+imported = time.perf_counter()
+create_app()
+booted = time.perf_counter()
+from app.database import engine
+with engine.connect() as connection:
+    connection.exec_driver_sql("SELECT 1").fetchone()
+first_query = time.perf_counter()
+print(json.dumps({
+    "import_ms": (imported - started) * 1000,
+    "create_app_ms": (booted - imported) * 1000,
+    "boot_ms": (booted - started) * 1000,
+    "first_query_ms": (first_query - booted) * 1000,
+}))
+"""
+
+
+def _child_env(mode: str, database_url: str = None) -> Dict[str, str]:
+    env = dict(os.environ, DB_INIT_ON_BOOT=mode)
+    if database_url:
+        env["DATABASE_URL"] = database_url
+    return env
+
+
+def measure_boot(mode: str, database_url: str = None) -> Dict[str, float]:
+    """새 프로세스에서 부팅 구간 한 번 측정"""
+    result = subprocess.run(
+        [sys.executable, "-c", CHILD_SCRIPT], cwd=PROJECT_ROOT, env=_child_env(mode, database_url),
+        capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def summarize(samples: List[Dict[str, float]]) -> Dict[str, Dict[str, float]]:
+    """구간별 중앙값/최댓값"""
+    return {
+        key: {
+            "median": round(statistics.median(sample[key] for sample in samples), 1),
+            "max": round(max(sample[key] for sample in samples), 1),
+        }
+        for key in samples[0]
+    }
+
+
+def import_profile(top: int = 15, database_url: str = None) -> List[Dict[str, Any]]:
+    """-X importtime 결과를 최상위 패키지별 self 시간 합계로 집계"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "from app import create_app"],
+        cwd=PROJECT_ROOT, env=_child_env("off", database_url), capture_output=True, text=True, check=True
+    )
+    totals = defaultdict(int)
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|")
+        totals[name.strip().split(".")[0]] += int(self_us)
+    ranked = sorted(totals.items(), key=lambda item: item[1], reverse=True)[:top]
+    return [{"package": package, "self_ms": round(self_us / 1000, 1)} for package, self_us in ranked]
+
+
+def _str_list(value: str) -> List[str]:
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="워커 부팅 시간 벤치마크")
+    parser.add_argument("--modes", type=_str_list, default=["off", "check", "create"])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--database-url", default=None)
+    parser.add_argument("--import-profile", action="store_true", help="패키지별 import 시간 상위 목록 출력")
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args(argv)
+
+    report: Dict[str, Any] = {"runs": args.runs, "modes": {}}
+    for mode in args.modes:
+        samples = [measure_boot(mode, args.database_url) for _ in range(args.runs)]
+        report["modes"][mode] = summarize(samples)
+        print(json.dumps({"mode": mode, **report["modes"][mode]}, ensure_ascii=False), file=sys.stderr)
+
+    if args.import_profile:
+        report["import_profile"] = import_profile(args.top, args.database_url)
+
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,218 @@
+"""핫 조회 쿼리의 호출당 CPU 시간 벤치마크 (Query API vs select() vs lambda_stmt vs 미리 만든 문장)
+
+사용법:
+    python -m app.benchmarks.statement_cache
+    python -m app.benchmarks.statement_cache --calls 5000 --database-url sqlite:////tmp/statement_cache.db
+
+합성 회원 데이터를 적재한 뒤 쿼리 모양별로 네 가지 방식을 같은 세션 사용 패턴(호출마다 세션 생성)으로
+반복 실행해 time.process_time 기준 호출당 CPU 시간(µs)을 비교합니다.
+    query_api   변경 전 코드 (db.query(...) 체인을 매번 구성)
+    select      select()를 매번 구성 (컴파일 결과는 캐시되지만 구성/캐시 키 계산은 매번)
+    lambda_stmt 구성/캐시 키 계산은 한 번이지만 실행마다 문장을 복제해 바인드 값을 다시 심음
+    prepared    현재 database_utils / jwt_auth 구현 (*_QUERY 문장을 한 번 만들고 bindparam 값만 전달)
+각 방식의 결과가 같은지도 확인합니다.
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Dict
+
+from sqlalchemy import create_engine, insert, lambda_stmt, select, type_coerce, String
+from sqlalchemy.orm import Session
+
+from app.benchmarks.synthetic_cgm import SYNTHETIC_MEMBER_ID_BASE, load_synthetic_dataset
+
+BENCH_DAYS = 7
+BENCH_MEMBER_ID = SYNTHETIC_MEMBER_ID_BASE
+
+
+def _variants(start_date: str, end_date: str) -> Dict[str, Dict[str, Callable[[Session], Any]]]:
+    """쿼리 모양별 {방식: 세션을 받아 결과를 돌려주는 함수}"""
+    from app.database.database_utils import (
+        _GLUCOSE_DAY_QUERY, _MEMBER_INFO_QUERY, _QUESTS_BY_DATE_QUERY, _WEEKLY_GLUCOSE_SERIES_QUERY,
+        _day_params, _period_params, day_bounds, period_bounds
+    )
+    from app.models.database_models import Glucose, Member, Quest
+    from app.utils.auth.jwt_auth import _MEMBER_BY_CODE_QUERY
+
+    member_id = BENCH_MEMBER_ID
+    code = f"SYN{member_id}"
+    day_start, day_end = day_bounds(end_date)
+    period_start, period_end = period_bounds(start_date, end_date)
+
+    def member_columns(member):
+        return (member.birth, member.diabetes_type, member.gender, member.height, member.weight)
+
+    def glucose_columns(rows):
+        return [(row.id, row.date, row.time, row.glucose_mg_dl) for row in rows]
+
+    def quest_columns(rows):
+        return [(row.id, row.quest_title, row.is_completed) for row in rows]
+
+    return {
+        "member_by_id": {
+            "query_api": lambda db: member_columns(db.query(Member).filter(Member.member_id == member_id).first()),
+            "select": lambda db: member_columns(db.execute(select(
+                Member.birth, Member.diabetes_type, Member.gender, Member.height, Member.weight
+            ).where(Member.member_id == member_id)).first()),
+            "lambda_stmt": lambda db: member_columns(db.execute(lambda_stmt(lambda: select(
+                Member.birth, Member.diabetes_type, Member.gender, Member.height, Member.weight
+            ).where(Member.member_id == member_id))).first()),
+            "prepared": lambda db: member_columns(db.execute(_MEMBER_INFO_QUERY, {"member_id": member_id}).first()),
+        },
+        "member_by_code": {
+            "query_api": lambda db: db.query(Member).filter(Member.code == code).first().member_id,
+            "select": lambda db: db.execute(select(Member).where(Member.code == code)).scalars().first().member_id,
+            "lambda_stmt": lambda db: db.execute(
+                lambda_stmt(lambda: select(Member).where(Member.code == code))
+            ).scalars().first().member_id,
+            "prepared": lambda db: db.execute(_MEMBER_BY_CODE_QUERY, {"code": code}).scalars().first().member_id,
+        },
+        "glucose_by_day": {
+            "query_api": lambda db: glucose_columns(
+                db.query(Glucose)
+                .filter(Glucose.member_id == member_id, Glucose.measured_at >= day_start, Glucose.measured_at < day_end)
+                .order_by(Glucose.measured_at.asc()).all()
+            ),
+            "select": lambda db: glucose_columns(db.execute(
+                select(Glucose.id, Glucose.date, Glucose.time, Glucose.glucose_mg_dl, Glucose.measured_at)
+                .where(Glucose.member_id == member_id, Glucose.measured_at >= day_start, Glucose.measured_at < day_end)
+                .order_by(Glucose.measured_at.asc())
+            ).all()),
+            "lambda_stmt": lambda db: glucose_columns(db.execute(lambda_stmt(lambda: select(
+                Glucose.id, Glucose.date, Glucose.time, Glucose.glucose_mg_dl, Glucose.measured_at
+            ).where(
+                Glucose.member_id == member_id, Glucose.measured_at >= day_start, Glucose.measured_at < day_end
+            ).order_by(Glucose.measured_at.asc()))).all()),
+            "prepared": lambda db: glucose_columns(
+                db.execute(_GLUCOSE_DAY_QUERY, _day_params(member_id, end_date)).all()
+            ),
+        },
+        "quests_by_day": {
+            "query_api": lambda db: quest_columns(
+                db.query(Quest).filter(Quest.member_id == member_id, Quest.quest_date == end_date)
+                .order_by(Quest.created_at.asc()).all()
+            ),
+            "select": lambda db: quest_columns(db.execute(
+                select(Quest.id, Quest.quest_title, Quest.quest_content, Quest.is_completed, Quest.approval_status)
+                .where(Quest.member_id == member_id, Quest.quest_date == end_date)
+                .order_by(Quest.created_at.asc())
+            ).all()),
+            "lambda_stmt": lambda db: quest_columns(db.execute(lambda_stmt(lambda: select(
+                Quest.id, Quest.quest_title, Quest.quest_content, Quest.is_completed, Quest.approval_status
+            ).where(
+                Quest.member_id == member_id, Quest.quest_date == end_date
+            ).order_by(Quest.created_at.asc()))).all()),
+            "prepared": lambda db: quest_columns(
+                db.execute(_QUESTS_BY_DATE_QUERY, {"member_id": member_id, "quest_date": end_date}).all()
+            ),
+        },
+        "weekly_series": {
+            "query_api": lambda db: [
+                (row.measured_at.isoformat(sep=" "), row.glucose_mg_dl)
+                for row in db.query(Glucose)
+                .filter(Glucose.member_id == member_id, Glucose.measured_at >= period_start,
+                        Glucose.measured_at < period_end)
+                .order_by(Glucose.measured_at.asc()).all()
+            ],
+            "select": lambda db: [tuple(row) for row in db.execute(
+                select(type_coerce(Glucose.measured_at, String), Glucose.glucose_mg_dl)
+                .where(Glucose.member_id == member_id, Glucose.measured_at >= period_start,
+                       Glucose.measured_at < period_end)
+                .order_by(Glucose.measured_at.asc())
+            )],
+            "lambda_stmt": lambda db: [tuple(row) for row in db.execute(lambda_stmt(lambda: select(
+                type_coerce(Glucose.measured_at, String), Glucose.glucose_mg_dl
+            ).where(
+                Glucose.member_id == member_id, Glucose.measured_at >= period_start, Glucose.measured_at < period_end
+            ).order_by(Glucose.measured_at.asc())))],
+            "prepared": lambda db: [tuple(row) for row in db.execute(
+                _WEEKLY_GLUCOSE_SERIES_QUERY, _period_params(member_id, start_date, end_date)
+            )],
+        },
+    }
+
+
+def _normalize(value):
+    """방식 간 결과 비교용 (시각 표기 차이 제거)"""
+    if isinstance(value, list):
+        return [_normalize(item) for item in value]
+    if isinstance(value, tuple):
+        return tuple(_normalize(item) for item in value)
+    if isinstance(value, str) and len(value) >= 19 and value[10] == " ":
+        return value[:19]
+    return value
+
+
+def measure(engine, func: Callable[[Session], Any], calls: int, warmup: int = 50) -> float:
+    """호출당 CPU 시간(µs) - 호출마다 세션을 열고 닫음 (session_scope와 같은 패턴)"""
+    for _ in range(warmup):
+        with Session(engine) as db:
+            func(db)
+    started = time.process_time()
+    for _ in range(calls):
+        with Session(engine) as db:
+            func(db)
+    return (time.process_time() - started) / calls * 1_000_000
+
+
+def _load_quests(engine, end_date: str, count: int = 4):
+    from app.models.database_models import Base, Quest
+
+    Base.metadata.create_all(bind=engine, tables=[Quest.__table__])
+    now = datetime.utcnow()
+    with engine.begin() as connection:
+        connection.execute(insert(Quest.__table__), [
+            {
+                "member_id": BENCH_MEMBER_ID, "quest_type": "RECORD", "quest_title": f"퀘스트 {index}",
+                "quest_content": "벤치마크", "quest_date": end_date, "is_completed": index % 2 == 0,
+                "approval_status": "pending", "created_at": now, "updated_at": now,
+            }
+            for index in range(count)
+        ])
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="핫 조회 쿼리 호출당 CPU 시간 벤치마크")
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--interval", type=int, default=60, help="합성 CGM 측정 간격(분), 작을수록 행 수 증가")
+    parser.add_argument("--database-url", default=None, help="기본값: 임시 SQLite 파일")
+    args = parser.parse_args(argv)
+
+    database_url = args.database_url or f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'statement_cache.db')}"
+    engine = create_engine(database_url)
+    start = date.today() - timedelta(days=BENCH_DAYS)
+    load_synthetic_dataset(engine, members=3, days=BENCH_DAYS, start_date=start, interval_minutes=args.interval)
+    start_date = start.strftime("%Y-%m-%d")
+    end_date = (start + timedelta(days=BENCH_DAYS - 1)).strftime("%Y-%m-%d")
+    _load_quests(engine, end_date)
+
+    results = []
+    for shape, variants in _variants(start_date, end_date).items():
+        outputs = {}
+        with Session(engine) as db:
+            for name, func in variants.items():
+                outputs[name] = _normalize(func(db))
+        row = {"query": shape, "same_result": len({repr(output) for output in outputs.values()}) == 1}
+        for name, func in variants.items():
+            row[f"{name}_us"] = round(measure(engine, func, args.calls), 1)
+        row["speedup_vs_query_api"] = round(row["query_api_us"] / row["prepared_us"], 2)
+        print(json.dumps(row, ensure_ascii=False), file=sys.stderr)
+        results.append(row)
+
+    print(json.dumps({
+        "database_url": database_url,
+        "calls": args.calls,
+        "interval_minutes": args.interval,
+        "results": results,
+    }, ensure_ascii=False, indent=2))
+    return 0 if all(row["same_result"] for row in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
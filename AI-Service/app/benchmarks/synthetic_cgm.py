@@ -0,0 +1,293 @@
+"""합성 CGM 데이터 생성기 및 벤치마크용 DB 적재
+
+사용법:
+    python -m app.benchmarks.synthetic_cgm --members 10 --days 30
+    python -m app.benchmarks.synthetic_cgm --members 100 --days 365 --database-url sqlite:////tmp/cgm_10m.db
+    python -m app.benchmarks.synthetic_cgm --members 5 --days 14 --database-url mysql+pymysql://user:pw@host/db --no-replace
+
+회원 N명 × D일의 5분 간격 혈당(기본 288건/일)과 식사/운동 기록을 만들어 기존 모델 테이블에 일괄 적재합니다.
+혈당은 회원별 기저 혈당 + 새벽 현상 + 식사 반응(탄수화물 양 × 민감도) + 운동 후 하강 +
+예고 없는 스파이크/야간 저혈당 + 센서 잡음으로 구성되며, 같은 --seed면 항상 같은 데이터가 만들어집니다.
+1k(--members 1 --days 4)부터 10M(--members 100 --days 348) 건까지 같은 방식으로 만들 수 있습니다.
+기본적으로 같은 합성 회원의 기존 데이터를 지우고 다시 적재하며, --no-replace면 이미 있을 때 적재하지 않고 종료합니다.
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterator, List, NamedTuple, Tuple
+
+import numpy as np
+from sqlalchemy import create_engine, delete, event, func, insert, select
+
+from app.models.database_models import (
+    EXERCISE_ASSUMED_TIME, Base, Exercise, Food, Glucose, Member, combine_date_time
+)
+
+# 합성 회원 ID 시작값 (실제 회원과 겹치지 않도록 큰 값 사용)
+SYNTHETIC_MEMBER_ID_BASE = 900000
+DEFAULT_BATCH_SIZE = 20000
+
+# (식사 종류, 평균 시각(분), 시각 편차(분), 탄수화물 범위(g), 메뉴)
+MEALS = (
+    ("breakfast", 7 * 60 + 30, 25, (30, 60), ("토스트와 우유", "김밥", "시리얼", "계란밥")),
+    ("lunch", 12 * 60 + 20, 15, (50, 90), ("급식", "비빔밥", "짜장면", "돈가스")),
+    ("snack", 15 * 60 + 30, 40, (15, 35), ("과자", "아이스크림", "과일", "떡볶이")),
+    ("dinner", 18 * 60 + 40, 30, (50, 85), ("김치찌개와 밥", "불고기", "치킨", "카레라이스")),
+)
+SNACK_PROBABILITY = 0.5
+EXERCISES = ("줄넘기", "축구", "자전거", "수영", "걷기", "태권도")
+EXERCISE_PROBABILITY = 0.4
+SPIKE_PROBABILITY = 0.3
+NOCTURNAL_HYPO_PROBABILITY = 0.08
+
+
+class MemberProfile(NamedTuple):
+    """회원별 혈당 특성"""
+    member_id: int
+    baseline: float        # 공복 기저 혈당 (mg/dL)
+    carb_sensitivity: float  # 탄수화물 1g당 최대 상승폭 (mg/dL)
+    noise_sd: float        # 센서 잡음 표준편차
+    diabetes_type: str
+
+
+def _response_curve(minutes: np.ndarray, start: float, peak_after: float, amplitude: float) -> np.ndarray:
+    """start 시각 이후 peak_after분에 최대값 amplitude에 도달했다 감소하는 반응 곡선 (감마 형태)"""
+    elapsed = (minutes - start) / peak_after
+    curve = np.where(elapsed > 0, elapsed * np.exp(1 - elapsed), 0.0)
+    return amplitude * curve
+
+
+def make_profile(rng: np.random.Generator, member_id: int) -> MemberProfile:
+    diabetes_type = "TYPE1" if rng.random() < 0.7 else "TYPE2"
+    return MemberProfile(
+        member_id=member_id,
+        baseline=float(rng.uniform(95, 140)),
+        carb_sensitivity=float(rng.uniform(1.2, 3.0)),
+        noise_sd=float(rng.uniform(2.0, 6.0)),
+        diabetes_type=diabetes_type,
+    )
+
+
+def generate_member_day(rng: np.random.Generator, profile: MemberProfile, day: date, interval_minutes: int
+                        ) -> Tuple[np.ndarray, np.ndarray, List[Dict], List[Dict]]:
+    """회원 하루치 (측정 분, 혈당값, 음식 행, 운동 행) 생성"""
+    minutes = np.arange(0, 24 * 60, interval_minutes, dtype=np.float64)
+    glucose = np.full(minutes.shape, profile.baseline + rng.normal(0, 5))
+
+    # 새벽 현상 (04~08시 완만한 상승)
+    glucose += 15 * np.exp(-((minutes - 6 * 60) / 90) ** 2)
+
+    day_str = day.strftime("%Y-%m-%d")
+    foods = []
+    for meal_type, mean_minute, spread, (carbs_low, carbs_high), menu in MEALS:
+        if meal_type == "snack" and rng.random() > SNACK_PROBABILITY:
+            continue
+        start = float(np.clip(rng.normal(mean_minute, spread), 0, 24 * 60 - 30))
+        carbs = float(rng.uniform(carbs_low, carbs_high))
+        glucose += _response_curve(minutes, start, rng.uniform(40, 60), carbs * profile.carb_sensitivity)
+        # 인슐린 과보정으로 인한 식후 늦은 하강
+        glucose -= _response_curve(minutes, start + 120, 60, carbs * profile.carb_sensitivity * 0.25)
+        hour, minute = divmod(int(start), 60)
+        foods.append({
+            "name": str(rng.choice(menu)),
+            "type": meal_type,
+            "carbs": round(carbs, 1),
+            "calories": round(carbs * 4 * rng.uniform(1.4, 1.9), 0),
+            "date": day_str,
+            "time": f"{hour:02d}:{minute:02d}",
+        })
+
+    exercises = []
+    if rng.random() < EXERCISE_PROBABILITY:
+        # 분석 로직이 운동 시각을 EXERCISE_ASSUMED_TIME으로 가정하므로 같은 시각에 시작
+        start_at = combine_date_time(day_str, EXERCISE_ASSUMED_TIME)
+        start = start_at.hour * 60 + start_at.minute
+        duration = int(rng.choice([20, 30, 40, 60]))
+        glucose -= _response_curve(minutes, start, duration + 30, duration * rng.uniform(0.6, 1.0))
+        exercises.append({
+            "exercise_name": str(rng.choice(EXERCISES)),
+            "exercise_duration": duration,
+            "exercise_date": day_str,
+            "created_at": start_at,
+        })
+
+    if rng.random() < SPIKE_PROBABILITY:
+        glucose += _response_curve(minutes, rng.uniform(9 * 60, 21 * 60), 30, rng.uniform(30, 80))
+    if profile.diabetes_type == "TYPE1" and rng.random() < NOCTURNAL_HYPO_PROBABILITY:
+        glucose -= _response_curve(minutes, rng.uniform(60, 4 * 60), 60, rng.uniform(40, 70))
+
+    # 센서 잡음 (지수 커널로 평활화해 이웃 측정값끼리 상관되도록)
+    kernel = np.exp(-np.arange(6) / 2.0)
+    noise = np.convolve(rng.normal(0, 1, minutes.size + kernel.size), kernel, mode="valid")[:minutes.size]
+    glucose += noise * profile.noise_sd / np.sqrt((kernel ** 2).sum())
+
+    return minutes, np.round(np.clip(glucose, 40, 400), 1), foods, exercises
+
+
+def generate_rows(members: int, days: int, start_date: date, interval_minutes: int = 5, seed: int = 42,
+                  member_id_base: int = SYNTHETIC_MEMBER_ID_BASE) -> Iterator[Tuple[str, List[Dict]]]:
+    """(테이블 종류, 행 목록)을 회원-일 단위로 생성 (같은 seed면 같은 결과)"""
+    now = datetime.now()
+    # 측정 시각 문자열/오프셋은 모든 날이 같으므로 한 번만 계산
+    day_minutes = list(range(0, 24 * 60, interval_minutes))
+    day_times = [f"{minute // 60:02d}:{minute % 60:02d}" for minute in day_minutes]
+    day_offsets = [timedelta(minutes=minute) for minute in day_minutes]
+    for index in range(members):
+        rng = np.random.default_rng([seed, index])
+        profile = make_profile(rng, member_id_base + index)
+        birth = date(now.year - int(rng.integers(7, 15)), int(rng.integers(1, 13)), int(rng.integers(1, 29)))
+        yield "member", [{
+            "member_id": profile.member_id,
+            "username": f"synthetic_{index}",
+            "email": f"synthetic_{profile.member_id}@example.com",
+            "password": "synthetic",
+            "birth": birth,
+            "gender": "M" if index % 2 == 0 else "F",
+            "height": round(float(rng.uniform(120, 165)), 1),
+            "weight": round(float(rng.uniform(22, 60)), 1),
+            "diabetes_type": profile.diabetes_type,
+            "sensor": "synthetic",
+            "code": f"SYN{profile.member_id}",
+            "status": "active",
+            "created_at": now,
+            "modified_at": now,
+        }]
+
+        for offset in range(days):
+            day = start_date + timedelta(days=offset)
+            _, values, foods, exercises = generate_member_day(rng, profile, day, interval_minutes)
+            day_start = datetime(day.year, day.month, day.day)
+            day_str = day.strftime("%Y-%m-%d")
+            glucose_rows = []
+            for time_str, time_offset, value in zip(day_times, day_offsets, values.tolist()):
+                measured_at = day_start + time_offset
+                glucose_rows.append({
+                    "member_id": profile.member_id,
+                    "date": day_str,
+                    "time": time_str,
+                    "measured_at": measured_at,
+                    "glucose_mg_dl": value,
+                    "created_at": measured_at,
+                    "updated_at": measured_at,
+                })
+            yield "glucose", glucose_rows
+            # Core insert는 ORM 이벤트를 거치지 않으므로 measured_at을 직접 채움
+            yield "food", [
+                dict(food, member_id=profile.member_id, measured_at=combine_date_time(food["date"], food["time"]))
+                for food in foods
+            ]
+            yield "exercise", [
+                dict(exercise, member_id=profile.member_id,
+                     measured_at=combine_date_time(exercise["exercise_date"], EXERCISE_ASSUMED_TIME))
+                for exercise in exercises
+            ]
+
+
+TABLES = {"member": Member.__table__, "glucose": Glucose.__table__, "food": Food.__table__, "exercise": Exercise.__table__}
+
+
+def load_synthetic_dataset(engine, members: int, days: int, start_date: date, interval_minutes: int = 5,
+                           seed: int = 42, batch_size: int = DEFAULT_BATCH_SIZE, replace: bool = True) -> Dict[str, int]:
+    """합성 데이터를 engine의 DB에 일괄 적재하고 테이블별 행 수 반환
+
+    replace=False인데 같은 합성 회원이 이미 있으면 ValueError
+    """
+    Base.metadata.create_all(bind=engine, tables=list(TABLES.values()))
+    member_ids = [SYNTHETIC_MEMBER_ID_BASE + index for index in range(members)]
+
+    if engine.dialect.name == "sqlite":
+        # 적재 전용 설정 (벤치마크 DB이므로 내구성보다 적재 속도 우선)
+        @event.listens_for(engine, "connect")
+        def _fast_sqlite(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=OFF")
+            cursor.close()
+        engine.dispose()
+
+    if replace:
+        with engine.begin() as connection:
+            for name in ("glucose", "food", "exercise", "member"):
+                connection.execute(delete(TABLES[name]).where(TABLES[name].c.member_id.in_(member_ids)))
+    else:
+        with engine.connect() as connection:
+            existing = connection.execute(
+                select(func.count()).select_from(TABLES["member"]).where(TABLES["member"].c.member_id.in_(member_ids))
+            ).scalar()
+        if existing:
+            raise ValueError(
+                f"합성 회원 {existing}명이 이미 적재되어 있습니다 "
+                f"(member_id {member_ids[0]}~{member_ids[-1]}). --no-replace 없이 실행하면 지우고 다시 적재합니다."
+            )
+
+    counts = {name: 0 for name in TABLES}
+    pending = {name: [] for name in TABLES}
+
+    def flush(connection, name):
+        if pending[name]:
+            connection.execute(insert(TABLES[name]), pending[name])
+            counts[name] += len(pending[name])
+            pending[name] = []
+
+    with engine.begin() as connection:
+        for name, rows in generate_rows(members, days, start_date, interval_minutes, seed):
+            pending[name].extend(rows)
+            if name == "member":
+                flush(connection, name)  # 외래 키(exercise.member_id) 때문에 회원을 먼저 적재
+            elif len(pending[name]) >= batch_size:
+                flush(connection, name)
+        for name in TABLES:
+            flush(connection, name)
+
+    return counts
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="합성 CGM 데이터 생성 및 적재")
+    parser.add_argument("--members", type=int, default=10)
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--start-date", default=None, help="기본값: 오늘 - days")
+    parser.add_argument("--interval", type=int, default=5, help="측정 간격(분)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument("--database-url", default=None, help="기본값: 임시 SQLite 파일")
+    parser.add_argument("--no-replace", dest="replace", action="store_false",
+                        help="같은 합성 회원의 기존 데이터를 지우지 않음 (이미 있으면 적재하지 않고 종료)")
+    args = parser.parse_args(argv)
+
+    database_url = args.database_url or f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'synthetic_cgm.db')}"
+    start_date = (
+        datetime.strptime(args.start_date, "%Y-%m-%d").date() if args.start_date
+        else date.today() - timedelta(days=args.days)
+    )
+
+    started = time.perf_counter()
+    try:
+        counts = load_synthetic_dataset(
+            create_engine(database_url), args.members, args.days, start_date, args.interval, args.seed,
+            args.batch_size, args.replace
+        )
+    except ValueError as e:
+        print(f"[FAIL] {e}", file=sys.stderr)
+        return 1
+    elapsed = time.perf_counter() - started
+
+    print(json.dumps({
+        "database_url": database_url,
+        "members": args.members,
+        "member_ids": [SYNTHETIC_MEMBER_ID_BASE, SYNTHETIC_MEMBER_ID_BASE + args.members - 1],
+        "period": [start_date.isoformat(), (start_date + timedelta(days=args.days - 1)).isoformat()],
+        "rows": counts,
+        "elapsed_s": round(elapsed, 2),
+        "glucose_rows_per_s": round(counts["glucose"] / elapsed) if elapsed else None,
+    }, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,7 +3,17 @@
 # 데이터베이스 연결 및 세션 관리
 from .database import (
     engine, SessionLocal, get_db_session, 
-    get_db
+    get_db, get_request_session, session_scope, get_request_checkout_count,
+    init_request_session, ROUTE_PRIMARY, ROUTE_REPLICA, replica_engines, get_replica_lag,
+    POOL_PROFILES, pool_options
+)
+
+# 커넥션 풀 텔레메트리
+from .pool_metrics import get_pool_stats
+
+# 쿼리 계측
+from .instrumentation import (
+    init_query_instrumentation, get_query_stats, get_request_query_stats, reset_query_stats
 )
 
 # 데이터베이스 유틸리티 함수들
@@ -11,22 +21,78 @@ from .database_utils import (
     get_member_info, get_glucose_data, get_food_data, get_exercise_data,
     get_quests_by_date, save_quests_to_db, get_weekly_glucose_data,
     get_glucose_exercise_correlation, get_exercise_data_by_period, 
-    get_glucose_food_correlation, get_food_data_by_period
+    get_glucose_food_correlation, get_food_data_by_period, get_daily_bundle,
+    get_weekly_glucose_series, replace_quests_bulk, iter_glucose_history
+)
+
+# 비동기 엔진/세션 및 조회 함수 (greenlet + 비동기 드라이버 필요, 엔진은 처음 사용할 때 생성)
+from .async_database import (
+    ASYNC_DB_AVAILABLE, get_async_engine, AsyncSessionLocal, async_session_scope, dispose_async_engine
 )
+from .async_utils import (
+    PeriodData, async_get_member_info, async_get_weekly_glucose_series, async_get_food_data_by_period,
+    async_get_exercise_data_by_period, async_get_daily_bundle, async_get_period_data
+)
+
+# 기간 혈당 시계열 결과 캐시
+from .result_cache import glucose_series_cache, invalidate_glucose_series, get_glucose_series_cache_stats
+
+# 경량 조회 결과 행 타입
+from .rows import GlucoseRow, FoodRow, ExerciseRow, DailyBundle, GlucoseSeries, GlucoseAggregate
+
+# 일일 혈당 롤업
+from .rollups import get_glucose_range_aggregate, get_glucose_hourly_series, refresh_glucose_rollups
+
+# 원본 혈당 보관 처리
+from .archival import archive_glucose, archive_horizon, archive_status, restore_glucose
+
+# CGM 측정값 일괄 적재
+from .ingestion import IngestResult, ingest_glucose_readings
 
 # 데이터베이스 초기화
-from .init import init_db
+from .init import init_db, create_schema, check_connection
 
 __all__ = [
     # 데이터베이스 연결
     'engine', 'SessionLocal', 'get_db_session', 'get_db',
+    'get_request_session', 'session_scope', 'get_request_checkout_count',
+    'init_request_session', 'ROUTE_PRIMARY', 'ROUTE_REPLICA', 'replica_engines', 'get_replica_lag',
+    'POOL_PROFILES', 'pool_options',
+    
+    # 커넥션 풀 텔레메트리
+    'get_pool_stats',
+    
+    # 쿼리 계측
+    'init_query_instrumentation', 'get_query_stats', 'get_request_query_stats', 'reset_query_stats',
     
     # 데이터베이스 유틸리티
     'get_member_info', 'get_glucose_data', 'get_food_data', 'get_exercise_data',
     'get_quests_by_date', 'save_quests_to_db', 'get_weekly_glucose_data',
     'get_glucose_exercise_correlation', 'get_exercise_data_by_period', 
-    'get_glucose_food_correlation', 'get_food_data_by_period',
+    'get_glucose_food_correlation', 'get_food_data_by_period', 'get_daily_bundle',
+    'get_weekly_glucose_series', 'replace_quests_bulk', 'iter_glucose_history',
+    
+    # 비동기 DB
+    'ASYNC_DB_AVAILABLE', 'get_async_engine', 'AsyncSessionLocal', 'async_session_scope',
+    'dispose_async_engine', 'PeriodData', 'async_get_member_info', 'async_get_weekly_glucose_series',
+    'async_get_food_data_by_period', 'async_get_exercise_data_by_period', 'async_get_daily_bundle',
+    'async_get_period_data',
+    
+    # 기간 혈당 시계열 결과 캐시
+    'glucose_series_cache', 'invalidate_glucose_series', 'get_glucose_series_cache_stats',
+    
+    # 조회 결과 행 타입
+    'GlucoseRow', 'FoodRow', 'ExerciseRow', 'DailyBundle', 'GlucoseSeries', 'GlucoseAggregate',
+    
+    # 일일 혈당 롤업
+    'get_glucose_range_aggregate', 'get_glucose_hourly_series', 'refresh_glucose_rollups',
+    
+    # 원본 혈당 보관 처리
+    'archive_glucose', 'archive_horizon', 'archive_status', 'restore_glucose',
+    
+    # CGM 측정값 일괄 적재
+    'IngestResult', 'ingest_glucose_readings',
     
     # 데이터베이스 초기화
-    'init_db'
+    'init_db', 'create_schema', 'check_connection'
 ]
\ No newline at end of file
@@ -0,0 +1,355 @@
+"""보관 기간이 지난 원본 혈당 압축 보관 (glucose → glucose_archive + 일일/시간대별 롤업)
+
+GLUCOSE_RETENTION_DAYS보다 오래된 날짜의 원본 측정값을 회원/날짜별 압축 행 하나로 옮기고,
+같은 트랜잭션에서 일일/시간대별 롤업을 기록한 뒤 원본 행을 삭제합니다.
+핫 테이블(glucose)과 인덱스는 보관 기간만큼만 유지됩니다.
+
+조회 경로는 보관 여부와 관계없이 같은 결과를 냅니다.
+보관분을 읽을지는 보관 기준일이 아니라 조회 기간에 실제 압축 행이 있는지로 정하므로,
+run --before로 기준일보다 최근 날짜를 보관했거나 GLUCOSE_RETENTION_DAYS를 줄여도 조회 결과는 같습니다.
+- 기간 요약(get_glucose_range_aggregate): 보관된 날짜도 일일 롤업으로 처리
+- 기간 시계열(get_weekly_glucose_series): 보관 구간이 걸리면 압축 행을 풀어 원본과 합침
+- 혈당 이력(iter_glucose_history): 압축 행과 원본을 (date, time) 순서로 병합
+- 시간대별 시계열(get_glucose_hourly_series): 보관된 날짜는 시간대별 롤업 사용
+보관된 날짜에 늦게 들어온 원본은 다음 실행 때 압축 행에 합쳐지고 롤업도 다시 계산됩니다.
+보관 기간을 늘릴 때는 restore로 해당 날짜를 원본 테이블로 되돌립니다.
+
+사용법:
+    python -m app.database.archival status
+    python -m app.database.archival run [--dry-run]
+    python -m app.database.archival restore --since 2024-01-01
+"""
+
+import argparse
+import logging
+import os
+import sys
+import zlib
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import delete, func, insert, select
+
+from .database import ROUTE_REPLICA, session_scope
+from .rows import GlucoseAggregate, GlucoseRow, GlucoseSeries
+from app.models.database_models import (
+    Glucose, GlucoseArchive, GlucoseDailyRollup, GlucoseHourlyRollup, combine_date_time
+)
+
+logger = logging.getLogger(__name__)
+
+# 원본을 유지하는 일수 (0이면 보관 처리하지 않음)
+GLUCOSE_RETENTION_DAYS = int(os.getenv("GLUCOSE_RETENTION_DAYS", "365"))
+# 한 트랜잭션에서 처리하는 회원 수 (날짜 하나 기준)
+GLUCOSE_ARCHIVE_MEMBER_BATCH = int(os.getenv("GLUCOSE_ARCHIVE_MEMBER_BATCH", "500"))
+DELETE_BATCH_SIZE = 1000
+
+
+def archive_horizon(today: Optional[datetime] = None) -> Optional[str]:
+    """원본으로 유지하는 첫 날짜 (이보다 이전 날짜가 보관 대상, 보관 비활성화 시 None)"""
+    if GLUCOSE_RETENTION_DAYS <= 0:
+        return None
+    today = today or datetime.now()
+    return (today - timedelta(days=GLUCOSE_RETENTION_DAYS)).strftime("%Y-%m-%d")
+
+
+def _time_to_seconds(time_str: str) -> int:
+    parts = [int(part) for part in time_str.split(":")]
+    return parts[0] * 3600 + parts[1] * 60 + (parts[2] if len(parts) > 2 else 0)
+
+
+def _seconds_to_time(seconds: int) -> str:
+    hours, remainder = divmod(int(seconds), 3600)
+    minutes, secs = divmod(remainder, 60)
+    return f"{hours:02d}:{minutes:02d}" if secs == 0 else f"{hours:02d}:{minutes:02d}:{secs:02d}"
+
+
+def encode_readings(seconds: np.ndarray, milli: np.ndarray) -> bytes:
+    """시간순 (자정 기준 초, 혈당 milli) 배열을 델타 인코딩 후 zlib 압축"""
+    deltas = np.concatenate([np.diff(seconds, prepend=0), np.diff(milli, prepend=0)]).astype("<i4")
+    return zlib.compress(deltas.tobytes())
+
+
+def decode_readings(payload: bytes, count: int) -> Tuple[np.ndarray, np.ndarray]:
+    """압축 행을 (자정 기준 초, 혈당 milli) int64 배열로 복원"""
+    deltas = np.frombuffer(zlib.decompress(payload), dtype="<i4").astype(np.int64)
+    return np.cumsum(deltas[:count]), np.cumsum(deltas[count:])
+
+
+def _archive_rows_statement(member_id: int, start_date: str, end_date: str):
+    """기간 내 압축 행 조회 쿼리"""
+    return (
+        select(GlucoseArchive.date, GlucoseArchive.reading_count, GlucoseArchive.payload)
+        .where(
+            GlucoseArchive.member_id == member_id,
+            GlucoseArchive.date >= start_date,
+            GlucoseArchive.date <= end_date
+        )
+        .order_by(GlucoseArchive.date.asc())
+    )
+
+
+def _archive_exists_statement(member_id: int, start_date: str, end_date: str):
+    """기간 내 압축 행 존재 여부 쿼리 (기본 키 범위에서 한 행만 읽음)"""
+    return (
+        select(GlucoseArchive.date)
+        .where(
+            GlucoseArchive.member_id == member_id,
+            GlucoseArchive.date >= start_date,
+            GlucoseArchive.date <= end_date
+        )
+        .limit(1)
+    )
+
+
+def _archive_version_statement(member_id: int, start_date: str, end_date: str):
+    """기간 내 압축 행의 데이터 버전 쿼리 (행 수, 측정값 수, 최근 보관 시각 - 기본 키 범위만 읽음)"""
+    return select(
+        func.count(), func.coalesce(func.sum(GlucoseArchive.reading_count), 0), func.max(GlucoseArchive.archived_at)
+    ).where(
+        GlucoseArchive.member_id == member_id,
+        GlucoseArchive.date >= start_date,
+        GlucoseArchive.date <= end_date
+    )
+
+
+def series_from_archive_rows(rows) -> GlucoseSeries:
+    """(date, reading_count, payload) 행들을 GlucoseSeries로 변환"""
+    timestamps, values = [], []
+    for row_date, count, payload in rows:
+        seconds, milli = decode_readings(payload, count)
+        timestamps.append(np.datetime64(row_date, "s").astype(np.int64) + seconds)
+        values.append((milli / 1000).astype(np.float32))
+    if not timestamps:
+        return GlucoseSeries(np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32))
+    return GlucoseSeries(np.concatenate(timestamps), np.concatenate(values))
+
+
+def has_archived_glucose(db, member_id: int, start_date: str, end_date: str) -> bool:
+    """세션 db로 기간 내 보관된 측정값이 있는지 확인"""
+    return db.connection().execute(_archive_exists_statement(member_id, start_date, end_date)).first() is not None
+
+
+def get_archived_glucose_series(db, member_id: int, start_date: str, end_date: str) -> GlucoseSeries:
+    """세션 db로 기간 내 보관된 측정값 조회"""
+    rows = db.connection().execute(_archive_rows_statement(member_id, start_date, end_date)).all()
+    return series_from_archive_rows(rows)
+
+
+def iter_archived_history(member_id: int, start_date: str, end_date: str,
+                          after: Optional[Tuple[str, str, int]] = None) -> Iterator[GlucoseRow]:
+    """보관된 측정값을 (date, time) 순서의 GlucoseRow(id=0)로 반환 (after 다음 행부터)"""
+    if after is not None:
+        start_date = max(start_date, after[0])
+    stmt = _archive_rows_statement(member_id, start_date, end_date)
+    with session_scope(ROUTE_REPLICA, dedicated=True) as db:
+        for row_date, count, payload in db.execute(stmt, execution_options={"yield_per": 32}):
+            seconds, milli = decode_readings(payload, count)
+            for second, value in zip(seconds.tolist(), milli.tolist()):
+                row = GlucoseRow(0, row_date, _seconds_to_time(second), value / 1000)
+                if after is None or (row.date, row.time, row.id) > after:
+                    yield row
+
+
+def _day_rollup_rows(member_id: int, date: str, seconds: np.ndarray, milli: np.ndarray, now: datetime):
+    """하루치 측정값으로 일일 롤업 행과 시간대별 롤업 행 생성"""
+    daily = dict(GlucoseAggregate.from_milli(milli)._asdict(), member_id=member_id, date=date, updated_at=now)
+    hours = seconds // 3600
+    hourly = [
+        dict(GlucoseAggregate.from_milli(milli[hours == hour])._asdict(),
+             member_id=member_id, date=date, hour=int(hour), updated_at=now)
+        for hour in np.unique(hours)
+    ]
+    return daily, hourly
+
+
+def _archive_chunk(db, date: str, member_ids: List[int]) -> int:
+    """날짜 하나, 회원 묶음 하나의 원본을 압축 행으로 옮기고 옮긴 원본 행 수 반환"""
+    raw = db.execute(
+        select(Glucose.id, Glucose.member_id, Glucose.time, Glucose.glucose_mg_dl)
+        .where(Glucose.date == date, Glucose.member_id.in_(member_ids))
+    ).all()
+    existing = {
+        member_id: decode_readings(payload, count)
+        for member_id, count, payload in db.execute(
+            select(GlucoseArchive.member_id, GlucoseArchive.reading_count, GlucoseArchive.payload)
+            .where(GlucoseArchive.date == date, GlucoseArchive.member_id.in_(member_ids))
+        )
+    }
+
+    # 회원별 {초: milli} (이미 보관된 값 위에 원본 값을 덮어씀)
+    readings: Dict[int, Dict[int, int]] = {}
+    for member_id, (seconds, milli) in existing.items():
+        readings[member_id] = dict(zip(seconds.tolist(), milli.tolist()))
+    for _, member_id, time_str, value in raw:
+        readings.setdefault(member_id, {})[_time_to_seconds(time_str)] = int(np.round(value * 1000))
+
+    now = datetime.utcnow()
+    archive_rows, daily_rows, hourly_rows = [], [], []
+    for member_id, by_second in readings.items():
+        seconds = np.array(sorted(by_second), dtype=np.int64)
+        milli = np.array([by_second[second] for second in seconds.tolist()], dtype=np.int64)
+        archive_rows.append({
+            "member_id": member_id, "date": date, "reading_count": len(seconds),
+            "payload": encode_readings(seconds, milli), "archived_at": now,
+        })
+        daily, hourly = _day_rollup_rows(member_id, date, seconds, milli, now)
+        daily_rows.append(daily)
+        hourly_rows.extend(hourly)
+
+    targets = list(readings)
+    for model in (GlucoseArchive, GlucoseDailyRollup, GlucoseHourlyRollup):
+        db.execute(delete(model.__table__).where(model.date == date, model.member_id.in_(targets)))
+    db.execute(insert(GlucoseArchive.__table__), archive_rows)
+    db.execute(insert(GlucoseDailyRollup.__table__), daily_rows)
+    db.execute(insert(GlucoseHourlyRollup.__table__), hourly_rows)
+
+    # 조회 후 새로 들어온 행은 남기도록 id로 삭제
+    ids = [row_id for row_id, *_ in raw]
+    for offset in range(0, len(ids), DELETE_BATCH_SIZE):
+        db.execute(delete(Glucose.__table__).where(Glucose.id.in_(ids[offset:offset + DELETE_BATCH_SIZE])))
+    return len(ids)
+
+
+def pending_archive_dates(before: str) -> Dict[str, int]:
+    """before 이전 날짜별 원본 행 수"""
+    with session_scope() as db:
+        rows = db.execute(
+            select(Glucose.date, func.count()).where(Glucose.date < before).group_by(Glucose.date).order_by(Glucose.date)
+        ).all()
+    return {row_date: count for row_date, count in rows}
+
+
+def archive_glucose(before: Optional[str] = None, member_batch: int = GLUCOSE_ARCHIVE_MEMBER_BATCH) -> Dict[str, int]:
+    """before(기본: 보관 기준일) 이전 원본을 날짜 순으로 보관 처리 (날짜별 옮긴 행 수 반환)"""
+    before = before or archive_horizon()
+    if before is None:
+        return {}
+
+    report = {}
+    for date in pending_archive_dates(before):
+        with session_scope() as db:
+            member_ids = db.execute(
+                select(Glucose.member_id).where(Glucose.date == date).distinct()
+            ).scalars().all()
+        moved = 0
+        for offset in range(0, len(member_ids), member_batch):
+            with session_scope() as db:
+                try:
+                    moved += _archive_chunk(db, date, member_ids[offset:offset + member_batch])
+                    db.commit()
+                except Exception as e:
+                    logger.error(f"혈당 보관 처리 실패 ({date}): {e}")
+                    raise
+        report[date] = moved
+        logger.info(f"혈당 보관 처리: {date} 회원 {len(member_ids)}명, 원본 {moved}행")
+    return report
+
+
+def restore_glucose(since: str, member_ids: Optional[List[int]] = None) -> int:
+    """since 이후 날짜의 압축 행을 원본 테이블로 되돌림 (보관 기간을 늘렸을 때, 복원한 행 수 반환)"""
+    filters = [GlucoseArchive.date >= since]
+    if member_ids is not None:
+        filters.append(GlucoseArchive.member_id.in_(member_ids))
+    with session_scope() as db:
+        keys = db.execute(
+            select(GlucoseArchive.member_id, GlucoseArchive.date).where(*filters).order_by(GlucoseArchive.date)
+        ).all()
+
+    restored = 0
+    now = datetime.utcnow()
+    for member_id, date in keys:
+        with session_scope() as db:
+            try:
+                count, payload = db.execute(
+                    select(GlucoseArchive.reading_count, GlucoseArchive.payload)
+                    .where(GlucoseArchive.member_id == member_id, GlucoseArchive.date == date)
+                ).one()
+                present = set(db.execute(
+                    select(Glucose.time).where(Glucose.member_id == member_id, Glucose.date == date)
+                ).scalars())
+                seconds, milli = decode_readings(payload, count)
+                rows = []
+                for second, value in zip(seconds.tolist(), milli.tolist()):
+                    time_str = _seconds_to_time(second)
+                    if time_str in present:
+                        continue
+                    rows.append({
+                        "member_id": member_id, "date": date, "time": time_str,
+                        "measured_at": combine_date_time(date, time_str), "glucose_mg_dl": value / 1000,
+                        "created_at": now, "updated_at": now,
+                    })
+                if rows:
+                    db.execute(insert(Glucose.__table__), rows)
+                for model in (GlucoseArchive, GlucoseHourlyRollup):
+                    db.execute(delete(model.__table__).where(model.member_id == member_id, model.date == date))
+                db.commit()
+            except Exception as e:
+                logger.error(f"혈당 보관 복원 실패 (회원 {member_id}, {date}): {e}")
+                raise
+        restored += len(rows)
+    logger.info(f"혈당 보관 복원: {len(keys)}개 회원-날짜, {restored}행")
+    return restored
+
+
+def archive_status() -> Dict[str, object]:
+    """핫 테이블/보관 테이블 현황"""
+    with session_scope() as db:
+        hot_rows, oldest_hot = db.execute(select(func.count(), func.min(Glucose.date))).one()
+        archived_days, archived_rows, archived_bytes, newest_archived = db.execute(
+            select(
+                func.count(),
+                func.coalesce(func.sum(GlucoseArchive.reading_count), 0),
+                func.coalesce(func.sum(func.length(GlucoseArchive.payload)), 0),
+                func.max(GlucoseArchive.date),
+            )
+        ).one()
+    return {
+        "retention_days": GLUCOSE_RETENTION_DAYS,
+        "horizon": archive_horizon(),
+        "hot_rows": hot_rows,
+        "oldest_hot_date": oldest_hot,
+        "archived_member_days": archived_days,
+        "archived_readings": int(archived_rows),
+        "archived_payload_bytes": int(archived_bytes),
+        "newest_archived_date": newest_archived,
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="원본 혈당 보관 처리")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("status", help="핫 테이블/보관 테이블 현황")
+    run_parser = subparsers.add_parser("run", help="보관 기준일 이전 원본 보관")
+    run_parser.add_argument("--before", default=None, help="기본값: 오늘 - GLUCOSE_RETENTION_DAYS")
+    run_parser.add_argument("--dry-run", action="store_true", help="대상 날짜/행 수만 출력")
+    restore_parser = subparsers.add_parser("restore", help="압축 행을 원본 테이블로 복원")
+    restore_parser.add_argument("--since", required=True)
+    restore_parser.add_argument("--member-id", type=int, action="append", dest="member_ids")
+    args = parser.parse_args(argv)
+
+    if args.command == "status":
+        for key, value in archive_status().items():
+            print(f"{key}: {value}")
+        return 0
+
+    if args.command == "restore":
+        print(f"복원된 원본: {restore_glucose(args.since, args.member_ids)}행")
+        return 0
+
+    before = args.before or archive_horizon()
+    if before is None:
+        print("GLUCOSE_RETENTION_DAYS가 0이라 보관 처리하지 않습니다")
+        return 0
+    if args.dry_run:
+        pending = pending_archive_dates(before)
+        print(f"{before} 이전 보관 대상: {len(pending)}일, {sum(pending.values())}행")
+        return 0
+    report = archive_glucose(before)
+    print(f"보관 처리 완료: {len(report)}일, {sum(report.values())}행")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+"""비동기 데이터베이스 엔진 및 세션 관리 (SQLAlchemy asyncio)
+
+동기 엔진과 같은 DATABASE_URL을 쓰되 드라이버만 비동기 드라이버로 바꿉니다.
+    mysql  → aiomysql 또는 asyncmy
+    sqlite → aiosqlite
+ASYNC_DATABASE_URL 환경변수로 URL을 직접 지정할 수도 있습니다.
+엔진은 처음 사용할 때 생성하므로 비동기 드라이버가 없어도 동기 경로에는 영향이 없습니다.
+"""
+
+import importlib.util
+import logging
+import os
+from contextlib import asynccontextmanager
+
+from sqlalchemy.engine import make_url
+
+from .database import ENGINE_OPTIONS
+from .instrumentation import instrument_engine
+from app.core.config import settings
+
+# SQLAlchemy asyncio 확장은 greenlet이 있어야 동작 (선택적)
+try:
+    import greenlet  # noqa: F401
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+    ASYNC_DB_AVAILABLE = True
+except ImportError:
+    ASYNC_DB_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# backend별 비동기 드라이버 (앞쪽 우선)
+ASYNC_DRIVERS = {
+    "mysql": ("aiomysql", "asyncmy"),
+    "sqlite": ("aiosqlite",),
+}
+
+_async_engine = None
+_async_session_factory = None
+
+
+def async_database_url(url: str = None) -> str:
+    """동기 DATABASE_URL을 설치된 비동기 드라이버 URL로 변환"""
+    override = os.getenv("ASYNC_DATABASE_URL")
+    if override:
+        return override
+
+    sync_url = make_url(url or settings.DATABASE_URL)
+    backend = sync_url.get_backend_name()
+    for driver in ASYNC_DRIVERS.get(backend, ()):
+        if importlib.util.find_spec(driver) is not None:
+            return sync_url.set(drivername=f"{backend}+{driver}").render_as_string(hide_password=False)
+
+    raise RuntimeError(
+        f"{backend}용 비동기 드라이버가 설치되어 있지 않습니다 "
+        f"(필요: {', '.join(ASYNC_DRIVERS.get(backend, ())) or '지원되지 않는 backend'})"
+    )
+
+
+def get_async_engine():
+    """비동기 엔진 반환 (최초 호출 시 생성)"""
+    global _async_engine, _async_session_factory
+
+    if not ASYNC_DB_AVAILABLE:
+        raise RuntimeError("비동기 DB 경로를 사용하려면 greenlet이 필요합니다")
+
+    if _async_engine is None:
+        url = async_database_url()
+        options = dict(ENGINE_OPTIONS)
+        options.pop("poolclass")  # 비동기 엔진은 AsyncAdaptedQueuePool 사용
+        if make_url(url).get_backend_name() == "sqlite":
+            # aiosqlite는 연결마다 스레드를 쓰므로 풀 크기 옵션을 적용하지 않음
+            options.pop("pool_size")
+            options.pop("max_overflow")
+        _async_engine = create_async_engine(url, **options)
+        instrument_engine(_async_engine.sync_engine)
+        _async_session_factory = async_sessionmaker(_async_engine, expire_on_commit=False, autoflush=False)
+        logger.info(f"비동기 DB 엔진 생성: {make_url(url).drivername}")
+
+    return _async_engine
+
+
+def AsyncSessionLocal() -> "AsyncSession":
+    """비동기 세션 생성"""
+    get_async_engine()
+    return _async_session_factory()
+
+
+@asynccontextmanager
+async def async_session_scope():
+    """비동기 세션 컨텍스트 매니저 (한 세션은 한 번에 쿼리 하나만 실행하므로 동시 쿼리마다 따로 엶)"""
+    async with AsyncSessionLocal() as session:
+        try:
+            yield session
+        except Exception:
+            await session.rollback()
+            raise
+
+
+async def dispose_async_engine():
+    """비동기 엔진 커넥션 풀 정리 (이벤트 루프 종료 전 호출)"""
+    global _async_engine, _async_session_factory
+    if _async_engine is not None:
+        await _async_engine.dispose()
+        _async_engine = None
+        _async_session_factory = None
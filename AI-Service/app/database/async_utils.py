@@ -0,0 +1,161 @@
+"""비동기 데이터베이스 조회 함수들 (database_utils의 비동기 버전)
+
+쿼리는 database_utils와 같은 구문을 사용하고, 조회마다 별도 세션(커넥션)을 열어
+서로 독립적인 조회를 asyncio.gather로 동시에 실행할 수 있습니다.
+
+사용법 (동기 결과와 비교 + 순차/동시 실행 시간 측정):
+    python -m app.database.async_utils check --member-id 1 --start 2025-06-01 --end 2025-06-07
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from typing import List, NamedTuple, Optional
+
+from .archival import (
+    _archive_exists_statement, _archive_rows_statement, _archive_version_statement, series_from_archive_rows
+)
+from .async_database import async_session_scope, dispose_async_engine
+from .database_utils import (
+    _daily_bundle_from_rows, _daily_bundle_statement, _exercise_period_statement, _food_period_statement,
+    _GLUCOSE_VERSION_QUERY, _MEMBER_INFO_QUERY, _WEEKLY_GLUCOSE_SERIES_QUERY, _member_info, _period_params
+)
+from .result_cache import glucose_series_cache
+from .rows import DailyBundle, GlucoseSeries
+
+
+class PeriodData(NamedTuple):
+    """기간 리포트 입력 데이터 묶음"""
+    member_info: Optional[dict]
+    glucose: GlucoseSeries
+    food: List
+    exercise: List
+
+
+async def async_get_member_info(member_id: int) -> Optional[dict]:
+    """회원 정보 조회"""
+    async with async_session_scope() as db:
+        member = (await db.execute(_MEMBER_INFO_QUERY, {"member_id": member_id})).first()
+        return _member_info(member) if member else None
+
+
+async def async_get_weekly_glucose_series(member_id: int, start_date: str, end_date: str) -> GlucoseSeries:
+    """기간 혈당을 컬럼형 시계열로 조회 (보관 구간이 걸리면 압축 보관분과 합침, 동기 조회와 같은 결과 캐시 사용)"""
+    key = (member_id, start_date, end_date)
+    params = _period_params(member_id, start_date, end_date)
+    async with async_session_scope() as db:
+        connection = await db.connection()
+        archive_exists = await connection.execute(_archive_exists_statement(member_id, start_date, end_date))
+        archived_range = archive_exists.first() is not None
+        version = None
+        if glucose_series_cache.enabled:
+            version = tuple((await connection.execute(_GLUCOSE_VERSION_QUERY, params)).one())
+            if archived_range:
+                archive_version = await connection.execute(_archive_version_statement(member_id, start_date, end_date))
+                version += tuple(archive_version.one())
+            cached = glucose_series_cache.get(key, version)
+            if cached is not None:
+                return cached
+        result = await connection.execute(_WEEKLY_GLUCOSE_SERIES_QUERY, params)
+        series = GlucoseSeries.from_rows(result.all())
+        if archived_range:
+            archived = await connection.execute(_archive_rows_statement(member_id, start_date, end_date))
+            series = series_from_archive_rows(archived.all()).overlay(series)
+    if version is not None:
+        glucose_series_cache.put(key, version, series)
+    return series
+
+
+async def async_get_food_data_by_period(member_id: int, start_date: str, end_date: str):
+    """기간별 음식 데이터 조회"""
+    async with async_session_scope() as db:
+        return (await db.execute(_food_period_statement(member_id, start_date, end_date))).scalars().all()
+
+
+async def async_get_exercise_data_by_period(member_id: int, start_date: str, end_date: str):
+    """기간별 운동 데이터 조회"""
+    async with async_session_scope() as db:
+        return (await db.execute(_exercise_period_statement(member_id, start_date, end_date))).scalars().all()
+
+
+async def async_get_daily_bundle(member_id: int, date: str) -> DailyBundle:
+    """특정 날짜의 혈당/음식/운동 데이터를 한 번의 왕복으로 조회"""
+    async with async_session_scope() as db:
+        return _daily_bundle_from_rows(await db.execute(_daily_bundle_statement(member_id, date)))
+
+
+async def async_get_period_data(member_id: int, start_date: str, end_date: str) -> PeriodData:
+    """회원 정보/혈당/음식/운동 조회를 동시에 실행"""
+    member_info, glucose, food, exercise = await asyncio.gather(
+        async_get_member_info(member_id),
+        async_get_weekly_glucose_series(member_id, start_date, end_date),
+        async_get_food_data_by_period(member_id, start_date, end_date),
+        async_get_exercise_data_by_period(member_id, start_date, end_date),
+    )
+    return PeriodData(member_info, glucose, food, exercise)
+
+
+async def _check(member_id: int, start_date: str, end_date: str) -> int:
+    from .database_utils import (
+        get_exercise_data_by_period, get_food_data_by_period, get_member_info, get_weekly_glucose_series
+    )
+
+    try:
+        serial_start = time.perf_counter()
+        await async_get_member_info(member_id)
+        await async_get_weekly_glucose_series(member_id, start_date, end_date)
+        await async_get_food_data_by_period(member_id, start_date, end_date)
+        await async_get_exercise_data_by_period(member_id, start_date, end_date)
+        serial_ms = (time.perf_counter() - serial_start) * 1000
+
+        # 결과 캐시를 비워 두 측정과 아래 동기 비교가 모두 실제 조회를 하도록 함
+        glucose_series_cache.clear()
+        gather_start = time.perf_counter()
+        data = await async_get_period_data(member_id, start_date, end_date)
+        gather_ms = (time.perf_counter() - gather_start) * 1000
+    finally:
+        await dispose_async_engine()
+
+    glucose_series_cache.clear()
+    sync_series = get_weekly_glucose_series(member_id, start_date, end_date)
+    mismatches = []
+    if data.member_info != get_member_info(member_id):
+        mismatches.append("member_info")
+    if not (
+        (data.glucose.timestamps == sync_series.timestamps).all()
+        and (data.glucose.values == sync_series.values).all()
+    ):
+        mismatches.append("glucose")
+    if [row.id for row in data.food] != [row.id for row in get_food_data_by_period(member_id, start_date, end_date)]:
+        mismatches.append("food")
+    if [row.id for row in data.exercise] != [
+        row.id for row in get_exercise_data_by_period(member_id, start_date, end_date)
+    ]:
+        mismatches.append("exercise")
+
+    print(
+        f"혈당 {len(data.glucose)}건, 음식 {len(data.food)}건, 운동 {len(data.exercise)}건 | "
+        f"순차 {serial_ms:.1f}ms, 동시 {gather_ms:.1f}ms"
+    )
+    if mismatches:
+        print(f"[FAIL] 동기 조회 결과와 다름: {', '.join(mismatches)}", file=sys.stderr)
+        return 1
+    print("[OK] 비동기 조회 결과가 동기 조회와 같습니다")
+    return 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="비동기 DB 조회 점검")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    check_parser = subparsers.add_parser("check", help="동기 조회와 결과 비교 및 순차/동시 실행 시간 측정")
+    check_parser.add_argument("--member-id", type=int, required=True)
+    check_parser.add_argument("--start", required=True)
+    check_parser.add_argument("--end", required=True)
+    args = parser.parse_args(argv)
+
+    return asyncio.run(_check(args.member_id, args.start, args.end))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
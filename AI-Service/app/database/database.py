@@ -1,25 +1,172 @@
 """데이터베이스 연결 및 세션 관리"""
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.sql import Delete, Insert, Update
 from contextlib import contextmanager
+from flask import g, has_app_context
 from app.core.config import settings
+from .pool_metrics import TimedQueuePool, instrument_pool
+import itertools
 import logging
+import os
+import time
 
 logger = logging.getLogger(__name__)
 
-# 데이터베이스 엔진 생성
-engine = create_engine(
-    settings.DATABASE_URL,
+# 세션 라우팅 대상
+ROUTE_PRIMARY = "primary"
+ROUTE_REPLICA = "replica"
+
+# 읽기 전용 복제본 설정 (쉼표로 구분된 URL, 비어 있으면 모든 쿼리가 primary로 감)
+REPLICA_URLS = [url.strip() for url in os.getenv("DATABASE_REPLICA_URLS", "").split(",") if url.strip()]
+REPLICA_MAX_LAG_SECONDS = float(os.getenv("DB_REPLICA_MAX_LAG_SECONDS", "5"))
+REPLICA_LAG_CHECK_INTERVAL = float(os.getenv("DB_REPLICA_LAG_CHECK_SECONDS", "10"))
+# primary 쓰기 직후 이 시간 동안은 복제본 읽기도 primary로 보냄 (read-your-writes)
+REPLICA_STICKY_SECONDS = float(os.getenv("DB_REPLICA_STICKY_SECONDS", "2"))
+
+# 배포 형태별 커넥션 풀 설정 (DB_POOL_PROFILE로 선택, 워커 프로세스마다 풀이 하나씩 생김)
+POOL_PROFILES = {
+    # 기존 기본값
+    "default": dict(pool_size=10, max_overflow=20, pool_recycle=3600, pool_timeout=30, pool_pre_ping=True),
+    # 로컬 개발/단일 워커
+    "small": dict(pool_size=2, max_overflow=3, pool_recycle=3600, pool_timeout=30, pool_pre_ping=True),
+    # 워커 수가 많은 배포 - 워커당 풀은 작게, 고갈은 빨리 드러나게
+    "high_concurrency": dict(pool_size=5, max_overflow=5, pool_recycle=1800, pool_timeout=5, pool_pre_ping=True),
+    # 배치/CLI 작업
+    "batch": dict(pool_size=1, max_overflow=0, pool_recycle=300, pool_timeout=60, pool_pre_ping=True),
+}
+
+
+def pool_options(profile: str = None) -> dict:
+    """프로필 풀 설정 + 개별 환경변수(DB_POOL_SIZE 등) 덮어쓰기"""
+    profile = profile or os.getenv("DB_POOL_PROFILE", "default")
+    if profile not in POOL_PROFILES:
+        logger.warning(f"알 수 없는 DB_POOL_PROFILE '{profile}', default 사용")
+        profile = "default"
+    
+    options = dict(POOL_PROFILES[profile])
+    for key, env_name, cast in (
+        ("pool_size", "DB_POOL_SIZE", int),
+        ("max_overflow", "DB_MAX_OVERFLOW", int),
+        ("pool_recycle", "DB_POOL_RECYCLE", int),
+        ("pool_timeout", "DB_POOL_TIMEOUT", float),
+        ("pool_pre_ping", "DB_POOL_PRE_PING", lambda value: value.lower() in ("1", "true", "yes")),
+    ):
+        if os.getenv(env_name):
+            options[key] = cast(os.getenv(env_name))
+    return options
+
+
+ENGINE_OPTIONS = dict(
     echo=settings.FLASK_DEBUG,
-    pool_pre_ping=True,  # 연결 상태 확인
-    pool_recycle=3600,   # 1시간마다 연결 재생성
-    pool_size=10,        # 연결 풀 크기
-    max_overflow=20      # 최대 오버플로우 연결 수
+    poolclass=TimedQueuePool,  # 체크아웃 대기 시간/풀 고갈 기록
+    **pool_options()
 )
 
+# 데이터베이스 엔진 생성
+engine = create_engine(settings.DATABASE_URL, **ENGINE_OPTIONS)
+
+# 복제본 엔진
+replica_engines = [create_engine(url, **ENGINE_OPTIONS) for url in REPLICA_URLS]
+
+instrument_pool(engine, "primary")
+for _replica in replica_engines:
+    instrument_pool(_replica, f"replica:{_replica.url.host or _replica.url.database}")
+
+_replica_cycle = itertools.cycle(replica_engines)
+_replica_lag = {}        # engine -> (확인 시각, 지연 초)
+_last_primary_write = 0.0
+
+
+def _measure_replica_lag(replica) -> float:
+    """복제본 지연(초) 조회 - MySQL 외 dialect는 복제 상태를 알 수 없어 0으로 간주"""
+    if replica.dialect.name != "mysql":
+        return 0.0
+    
+    with replica.connect() as connection:
+        for statement in ("SHOW REPLICA STATUS", "SHOW SLAVE STATUS"):
+            try:
+                status = connection.execute(text(statement)).mappings().first()
+                break
+            except Exception:
+                continue
+        else:
+            return float("inf")
+    
+    if status is None:
+        return float("inf")  # 복제가 설정되지 않은 서버
+    lag = status.get("Seconds_Behind_Source", status.get("Seconds_Behind_Master"))
+    return float(lag) if lag is not None else float("inf")  # NULL이면 복제 중단
+
+
+def get_replica_lag(replica) -> float:
+    """캐시된 복제본 지연(초) - REPLICA_LAG_CHECK_INTERVAL마다 다시 확인"""
+    now = time.monotonic()
+    checked_at, lag = _replica_lag.get(replica, (None, None))
+    if checked_at is None or now - checked_at >= REPLICA_LAG_CHECK_INTERVAL:
+        try:
+            lag = _measure_replica_lag(replica)
+        except Exception as e:
+            logger.warning(f"복제본 지연 확인 실패 ({replica.url.host}): {e}")
+            lag = float("inf")
+        _replica_lag[replica] = (now, lag)
+    return lag
+
+
+def _choose_replica():
+    """지연이 허용 범위 안인 복제본을 순서대로 선택 (없으면 None)"""
+    for _ in range(len(replica_engines)):
+        replica = next(_replica_cycle)
+        if get_replica_lag(replica) <= REPLICA_MAX_LAG_SECONDS:
+            return replica
+    return None
+
+
+class RoutingSession(Session):
+    """쓰기와 일반 읽기는 primary, ROUTE_REPLICA로 표시된 읽기는 복제본으로 보내는 세션
+    
+    복제본이 없거나 지연이 크거나, 이 세션/프로세스에서 방금 쓰기가 있었으면 primary로 대체합니다.
+    """
+    
+    def get_bind(self, mapper=None, clause=None, **kw):
+        global _last_primary_write
+        
+        if self._flushing or isinstance(clause, (Insert, Update, Delete)):
+            self.info["wrote"] = True
+            _last_primary_write = time.monotonic()
+            return super().get_bind(mapper=mapper, clause=clause, **kw)
+        
+        if (
+            replica_engines
+            and self.info.get("route") == ROUTE_REPLICA
+            and not self.info.get("wrote")
+            and time.monotonic() - _last_primary_write >= REPLICA_STICKY_SECONDS
+        ):
+            replica = _choose_replica()
+            if replica is not None:
+                return replica
+        
+        return super().get_bind(mapper=mapper, clause=clause, **kw)
+
+
 # 세션 팩토리 생성
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+SessionLocal = sessionmaker(class_=RoutingSession, autocommit=False, autoflush=False, bind=engine)
+
+# 요청 범위 세션 팩토리 (요청 안에서 커밋 후에도 앞서 조회한 객체를 다시 읽지 않도록 expire_on_commit=False)
+RequestSessionLocal = sessionmaker(
+    class_=RoutingSession, autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
+)
+
+
+def _count_request_checkout(dbapi_connection, connection_record, connection_proxy):
+    """요청별 커넥션 풀 체크아웃 횟수 집계"""
+    if has_app_context():
+        g._db_checkout_count = g.get("_db_checkout_count", 0) + 1
+
+
+for _engine in [engine] + replica_engines:
+    event.listen(_engine, "checkout", _count_request_checkout)
 
 
 @contextmanager
@@ -41,3 +188,63 @@ def get_db() -> Session:
     """데이터베이스 세션 반환 (의존성 주입용)"""
     return SessionLocal()
 
+
+def get_request_session() -> Session:
+    """요청(앱 컨텍스트) 범위 세션 반환 - 인증과 핸들러가 같은 세션/커넥션을 공유"""
+    session = g.get("_db_session")
+    if session is None:
+        session = RequestSessionLocal()
+        g._db_session = session
+    return session
+
+
+@contextmanager
+def session_scope(route: str = ROUTE_PRIMARY, dedicated: bool = False):
+    """요청 컨텍스트 안에서는 요청 세션을 재사용하고, 밖에서는 새 세션을 열고 닫음
+    
+    Args:
+        route: ROUTE_REPLICA면 이 블록의 읽기를 복제본으로 보냄 (리포트/분석용 읽기)
+        dedicated: True면 요청 안에서도 별도 세션 사용 (스트리밍 커서처럼 커넥션을 오래 점유하는 경우)
+    """
+    if has_app_context() and not dedicated:
+        session = get_request_session()
+        previous_route = session.info.get("route", ROUTE_PRIMARY)
+        session.info["route"] = route
+        try:
+            yield session
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.info["route"] = previous_route
+        return
+    
+    session = SessionLocal()
+    session.info["route"] = route
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def get_request_checkout_count() -> int:
+    """현재 요청에서 발생한 커넥션 풀 체크아웃 횟수"""
+    return g.get("_db_checkout_count", 0) if has_app_context() else 0
+
+
+def close_request_session(exception=None):
+    """앱 컨텍스트 종료 시 요청 세션 정리 및 체크아웃 횟수 기록"""
+    session = g.pop("_db_session", None)
+    if session is not None:
+        if exception is not None:
+            session.rollback()
+        session.close()
+    
+    checkout_count = g.pop("_db_checkout_count", 0)
+    if checkout_count:
+        logger.info(f"요청 DB 커넥션 체크아웃: {checkout_count}회")
+
+
+def init_request_session(app):
+    """Flask 앱에 요청 범위 세션 정리 훅 등록"""
+    app.teardown_appcontext(close_request_session)
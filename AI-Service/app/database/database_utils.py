@@ -1,117 +1,344 @@
-"""데이터베이스 관련 유틸리티 함수들"""
+"""데이터베이스 관련 유틸리티 함수들
 
-from .database import SessionLocal
+리포트/분석용 기간 조회는 ROUTE_REPLICA로 복제본에서 읽고, 회원/퀘스트 조회와 쓰기는 primary를 사용합니다.
+요청마다 호출되는 회원/날짜 단위 조회는 모듈 로드 시 한 번 만든 문장(*_QUERY)을 bindparam 값만 바꿔 실행합니다.
+같은 문장 객체라 캐시 키가 메모이즈되어 컴파일 캐시를 바로 찾고, 쿼리 구성/결과 메타데이터 재매핑 비용이 없습니다.
+(lambda_stmt는 실행마다 문장을 복제해 값을 다시 심으므로 이 크기의 쿼리에서는 select()보다 느렸습니다 -
+ app.benchmarks.statement_cache 참고)
+"""
+
+from .archival import (
+    _archive_version_statement, get_archived_glucose_series, has_archived_glucose, iter_archived_history
+)
+from .database import ROUTE_REPLICA, session_scope
+from .result_cache import glucose_series_cache
+from .rows import GlucoseRow, FoodRow, ExerciseRow, DailyBundle, GlucoseSeries
 from app.models.database_models import Member, Glucose, Quest, Food, Exercise
-from datetime import datetime
+from datetime import datetime, timedelta
+from sqlalchemy import (
+    DateTime, Float, String, and_, bindparam, delete, func, insert, literal, literal_column, null, or_, select,
+    type_coerce, union_all
+)
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import FunctionElement
+from typing import Iterator, Optional, Tuple
+import heapq
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+# 혈당 이력 스트리밍 시 서버 측 커서에서 한 번에 가져오는 행 수
+GLUCOSE_HISTORY_BATCH_SIZE = int(os.getenv("GLUCOSE_HISTORY_BATCH_SIZE", "1000"))
+
+
+def day_bounds(date: str):
+    """날짜 문자열(YYYY-MM-DD)의 measured_at 조회 구간 [당일 00:00, 다음날 00:00)"""
+    start = datetime.strptime(date, "%Y-%m-%d")
+    return start, start + timedelta(days=1)
+
+
+def period_bounds(start_date: str, end_date: str):
+    """기간(양 끝 날짜 포함)의 measured_at 조회 구간 [시작일 00:00, 종료일 다음날 00:00)"""
+    return day_bounds(start_date)[0], day_bounds(end_date)[1]
+
+
+def _day_params(member_id: int, date: str):
+    """하루 단위 *_QUERY 문장의 바인드 값"""
+    start, end = day_bounds(date)
+    return {"member_id": member_id, "start": start, "end": end}
+
+
+def _period_params(member_id: int, start_date: str, end_date: str):
+    """기간 단위 *_QUERY 문장의 바인드 값"""
+    start, end = period_bounds(start_date, end_date)
+    return {"member_id": member_id, "start": start, "end": end}
+
+
+def _member_info(member):
+    """Member 객체를 회원 정보 dict로 변환 (생년월일에서 나이 계산)"""
+    if isinstance(member.birth, int):
+        birth_year = member.birth // 10000
+    else:
+        birth_year = member.birth.year
+    current_year = datetime.now().year
+    age = current_year - birth_year
+    return {
+        'age': age,
+        'diabetes_type': member.diabetes_type,
+        'gender': member.gender,
+        'height': member.height,
+        'weight': member.weight
+    }
+
+
+# 회원 정보 계산에 필요한 컬럼만 조회
+_MEMBER_INFO_QUERY = select(
+    Member.birth, Member.diabetes_type, Member.gender, Member.height, Member.weight
+).where(Member.member_id == bindparam("member_id"))
 
 
 def get_member_info(member_id: int):
     """회원 정보 조회"""
-    db = SessionLocal()
-    try:
-        member = db.query(Member).filter(Member.member_id == member_id).first()
+    with session_scope() as db:
+        member = db.execute(_MEMBER_INFO_QUERY, {"member_id": member_id}).first()
         if member:
-            # 생년월일에서 나이 계산
-            if isinstance(member.birth, int):
-                birth_year = member.birth // 10000
-            else:
-                birth_year = member.birth.year
-            current_year = datetime.now().year
-            age = current_year - birth_year
-            return {
-                'age': age,
-                'diabetes_type': member.diabetes_type,
-                'gender': member.gender,
-                'height': member.height,
-                'weight': member.weight
-            }
+            return _member_info(member)
         return None
-    finally:
-        db.close()
+
+
+_GLUCOSE_DAY_QUERY = select(
+    Glucose.id, Glucose.date, Glucose.time, Glucose.glucose_mg_dl, Glucose.measured_at
+).where(
+    Glucose.member_id == bindparam("member_id"),
+    Glucose.measured_at >= bindparam("start"),
+    Glucose.measured_at < bindparam("end")
+).order_by(Glucose.measured_at.asc())
 
 
 def get_glucose_data(member_id: int, date: str):
-    """혈당 데이터 조회"""
-    db = SessionLocal()
-    try:
-        readings = (
-            db.query(Glucose)
-            .filter(Glucose.member_id == member_id, Glucose.date == date)
-            .order_by(Glucose.time.asc())
-            .all()
+    """혈당 데이터 조회 (GlucoseRow 목록)"""
+    with session_scope() as db:
+        return [GlucoseRow(*row) for row in db.execute(_GLUCOSE_DAY_QUERY, _day_params(member_id, date))]
+
+
+def _weekly_glucose_statement(member_id: int, start_date: str, end_date: str):
+    """기간 혈당 ORM 조회 쿼리"""
+    period_start, period_end = period_bounds(start_date, end_date)
+    return (
+        select(Glucose)
+        .where(
+            Glucose.member_id == member_id,
+            Glucose.measured_at >= period_start,
+            Glucose.measured_at < period_end
         )
-        return readings
-    finally:
-        db.close()
+        .order_by(Glucose.measured_at.asc())
+    )
 
 
 def get_weekly_glucose_data(member_id: int, start_date: str, end_date: str):
     """주간 혈당 데이터 조회"""
-    db = SessionLocal()
+    with session_scope(ROUTE_REPLICA) as db:
+        return db.execute(_weekly_glucose_statement(member_id, start_date, end_date)).scalars().all()
+
+
+# 기간 혈당의 (measured_at, glucose_mg_dl) 컬럼만 조회
+# measured_at은 드라이버 값(MySQL datetime / SQLite 문자열)을 그대로 받아 NumPy에서 한 번에 변환
+_WEEKLY_GLUCOSE_SERIES_QUERY = select(type_coerce(Glucose.measured_at, String), Glucose.glucose_mg_dl).where(
+    Glucose.member_id == bindparam("member_id"),
+    Glucose.measured_at >= bindparam("start"),
+    Glucose.measured_at < bindparam("end")
+).order_by(Glucose.measured_at.asc())
+
+
+class epoch_seconds(FunctionElement):
+    """DATETIME → 1970-01-01 기준 초 (DB마다 다른 함수로 컴파일)"""
+    type = Float()
+    name = "epoch_seconds"
+    inherit_cache = True
+
+
+@compiles(epoch_seconds)
+def _epoch_seconds_default(element, compiler, **kw):
+    return f"EXTRACT(EPOCH FROM {compiler.process(element.clauses, **kw)})"
+
+
+@compiles(epoch_seconds, "mysql")
+def _epoch_seconds_mysql(element, compiler, **kw):
+    # UNIX_TIMESTAMP는 세션 시간대와 2038년 이후 값에 영향을 받으므로 고정 기준과의 차이로 계산
+    return f"TIMESTAMPDIFF(SECOND, '1970-01-01', {compiler.process(element.clauses, **kw)})"
+
+
+@compiles(epoch_seconds, "sqlite")
+def _epoch_seconds_sqlite(element, compiler, **kw):
+    # strftime('%s')보다 julianday가 문자열 파싱 비용이 적음
+    return f"((julianday({compiler.process(element.clauses, **kw)}) - 2440587.5) * 86400.0)"
+
+
+# 기간 혈당의 데이터 버전 - ix_glucose_member_measured 커버링 인덱스만 읽음 (id는 인덱스에 기본 키로 포함)
+# 건수/최대 id: 행 추가/삭제, 혈당 합계: 값 변경, 최근 수정 시각: 앱을 거친 모든 수정,
+# 측정 시각 × 혈당 합계: 시간만 바뀐 수정과 행 사이의 값 맞바꿈 (updated_at을 갱신하지 않는 직접 쓰기 포함)
+# result_cache의 캐시 항목 검증에 사용
+_GLUCOSE_VERSION_QUERY = select(
+    func.count(),
+    func.coalesce(func.sum(Glucose.glucose_mg_dl), 0),
+    func.max(Glucose.id),
+    func.max(Glucose.updated_at),
+    func.coalesce(func.sum(epoch_seconds(Glucose.measured_at) * Glucose.glucose_mg_dl), 0),
+).where(
+    Glucose.member_id == bindparam("member_id"),
+    Glucose.measured_at >= bindparam("start"),
+    Glucose.measured_at < bindparam("end")
+)
+
+
+def get_weekly_glucose_series(member_id: int, start_date: str, end_date: str) -> GlucoseSeries:
+    """주간 혈당 데이터를 컬럼형 시계열로 조회 (ORM 객체 없이 measured_at/glucose_mg_dl만 조회)
+    
+    기간이 보관 구간에 걸치면 압축 보관된 측정값을 함께 읽어 합칩니다.
+    결과는 데이터 버전과 함께 캐시하고, 버전이 같으면 범위 스캔 없이 캐시된 시계열을 반환합니다.
+    """
+    key = (member_id, start_date, end_date)
+    params = _period_params(member_id, start_date, end_date)
+    with session_scope(ROUTE_REPLICA) as db:
+        connection = db.connection()
+        archived_range = has_archived_glucose(db, member_id, start_date, end_date)
+        version = None
+        if glucose_series_cache.enabled:
+            # 버전을 데이터보다 먼저 읽어야 사이에 들어온 쓰기가 있어도 예전 버전으로 저장됨 (다음 조회에서 다시 읽음)
+            version = tuple(connection.execute(_GLUCOSE_VERSION_QUERY, params).one())
+            if archived_range:
+                version += tuple(connection.execute(_archive_version_statement(member_id, start_date, end_date)).one())
+            cached = glucose_series_cache.get(key, version)
+            if cached is not None:
+                return cached
+        rows = connection.execute(_WEEKLY_GLUCOSE_SERIES_QUERY, params).all()
+        archived = get_archived_glucose_series(db, member_id, start_date, end_date) if archived_range else None
+    series = GlucoseSeries.from_rows(rows)
+    series = archived.overlay(series) if archived is not None else series
+    if version is not None:
+        glucose_series_cache.put(key, version, series)
+    return series
+
+
+def _glucose_history_statement(member_id: int, start_date: str, end_date: str,
+                               after: Optional[Tuple[str, str, int]] = None, limit: Optional[int] = None):
+    """(date, time, id) 키셋 순서의 혈당 이력 쿼리 (after 다음 행부터)"""
+    stmt = select(Glucose.id, Glucose.date, Glucose.time, Glucose.glucose_mg_dl).where(
+        Glucose.member_id == member_id,
+        Glucose.date >= start_date,
+        Glucose.date <= end_date
+    )
+    if after is not None:
+        after_date, after_time, after_id = after
+        # 행 값 비교 대신 펼친 조건으로 작성 (MySQL/SQLite 모두 (member_id, date, time) 인덱스 범위 스캔)
+        stmt = stmt.where(or_(
+            Glucose.date > after_date,
+            and_(Glucose.date == after_date, or_(
+                Glucose.time > after_time,
+                and_(Glucose.time == after_time, Glucose.id > after_id)
+            ))
+        ))
+    stmt = stmt.order_by(Glucose.date.asc(), Glucose.time.asc(), Glucose.id.asc())
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    return stmt
+
+
+def iter_glucose_history(member_id: int, start_date: str, end_date: str,
+                         after: Optional[Tuple[str, str, int]] = None, limit: Optional[int] = None,
+                         batch_size: int = GLUCOSE_HISTORY_BATCH_SIZE) -> Iterator[GlucoseRow]:
+    """혈당 이력을 서버 측 커서로 batch_size행씩 읽어 순서대로 반환 (전체를 메모리에 올리지 않음)
+    
+    기간이 보관 구간에 걸치면 압축 보관된 측정값(id=0)을 (date, time) 순서로 병합하며,
+    같은 시각이 양쪽에 있으면 원본 행을 사용합니다.
+    """
+    hot = _iter_hot_glucose_history(member_id, start_date, end_date, after, limit, batch_size)
+    archive_start = max(start_date, after[0]) if after is not None else start_date
+    with session_scope(ROUTE_REPLICA) as db:
+        archived_range = has_archived_glucose(db, member_id, archive_start, end_date)
+    if not archived_range:
+        yield from hot
+        return
+    
+    archived = iter_archived_history(member_id, start_date, end_date, after)
     try:
-        readings = (
-            db.query(Glucose)
-            .filter(
-                Glucose.member_id == member_id,
-                Glucose.date >= start_date,
-                Glucose.date <= end_date
-            )
-            .order_by(Glucose.date.asc(), Glucose.time.asc())
-            .all()
-        )
-        return readings
+        previous = None
+        merged = heapq.merge(archived, hot, key=lambda row: (row.date, row.time, row.id))
+        for row in merged:
+            if previous is not None and (previous.date, previous.time) != (row.date, row.time):
+                yield previous
+            # 같은 시각이면 id가 큰 원본 행이 뒤에 오므로 마지막 행만 남김
+            previous = row
+        if previous is not None:
+            yield previous
     finally:
-        db.close()
+        archived.close()
+        hot.close()
 
 
-def save_quests_to_db(member_id, quests, date_str):
-    """퀘스트를 데이터베이스에 저장"""
-    try:
-        db = SessionLocal()
-        
-        # 기존 퀘스트가 있으면 삭제
-        existing_quests = db.query(Quest).filter(
-            Quest.member_id == member_id,
-            Quest.quest_date == date_str
-        ).all()
-        
-        if existing_quests:
-            for quest in existing_quests:
-                db.delete(quest)
-            db.commit()
-        
-        # 새 퀘스트 저장
-        for title, content in quests.items():
-            quest_type = "GLUCOSE" if "혈당" in title else "RECORD"
-            
-            quest = Quest(
-                member_id=member_id,
-                quest_type=quest_type,
-                quest_title=title,
-                quest_content=content,
-                quest_date=date_str
+def _iter_hot_glucose_history(member_id: int, start_date: str, end_date: str,
+                              after: Optional[Tuple[str, str, int]], limit: Optional[int],
+                              batch_size: int) -> Iterator[GlucoseRow]:
+    stmt = _glucose_history_statement(member_id, start_date, end_date, after, limit)
+    with session_scope(ROUTE_REPLICA, dedicated=True) as db:
+        result = db.execute(stmt, execution_options={"yield_per": batch_size})
+        for row_id, row_date, row_time, glucose_mg_dl in result:
+            yield GlucoseRow(row_id, row_date, row_time, glucose_mg_dl)
+
+
+def replace_quests_bulk(quests_by_member, date_str) -> int:
+    """여러 회원의 특정 날짜 퀘스트를 한 트랜잭션에서 일괄 교체
+    
+    DELETE 1회(member_id IN + quest_date)와 다중 행 INSERT 1회로 처리하며,
+    (member_id, quest_date, quest_title) 유니크 제약으로 중복 저장을 막습니다.
+    
+    Args:
+        quests_by_member: {member_id: {퀘스트 제목: 퀘스트 내용}}
+        date_str: 퀘스트 날짜 (YYYY-MM-DD)
+    
+    Returns:
+        저장된 퀘스트 수
+    """
+    if not quests_by_member:
+        return 0
+    
+    now = datetime.utcnow()
+    rows = [
+        {
+            "member_id": member_id,
+            "quest_type": "GLUCOSE" if "혈당" in title else "RECORD",
+            "quest_title": title,
+            "quest_content": content,
+            "quest_date": date_str,
+            "is_completed": False,
+            "approval_status": "pending",
+            "created_at": now,
+            "updated_at": now,
+        }
+        for member_id, quests in quests_by_member.items()
+        for title, content in quests.items()
+    ]
+    
+    with session_scope() as db:
+        try:
+            db.execute(
+                delete(Quest.__table__).where(
+                    Quest.member_id.in_(list(quests_by_member)),
+                    Quest.quest_date == date_str
+                )
             )
-            db.add(quest)
-        
-        db.commit()
-        print(f"퀘스트 저장 완료: {len(quests)}개")
-        
-    except Exception as e:
-        print(f"퀘스트 저장 오류: {e}")
-        db.rollback()
-    finally:
-        db.close()
+            if rows:
+                db.execute(insert(Quest.__table__).values(rows))
+            db.commit()
+        except Exception as e:
+            logger.error(f"퀘스트 일괄 저장 실패 (회원 {len(quests_by_member)}명, {date_str}): {e}")
+            raise
+    
+    return len(rows)
+
+
+def save_quests_to_db(member_id, quests, date_str):
+    """퀘스트를 데이터베이스에 저장 (기존 퀘스트는 교체)"""
+    saved_count = replace_quests_bulk({member_id: quests}, date_str)
+    logger.info(f"퀘스트 저장 완료: {saved_count}개")
+    return saved_count
+
+
+# 특정 날짜 퀘스트 (응답에 필요한 컬럼만)
+_QUESTS_BY_DATE_QUERY = select(
+    Quest.id, Quest.quest_title, Quest.quest_content, Quest.is_completed, Quest.approval_status
+).where(
+    Quest.member_id == bindparam("member_id"),
+    Quest.quest_date == bindparam("quest_date")
+).order_by(Quest.created_at.asc())
 
 
 def get_quests_by_date(member_id, date_str):
     """특정 날짜의 퀘스트 조회"""
     try:
-        db = SessionLocal()
-        
-        quests = db.query(Quest).filter(
-            Quest.member_id == member_id,
-            Quest.quest_date == date_str
-        ).order_by(Quest.created_at.asc()).all()
+        with session_scope() as db:
+            quests = db.execute(_QUESTS_BY_DATE_QUERY, {"member_id": member_id, "quest_date": date_str}).all()
         
         result = []
         completed_count = 0
@@ -143,127 +370,144 @@ def get_quests_by_date(member_id, date_str):
         
     except Exception as e:
         return {"error": str(e)}
-    finally:
-        db.close()
+
+
+_FOOD_DAY_QUERY = select(Food).where(
+    Food.member_id == bindparam("member_id"),
+    Food.measured_at >= bindparam("start"),
+    Food.measured_at < bindparam("end")
+).order_by(Food.measured_at.asc())
 
 
 def get_food_data(member_id: int, date: str):
     """음식 데이터 조회"""
-    db = SessionLocal()
-    try:
-        foods = (
-            db.query(Food)
-            .filter(Food.member_id == member_id, Food.date == date)
-            .order_by(Food.time.asc())
-            .all()
-        )
-        return foods
-    finally:
-        db.close()
+    with session_scope() as db:
+        return db.execute(_FOOD_DAY_QUERY, _day_params(member_id, date)).scalars().all()
+
+
+_EXERCISE_DAY_QUERY = select(Exercise).where(
+    Exercise.member_id == bindparam("member_id"),
+    Exercise.measured_at >= bindparam("start"),
+    Exercise.measured_at < bindparam("end")
+).order_by(Exercise.measured_at.asc(), Exercise.created_at.asc())
 
 
 def get_exercise_data(member_id: int, date: str):
     """운동 데이터 조회"""
-    db = SessionLocal()
-    try:
-        exercises = (
-            db.query(Exercise)
-            .filter(Exercise.member_id == member_id, Exercise.exercise_date == date)
-            .order_by(Exercise.created_at.asc())
-            .all()
+    with session_scope() as db:
+        return db.execute(_EXERCISE_DAY_QUERY, _day_params(member_id, date)).scalars().all()
+
+
+def _food_period_statement(member_id: int, start_date: str, end_date: str):
+    """기간별 음식 기록 쿼리"""
+    period_start, period_end = period_bounds(start_date, end_date)
+    return (
+        select(Food)
+        .where(
+            Food.member_id == member_id,
+            Food.measured_at >= period_start,
+            Food.measured_at < period_end
         )
-        return exercises
-    finally:
-        db.close()
+        .order_by(Food.measured_at.asc())
+    )
+
+
+def _exercise_period_statement(member_id: int, start_date: str, end_date: str):
+    """기간별 운동 기록 쿼리"""
+    period_start, period_end = period_bounds(start_date, end_date)
+    return (
+        select(Exercise)
+        .where(
+            Exercise.member_id == member_id,
+            Exercise.measured_at >= period_start,
+            Exercise.measured_at < period_end
+        )
+        .order_by(Exercise.measured_at.asc(), Exercise.created_at.asc())
+    )
 
 
 def get_food_data_by_period(member_id: int, start_date: str, end_date: str):
     """기간별 음식 데이터 조회"""
-    db = SessionLocal()
-    try:
-        foods = (
-            db.query(Food)
-            .filter(
-                Food.member_id == member_id,
-                Food.date >= start_date,
-                Food.date <= end_date
-            )
-            .order_by(Food.date.asc(), Food.time.asc())
-            .all()
-        )
-        return foods
-    finally:
-        db.close()
+    with session_scope(ROUTE_REPLICA) as db:
+        return db.execute(_food_period_statement(member_id, start_date, end_date)).scalars().all()
 
 
 def get_exercise_data_by_period(member_id: int, start_date: str, end_date: str):
     """기간별 운동 데이터 조회"""
-    db = SessionLocal()
-    try:
-        exercises = (
-            db.query(Exercise)
-            .filter(
-                Exercise.member_id == member_id,
-                Exercise.exercise_date >= start_date,
-                Exercise.exercise_date <= end_date
-            )
-            .order_by(Exercise.exercise_date.asc(), Exercise.created_at.asc())
-            .all()
-        )
-        return exercises
-    finally:
-        db.close()
+    with session_scope(ROUTE_REPLICA) as db:
+        return db.execute(_exercise_period_statement(member_id, start_date, end_date)).scalars().all()
+
+
+def _daily_bundle_statement(member_id: int, date: str):
+    """혈당/음식/운동을 구분 컬럼(kind)으로 묶은 UNION ALL 쿼리
+
+    컬럼: kind, id, date, time, measured_at, num1, num2, text1, text2, created_at
+    """
+    day_start, day_end = day_bounds(date)
+    glucose = select(
+        literal("G").label("kind"),
+        Glucose.id.label("id"),
+        Glucose.date.label("date"),
+        Glucose.time.label("time"),
+        Glucose.measured_at.label("measured_at"),
+        type_coerce(Glucose.glucose_mg_dl, Float).label("num1"),
+        type_coerce(null(), Float).label("num2"),
+        type_coerce(null(), String).label("text1"),
+        type_coerce(null(), String).label("text2"),
+        type_coerce(null(), DateTime).label("created_at"),
+    ).where(Glucose.member_id == member_id, Glucose.measured_at >= day_start, Glucose.measured_at < day_end)
+    
+    food = select(
+        literal("F"), Food.id, Food.date, Food.time, Food.measured_at,
+        Food.calories, Food.carbs, Food.name, Food.type,
+        null(),
+    ).where(Food.member_id == member_id, Food.measured_at >= day_start, Food.measured_at < day_end)
+    
+    exercise = select(
+        literal("E"), Exercise.id, Exercise.exercise_date, null(), Exercise.measured_at,
+        Exercise.exercise_duration, null(), Exercise.exercise_name, null(),
+        Exercise.created_at,
+    ).where(Exercise.member_id == member_id, Exercise.measured_at >= day_start, Exercise.measured_at < day_end)
+    
+    return union_all(glucose, food, exercise).order_by(
+        literal_column("kind"), literal_column("measured_at"), literal_column("created_at"), literal_column("id")
+    )
+
+
+def _daily_bundle_from_rows(rows) -> DailyBundle:
+    """UNION ALL 결과 행을 종류별 행 목록으로 분리"""
+    glucose_rows, food_rows, exercise_rows = [], [], []
+    for kind, row_id, row_date, row_time, measured_at, num1, num2, text1, text2, created_at in rows:
+        if kind == "G":
+            glucose_rows.append(GlucoseRow(row_id, row_date, row_time, num1, measured_at))
+        elif kind == "F":
+            food_rows.append(FoodRow(row_id, row_date, row_time, text1, text2, num1, num2, measured_at))
+        else:
+            duration = int(num1) if num1 is not None else None
+            exercise_rows.append(ExerciseRow(row_id, row_date, text1, duration, created_at, measured_at))
+    
+    return DailyBundle(glucose=glucose_rows, food=food_rows, exercise=exercise_rows)
+
+
+def get_daily_bundle(member_id: int, date: str) -> DailyBundle:
+    """특정 날짜의 혈당/음식/운동 데이터를 한 번의 왕복으로 조회"""
+    with session_scope(ROUTE_REPLICA) as db:
+        return _daily_bundle_from_rows(db.execute(_daily_bundle_statement(member_id, date)))
 
 
 def get_glucose_food_correlation(member_id: int, date: str):
     """특정 날짜의 혈당-음식 상관관계 데이터 조회"""
-    db = SessionLocal()
-    try:
-        # 해당 날짜의 모든 데이터 조회
-        glucose_data = (
-            db.query(Glucose)
-            .filter(Glucose.member_id == member_id, Glucose.date == date)
-            .order_by(Glucose.time.asc())
-            .all()
-        )
-        
-        food_data = (
-            db.query(Food)
-            .filter(Food.member_id == member_id, Food.date == date)
-            .order_by(Food.time.asc())
-            .all()
-        )
-        
-        return {
-            'glucose': glucose_data,
-            'food': food_data
-        }
-    finally:
-        db.close()
+    bundle = get_daily_bundle(member_id, date)
+    return {
+        'glucose': bundle.glucose,
+        'food': bundle.food
+    }
 
 
 def get_glucose_exercise_correlation(member_id: int, date: str):
     """특정 날짜의 혈당-운동 상관관계 데이터 조회"""
-    db = SessionLocal()
-    try:
-        # 해당 날짜의 모든 데이터 조회
-        glucose_data = (
-            db.query(Glucose)
-            .filter(Glucose.member_id == member_id, Glucose.date == date)
-            .order_by(Glucose.time.asc())
-            .all()
-        )
-        
-        exercise_data = (
-            db.query(Exercise)
-            .filter(Exercise.member_id == member_id, Exercise.exercise_date == date)
-            .order_by(Exercise.created_at.asc())
-            .all()
-        )
-        
-        return {
-            'glucose': glucose_data,
-            'exercise': exercise_data
-        }
-    finally:
-        db.close()
+    bundle = get_daily_bundle(member_id, date)
+    return {
+        'glucose': bundle.glucose,
+        'exercise': bundle.exercise
+    }
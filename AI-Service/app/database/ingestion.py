@@ -0,0 +1,129 @@
+"""CGM 측정값 일괄 적재
+
+(member_id, date, time) 유니크 인덱스(마이그레이션 0005)를 충돌 키로 dialect별 upsert를 실행합니다.
+    mysql  → INSERT ... ON DUPLICATE KEY UPDATE
+    sqlite → INSERT ... ON CONFLICT (member_id, date, time) DO UPDATE
+같은 시각에 다른 값이 다시 오면 마지막 값으로 갱신하고, 값이 같으면 쓰지 않습니다.
+문장은 한 번만 만들고 청크 단위 executemany로 실행합니다 (pymysql은 다중 행 INSERT로 재작성).
+"""
+
+import logging
+import os
+from datetime import datetime
+from typing import Dict, List, NamedTuple, Tuple
+
+from sqlalchemy import select
+
+from .database import session_scope
+from app.models.database_models import Glucose, combine_date_time
+
+logger = logging.getLogger(__name__)
+
+GLUCOSE_INGEST_CHUNK_SIZE = int(os.getenv("GLUCOSE_INGEST_CHUNK_SIZE", "500"))
+
+_UPSERT_KEY = ("member_id", "date", "time")
+
+
+class IngestResult(NamedTuple):
+    """일괄 적재 결과 (dates는 새로 들어오거나 값이 바뀐 날짜)"""
+    received: int
+    duplicates: int
+    inserted: int
+    updated: int
+    unchanged: int
+    dates: Tuple[str, ...]
+
+
+def _glucose_upsert_statement(dialect_name: str):
+    """dialect별 혈당 upsert 문 (executemany용)"""
+    table = Glucose.__table__
+    if dialect_name == "mysql":
+        from sqlalchemy.dialects.mysql import insert as mysql_insert
+        stmt = mysql_insert(table)
+        return stmt.on_duplicate_key_update(
+            glucose_mg_dl=stmt.inserted.glucose_mg_dl,
+            updated_at=stmt.inserted.updated_at,
+        )
+    if dialect_name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+        stmt = sqlite_insert(table)
+        return stmt.on_conflict_do_update(
+            index_elements=list(_UPSERT_KEY),
+            set_={"glucose_mg_dl": stmt.excluded.glucose_mg_dl, "updated_at": stmt.excluded.updated_at},
+        )
+    raise ValueError(f"혈당 upsert를 지원하지 않는 DB입니다: {dialect_name}")
+
+
+def ingest_glucose_readings(member_id: int, readings: List[Dict]) -> IngestResult:
+    """검증된 측정값을 한 트랜잭션에서 upsert
+
+    Args:
+        member_id: 회원 ID
+        readings: [{"date": "YYYY-MM-DD", "time": "HH:MM", "glucose_mg_dl": float}, ...]
+            (같은 시각이 여러 번 있으면 마지막 값 사용)
+
+    Returns:
+        IngestResult
+    """
+    latest = {}
+    for reading in readings:
+        latest[(reading["date"], reading["time"])] = reading["glucose_mg_dl"]
+    duplicates = len(readings) - len(latest)
+    if not latest:
+        return IngestResult(len(readings), duplicates, 0, 0, 0, ())
+
+    dates = sorted({date for date, _ in latest})
+    with session_scope() as db:
+        try:
+            # 기존 값과 비교해 신규/변경/동일 분류 (배치에 있는 날짜만 조회, 커버링 인덱스로 처리)
+            existing = {
+                (date, time): value
+                for date, time, value in db.execute(
+                    select(Glucose.date, Glucose.time, Glucose.glucose_mg_dl).where(
+                        Glucose.member_id == member_id,
+                        Glucose.date.in_(dates),
+                    )
+                )
+            }
+
+            now = datetime.utcnow()
+            rows = []
+            inserted = updated = 0
+            changed_dates = set()
+            for (date, time), value in latest.items():
+                if (date, time) in existing:
+                    if existing[(date, time)] == value:
+                        continue
+                    updated += 1
+                else:
+                    inserted += 1
+                changed_dates.add(date)
+                rows.append({
+                    "member_id": member_id,
+                    "date": date,
+                    "time": time,
+                    "measured_at": combine_date_time(date, time),
+                    "glucose_mg_dl": value,
+                    "created_at": now,
+                    "updated_at": now,
+                })
+
+            if rows:
+                stmt = _glucose_upsert_statement(db.get_bind().dialect.name)
+                for offset in range(0, len(rows), GLUCOSE_INGEST_CHUNK_SIZE):
+                    db.execute(stmt, rows[offset:offset + GLUCOSE_INGEST_CHUNK_SIZE])
+                db.commit()
+        except Exception as e:
+            logger.error(f"혈당 일괄 적재 실패 (회원 {member_id}, {len(latest)}건): {e}")
+            raise
+
+    result = IngestResult(
+        received=len(readings),
+        duplicates=duplicates,
+        inserted=inserted,
+        updated=updated,
+        unchanged=len(latest) - inserted - updated,
+        dates=tuple(sorted(changed_dates)),
+    )
+    logger.info(f"혈당 일괄 적재 (회원 {member_id}): 신규 {inserted}, 갱신 {updated}, 동일 {result.unchanged}")
+    return result
@@ -1,27 +1,126 @@
-"""데이터베이스 초기화"""
+"""데이터베이스 초기화
+
+스키마 생성/마이그레이션은 부팅 경로가 아닌 명시적 단계로 실행합니다.
+    flask init-db                                 # create_all + 미적용 마이그레이션 적용
+    python -m app.database.migrations upgrade     # 마이그레이션만 적용
+
+부팅 시 동작은 DB_INIT_ON_BOOT 환경 변수로 고릅니다.
+    off    (기본) DB에 접속하지 않고, 첫 커넥션에서 연결/마이그레이션 상태를 한 번 확인해 로그로 남김
+    check  부팅 시 SELECT 1로 연결만 확인 (실패하면 워커 기동 실패)
+    create 기존 동작 - 부팅 시 create_all + 연결 확인
+"""
+
+import logging
+import os
+import time
+from typing import List
+
+import click
+from sqlalchemy import event, text
 
-from sqlalchemy import text
 from .database import engine
+from .migrations import MIGRATIONS, upgrade
 from app.models.database_models import Base
-import logging
 
 logger = logging.getLogger(__name__)
 
+DB_INIT_MODES = ("off", "check", "create")
+DB_INIT_ON_BOOT = os.getenv("DB_INIT_ON_BOOT", "off").lower()
+
+_first_use_check_registered = False
+
+
+def create_schema(bind=engine) -> List[str]:
+    """테이블 생성 후 미적용 마이그레이션 적용 (적용한 버전 목록 반환)"""
+    Base.metadata.create_all(bind=bind)
+    return upgrade(bind)
+
+
+def check_connection(bind=engine) -> float:
+    """SELECT 1로 연결 확인 후 왕복 시간(ms) 반환"""
+    started = time.perf_counter()
+    with bind.connect() as connection:
+        connection.execute(text("SELECT 1")).fetchone()
+    return (time.perf_counter() - started) * 1000
+
+
+def _pending_migrations(dbapi_connection) -> List[str]:
+    """schema_migrations 기준 미적용 버전 목록 (테이블이 없으면 전부)"""
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute("SELECT version FROM schema_migrations")
+        applied = {row[0] for row in cursor.fetchall()}
+    except Exception:
+        applied = set()
+    finally:
+        cursor.close()
+        dbapi_connection.rollback()
+    return [migration.version for migration in MIGRATIONS if migration.version not in applied]
+
+
+def register_first_use_check(bind=engine):
+    """첫 커넥션이 열릴 때 서버 정보와 마이그레이션 상태를 한 번 로그로 남기는 리스너 등록
+
+    부팅 시 왕복 없이, 첫 요청에서 연결되면 확인합니다 (연결 실패는 해당 요청의 오류로 드러남).
+    """
+    global _first_use_check_registered
+    if _first_use_check_registered:
+        return
+    _first_use_check_registered = True
+
+    # first_connect는 dialect 초기화 전에 호출되어 서버 버전을 알 수 없으므로 connect(once)를 사용
+    @event.listens_for(bind, "connect", once=True)
+    def _on_first_connect(dbapi_connection, connection_record):
+        dialect = bind.dialect
+        version = ".".join(str(part) for part in dialect.server_version_info or ())
+        logger.info(f"데이터베이스 첫 연결: {dialect.name} {version}".rstrip())
+        try:
+            pending = _pending_migrations(dbapi_connection)
+        except Exception as e:
+            logger.warning(f"마이그레이션 상태 확인 실패: {e}")
+            return
+        if pending:
+            logger.warning(
+                f"미적용 마이그레이션: {', '.join(pending)} "
+                f"(flask init-db 또는 python -m app.database.migrations upgrade 실행 필요)"
+            )
+
+
+def init_db(mode: str = None):
+    """부팅 시 데이터베이스 초기화 (mode 기본값: DB_INIT_ON_BOOT)"""
+    mode = (mode or DB_INIT_ON_BOOT).lower()
+    if mode not in DB_INIT_MODES:
+        raise ValueError(f"지원하지 않는 DB_INIT_ON_BOOT 값: {mode} (지원: {', '.join(DB_INIT_MODES)})")
+
+    if mode == "off":
+        register_first_use_check()
+        logger.info("데이터베이스 초기화 생략 (첫 연결 시 확인)")
+        return
 
-def init_db():
-    """데이터베이스 초기화"""
     try:
-        # 테이블 생성
-        Base.metadata.create_all(bind=engine)
-        
+        if mode == "create":
+            # 테이블 생성
+            Base.metadata.create_all(bind=engine)
+
         # 데이터베이스 연결 테스트
-        with engine.connect() as connection:
-            result = connection.execute(text("SELECT 1"))
-            result.fetchone()
-        
-        logger.info("데이터베이스 초기화 완료")
-        
+        elapsed_ms = check_connection()
+        logger.info(f"데이터베이스 초기화 완료 ({mode}, 연결 확인 {elapsed_ms:.1f}ms)")
+
     except Exception as e:
         logger.error(f"데이터베이스 초기화 실패: {e}")
         raise
 
+
+def register_cli(app):
+    """flask init-db / flask check-db 명령 등록"""
+
+    @app.cli.command("init-db")
+    def init_db_command():
+        """테이블 생성 및 미적용 마이그레이션 적용"""
+        applied = create_schema()
+        click.echo(f"스키마 준비 완료 - 적용된 마이그레이션: {', '.join(applied) if applied else '없음 (최신 상태)'}")
+
+    @app.cli.command("check-db")
+    def check_db_command():
+        """데이터베이스 연결 확인"""
+        click.echo(f"연결 확인: {check_connection():.1f}ms")
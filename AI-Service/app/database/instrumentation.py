@@ -0,0 +1,163 @@
+"""SQLAlchemy 쿼리 계측 - 요청별 쿼리 수/시간, 정규화된 구문별 통계, 느린 쿼리 로그
+
+엔진의 before/after_cursor_execute 이벤트로 모든 쿼리 시간을 재고,
+요청(앱 컨텍스트)별 합계는 응답의 Server-Timing 헤더로, 프로세스 누적 통계는 /health/metrics로 노출합니다.
+"""
+
+import logging
+import os
+import re
+import threading
+import time
+from functools import lru_cache
+from typing import Any, Dict
+
+from flask import g, has_app_context
+from sqlalchemy import event
+
+from .database import engine, replica_engines
+
+logger = logging.getLogger(__name__)
+
+SLOW_QUERY_MS = float(os.getenv("DB_SLOW_QUERY_MS", "200"))
+# 한 요청에서 같은 구문이 이 횟수 이상 실행되면 N+1 의심 경고
+REPEATED_QUERY_WARN = int(os.getenv("DB_REPEATED_QUERY_WARN", "10"))
+# 누적 통계에 보관할 최대 구문 수 (초과분은 "<other>"로 합산)
+MAX_TRACKED_STATEMENTS = 500
+
+_stats_lock = threading.Lock()
+_statement_stats: Dict[str, Dict[str, float]] = {}
+_totals = {"queries": 0, "total_ms": 0.0, "slow_queries": 0}
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER_LIST = re.compile(r"\(\s*(?:\?|%s|:\w+)(?:\s*,\s*(?:\?|%s|:\w+))+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=1024)
+def normalize_statement(statement: str) -> str:
+    """리터럴/IN 목록 길이 차이를 없앤 구문 (통계 집계 키)"""
+    normalized = _STRING_LITERAL.sub("?", statement)
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    normalized = _PLACEHOLDER_LIST.sub("(?, ...)", normalized)
+    return _WHITESPACE.sub(" ", normalized).strip()
+
+
+def _redact_parameters(parameters, executemany: bool) -> str:
+    """값은 숨기고 구조(키, 개수)만 남긴 파라미터 표현"""
+    if executemany:
+        return f"<{len(parameters)}행 일괄 실행>"
+    if isinstance(parameters, dict):
+        return "{" + ", ".join(f"{key}: ***" for key in parameters) + "}"
+    if isinstance(parameters, (list, tuple)):
+        return f"<{len(parameters)}개 값>"
+    return "<없음>"
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    # 연결 공용 스택 대신 실행 컨텍스트에 기록 (예외로 끝난 쿼리의 시작 시각이 다음 쿼리에 섞이지 않음)
+    context._query_start_time = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = context._query_start_time
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    normalized = normalize_statement(statement)
+
+    with _stats_lock:
+        key = normalized
+        if key not in _statement_stats and len(_statement_stats) >= MAX_TRACKED_STATEMENTS:
+            key = "<other>"
+        stats = _statement_stats.setdefault(key, {"count": 0, "total_ms": 0.0, "max_ms": 0.0})
+        stats["count"] += 1
+        stats["total_ms"] += elapsed_ms
+        stats["max_ms"] = max(stats["max_ms"], elapsed_ms)
+        _totals["queries"] += 1
+        _totals["total_ms"] += elapsed_ms
+        if elapsed_ms >= SLOW_QUERY_MS:
+            _totals["slow_queries"] += 1
+
+    if elapsed_ms >= SLOW_QUERY_MS:
+        logger.warning(
+            f"느린 쿼리 {elapsed_ms:.1f}ms: {normalized} "
+            f"파라미터: {_redact_parameters(parameters, executemany)}"
+        )
+
+    if has_app_context():
+        g._db_query_count = g.get("_db_query_count", 0) + 1
+        g._db_query_ms = g.get("_db_query_ms", 0.0) + elapsed_ms
+        request_statements = g.get("_db_query_statements")
+        if request_statements is None:
+            request_statements = g._db_query_statements = {}
+        request_statements[normalized] = request_statements.get(normalized, 0) + 1
+
+
+def instrument_engine(target_engine):
+    """엔진에 쿼리 계측 리스너 등록 (중복 등록 방지)"""
+    if not event.contains(target_engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(target_engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(target_engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def get_request_query_stats() -> Dict[str, Any]:
+    """현재 요청의 쿼리 수/시간"""
+    if not has_app_context():
+        return {"count": 0, "total_ms": 0.0}
+    return {"count": g.get("_db_query_count", 0), "total_ms": round(g.get("_db_query_ms", 0.0), 2)}
+
+
+def get_query_stats(top: int = 20) -> Dict[str, Any]:
+    """프로세스 누적 쿼리 통계 (총 시간 기준 상위 구문 포함)"""
+    with _stats_lock:
+        totals = dict(_totals)
+        statements = sorted(_statement_stats.items(), key=lambda item: item[1]["total_ms"], reverse=True)[:top]
+
+    return {
+        "queries": totals["queries"],
+        "total_ms": round(totals["total_ms"], 2),
+        "slow_queries": totals["slow_queries"],
+        "slow_query_threshold_ms": SLOW_QUERY_MS,
+        "top_statements": [
+            {
+                "statement": statement,
+                "count": stats["count"],
+                "total_ms": round(stats["total_ms"], 2),
+                "avg_ms": round(stats["total_ms"] / stats["count"], 2),
+                "max_ms": round(stats["max_ms"], 2),
+            }
+            for statement, stats in statements
+        ],
+    }
+
+
+def reset_query_stats():
+    """누적 통계 초기화"""
+    with _stats_lock:
+        _statement_stats.clear()
+        _totals.update(queries=0, total_ms=0.0, slow_queries=0)
+
+
+def _add_server_timing(response):
+    """응답에 요청 DB 시간 Server-Timing 헤더 추가 및 반복 쿼리 경고"""
+    count = g.pop("_db_query_count", 0)
+    total_ms = g.pop("_db_query_ms", 0.0)
+    statements = g.pop("_db_query_statements", {})
+    if not count:
+        return response
+
+    timing = f'db;dur={total_ms:.2f};desc="{count} queries"'
+    existing = response.headers.get("Server-Timing")
+    response.headers["Server-Timing"] = f"{existing}, {timing}" if existing else timing
+
+    for statement, repeated in statements.items():
+        if repeated >= REPEATED_QUERY_WARN:
+            logger.warning(f"한 요청에서 같은 쿼리 {repeated}회 실행 (N+1 의심): {statement}")
+    return response
+
+
+def init_query_instrumentation(app):
+    """엔진 계측 리스너와 Server-Timing 응답 훅 등록"""
+    for target_engine in [engine] + replica_engines:
+        instrument_engine(target_engine)
+    app.after_request(_add_server_timing)
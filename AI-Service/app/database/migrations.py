@@ -0,0 +1,427 @@
+"""버전 관리되는 스키마 마이그레이션
+
+사용법:
+    python -m app.database.migrations upgrade   # 미적용 마이그레이션 적용
+    python -m app.database.migrations status    # 적용 현황 출력
+    python -m app.database.migrations verify    # 핫 쿼리 EXPLAIN 검사 (인덱스 미사용 시 종료 코드 1)
+    python -m app.database.migrations backfill  # measured_at이 비어 있는 행 채우기
+
+적용된 버전은 schema_migrations 테이블에 기록됩니다. 새 설치는 flask init-db(create_schema)가
+create_all로 모델에 선언된 인덱스를 만든 뒤 upgrade로 트리거 등을 채우고, 기존 DB는 upgrade로 같은 상태를 맞춥니다.
+마이그레이션 함수는 커넥션을 받아 필요하면 중간에 직접 커밋할 수 있습니다 (대량 백필 등).
+"""
+
+import argparse
+import logging
+import os
+import sys
+from datetime import datetime
+from typing import Callable, Dict, List, NamedTuple
+
+from sqlalchemy import Column, DateTime, Index, MetaData, String, Table, inspect, select, text
+
+from .database import engine
+from app.models.database_models import (
+    Glucose, Food, Exercise, Quest, GlucoseDailyRollup, GlucoseHourlyRollup, GlucoseArchive, EXERCISE_ASSUMED_TIME
+)
+
+BACKFILL_BATCH_SIZE = int(os.getenv("DB_BACKFILL_BATCH_SIZE", "5000"))
+
+# measured_at을 계산하는 원본 컬럼 (테이블명 → (날짜 컬럼, 시간 컬럼)); 시간 컬럼이 없으면 고정 시간 사용
+MEASURED_AT_SOURCES = {
+    "glucose": ("date", "time"),
+    "food": ("date", "time"),
+    "exercise": ("exercise_date", None),
+}
+
+logger = logging.getLogger(__name__)
+
+schema_migrations = Table(
+    "schema_migrations",
+    MetaData(),
+    Column("version", String(64), primary_key=True),
+    Column("description", String(255)),
+    Column("applied_at", DateTime, nullable=False),
+)
+
+
+class Migration(NamedTuple):
+    """마이그레이션 한 단계"""
+    version: str
+    description: str
+    upgrade: Callable
+
+
+def _model_index(model, name: str) -> Index:
+    """모델 __table_args__에 선언된 인덱스 조회"""
+    for index in model.__table__.indexes:
+        if index.name == name:
+            return index
+    raise KeyError(f"{model.__tablename__}에 {name} 인덱스가 선언되어 있지 않습니다")
+
+
+def _create_index_if_missing(connection, index: Index):
+    """인덱스가 없을 때만 생성 (테이블이 아직 없으면 create_all에 맡김)"""
+    inspector = inspect(connection)
+    table_name = index.table.name
+    if not inspector.has_table(table_name):
+        logger.info(f"{table_name} 테이블이 없어 {index.name} 생성을 건너뜁니다")
+        return
+    if index.name in {existing["name"] for existing in inspector.get_indexes(table_name)}:
+        return
+    index.create(bind=connection)
+    logger.info(f"인덱스 생성: {table_name}.{index.name}")
+
+
+def _0001_composite_indexes(connection):
+    for model, name in (
+        (Glucose, "ix_glucose_member_date_time"),
+        (Food, "ix_food_member_date_time"),
+        (Exercise, "ix_exercise_member_date_created"),
+        (Quest, "ix_quest_member_date_created"),
+    ):
+        _create_index_if_missing(connection, _model_index(model, name))
+
+
+def _measured_at_sql(dialect_name: str, table: str, prefix: str = "") -> str:
+    """dialect별 date/time → DATETIME 변환식"""
+    date_column, time_column = MEASURED_AT_SOURCES[table]
+    date_expr = f"{prefix}{date_column}"
+    time_expr = f"{prefix}{time_column}" if time_column else f"'{EXERCISE_ASSUMED_TIME}'"
+    if dialect_name == "mysql":
+        return f"TIMESTAMP({date_expr}, {time_expr})"
+    if dialect_name == "sqlite":
+        # SQLAlchemy의 SQLite DATETIME 저장 형식(YYYY-MM-DD HH:MM:SS.ffffff)과 맞춰야 바운드 값과 문자열 비교가 맞음
+        return f"datetime({date_expr} || ' ' || {time_expr}) || '.000000'"
+    raise ValueError(f"measured_at 변환을 지원하지 않는 DB입니다: {dialect_name}")
+
+
+def _measured_at_trigger_statements(dialect_name: str, table: str) -> List[str]:
+    """measured_at을 쓰기 시 유지하는 트리거 DDL (Spring 서비스 등 ORM 밖의 쓰기까지 처리)"""
+    expression = _measured_at_sql(dialect_name, table, "NEW.")
+    source_columns = ", ".join(column for column in MEASURED_AT_SOURCES[table] if column)
+    statements = []
+    for suffix, timing in (("ins", "INSERT"), ("upd", "UPDATE")):
+        name = f"trg_{table}_measured_at_{suffix}"
+        statements.append(f"DROP TRIGGER IF EXISTS {name}")
+        if dialect_name == "mysql":
+            statements.append(
+                f"CREATE TRIGGER {name} BEFORE {timing} ON {table} "
+                f"FOR EACH ROW SET NEW.measured_at = {expression}"
+            )
+        else:
+            watched = f" OF {source_columns}" if timing == "UPDATE" else ""
+            statements.append(
+                f"CREATE TRIGGER {name} AFTER {timing}{watched} ON {table} "
+                f"BEGIN UPDATE {table} SET measured_at = {expression} WHERE id = NEW.id; END"
+            )
+    return statements
+
+
+def _backfill_table(connection, table: str, batch_size: int = BACKFILL_BATCH_SIZE) -> int:
+    """measured_at이 NULL인 행을 id 구간 단위로 채우고 구간마다 커밋"""
+    expression = _measured_at_sql(connection.dialect.name, table)
+    bounds = connection.execute(
+        text(f"SELECT MIN(id), MAX(id) FROM {table} WHERE measured_at IS NULL")
+    ).one()
+    connection.commit()
+    if bounds[0] is None:
+        return 0
+
+    updated = 0
+    low, high = bounds
+    while low <= high:
+        result = connection.execute(
+            text(f"UPDATE {table} SET measured_at = {expression} "
+                 f"WHERE measured_at IS NULL AND id >= :low AND id < :high"),
+            {"low": low, "high": low + batch_size}
+        )
+        connection.commit()
+        updated += result.rowcount or 0
+        low += batch_size
+    logger.info(f"{table}.measured_at 백필: {updated}행")
+    return updated
+
+
+def _0002_measured_at(connection):
+    inspector = inspect(connection)
+    dialect_name = connection.dialect.name
+    for model, index_name in (
+        (Glucose, "ix_glucose_member_measured"),
+        (Food, "ix_food_member_measured"),
+        (Exercise, "ix_exercise_member_measured"),
+    ):
+        table = model.__tablename__
+        if not inspector.has_table(table):
+            continue
+        if "measured_at" not in {column["name"] for column in inspector.get_columns(table)}:
+            connection.execute(text(f"ALTER TABLE {table} ADD COLUMN measured_at DATETIME NULL"))
+        # 트리거를 먼저 만들어 백필 도중 들어오는 쓰기도 채워지도록 함
+        for statement in _measured_at_trigger_statements(dialect_name, table):
+            connection.execute(text(statement))
+        connection.commit()
+        _backfill_table(connection, table)
+        _create_index_if_missing(connection, _model_index(model, index_name))
+        connection.commit()
+
+
+def _0003_quest_unique_title(connection):
+    if not inspect(connection).has_table("quest"):
+        return
+    # 기존 중복 퀘스트는 가장 먼저 저장된 행만 남김
+    result = connection.execute(text(
+        "DELETE FROM quest WHERE id NOT IN ("
+        "SELECT keep_id FROM (SELECT MIN(id) AS keep_id FROM quest "
+        "GROUP BY member_id, quest_date, quest_title) AS keep_rows)"
+    ))
+    if result.rowcount:
+        logger.info(f"중복 퀘스트 {result.rowcount}건 삭제")
+    connection.commit()
+    _create_index_if_missing(connection, _model_index(Quest, "uq_quest_member_date_title"))
+
+
+def _0004_glucose_daily_rollup(connection):
+    # 롤업 채우기는 시간이 걸릴 수 있어 별도 명령으로 실행 (python -m app.database.rollups catch-up)
+    GlucoseDailyRollup.__table__.create(bind=connection, checkfirst=True)
+    connection.commit()
+
+
+def _0005_glucose_unique_reading(connection):
+    if not inspect(connection).has_table("glucose"):
+        return
+    # 같은 (member_id, date, time) 중복 측정값은 가장 나중에 저장된 행만 남김
+    result = connection.execute(text(
+        "DELETE FROM glucose WHERE id IN ("
+        "SELECT id FROM (SELECT older.id FROM glucose older JOIN glucose newer "
+        "ON newer.member_id = older.member_id AND newer.date = older.date "
+        "AND newer.time = older.time AND newer.id > older.id) AS duplicate_rows)"
+    ))
+    if result.rowcount:
+        logger.info(f"중복 혈당 측정값 {result.rowcount}건 삭제")
+    connection.commit()
+    _create_index_if_missing(connection, _model_index(Glucose, "uq_glucose_member_date_time"))
+
+
+def _0006_glucose_archive(connection):
+    # 보관 처리는 별도 명령으로 실행 (python -m app.database.archival run)
+    GlucoseHourlyRollup.__table__.create(bind=connection, checkfirst=True)
+    GlucoseArchive.__table__.create(bind=connection, checkfirst=True)
+    connection.commit()
+
+
+def _0007_sqlite_measured_at_format(connection):
+    # 0002의 SQLite 트리거/백필이 소수점 없는 형식으로 저장해 하루 경계 비교가 어긋나던 문제 수정
+    if connection.dialect.name != "sqlite":
+        return
+    inspector = inspect(connection)
+    for table in MEASURED_AT_SOURCES:
+        if not inspector.has_table(table):
+            continue
+        if "measured_at" not in {column["name"] for column in inspector.get_columns(table)}:
+            continue
+        for statement in _measured_at_trigger_statements("sqlite", table):
+            connection.execute(text(statement))
+        result = connection.execute(text(
+            f"UPDATE {table} SET measured_at = measured_at || '.000000' WHERE length(measured_at) = 19"
+        ))
+        if result.rowcount:
+            logger.info(f"{table}.measured_at 형식 정규화: {result.rowcount}행")
+        connection.commit()
+
+
+def _0008_glucose_archive_date_index(connection):
+    # 조회가 보관 기준일 대신 실제 압축 행으로 보관분을 판단하면서 롤업 갱신이 날짜 범위로 압축 행을 조회
+    _create_index_if_missing(connection, _model_index(GlucoseArchive, "ix_glucose_archive_date"))
+
+
+def _0009_glucose_measured_index_updated_at(connection):
+    # 결과 캐시 버전 쿼리가 max(updated_at)을 읽으므로 커버링 인덱스에 updated_at 추가 (컬럼이 다르면 다시 생성)
+    index = _model_index(Glucose, "ix_glucose_member_measured")
+    inspector = inspect(connection)
+    if not inspector.has_table("glucose"):
+        return
+    for existing in inspector.get_indexes("glucose"):
+        if existing["name"] == index.name and existing["column_names"] != [column.name for column in index.columns]:
+            index.drop(bind=connection)
+            logger.info(f"인덱스 삭제: glucose.{index.name} (컬럼 변경)")
+    _create_index_if_missing(connection, index)
+    connection.commit()
+
+
+MIGRATIONS: List[Migration] = [
+    Migration("0001", "핫 쿼리용 복합 커버링 인덱스", _0001_composite_indexes),
+    Migration("0002", "measured_at 컬럼, 유지 트리거, 백필, 인덱스", _0002_measured_at),
+    Migration("0003", "퀘스트 (member_id, quest_date, quest_title) 유니크 인덱스", _0003_quest_unique_title),
+    Migration("0004", "일일 혈당 롤업 테이블", _0004_glucose_daily_rollup),
+    Migration("0005", "혈당 (member_id, date, time) 유니크 인덱스", _0005_glucose_unique_reading),
+    Migration("0006", "시간대별 혈당 롤업 및 원본 보관 테이블", _0006_glucose_archive),
+    Migration("0007", "SQLite measured_at 저장 형식 정규화", _0007_sqlite_measured_at_format),
+    Migration("0008", "보관 테이블 날짜 인덱스", _0008_glucose_archive_date_index),
+    Migration("0009", "혈당 measured_at 커버링 인덱스에 updated_at 추가", _0009_glucose_measured_index_updated_at),
+]
+
+
+def applied_versions(bind=engine) -> Dict[str, datetime]:
+    """적용된 마이그레이션 버전과 적용 시각"""
+    schema_migrations.create(bind=bind, checkfirst=True)
+    with bind.connect() as connection:
+        rows = connection.execute(select(schema_migrations.c.version, schema_migrations.c.applied_at))
+        return {version: applied_at for version, applied_at in rows}
+
+
+def upgrade(bind=engine) -> List[str]:
+    """미적용 마이그레이션을 순서대로 적용하고 적용한 버전 목록 반환"""
+    applied = applied_versions(bind)
+    newly_applied = []
+    for migration in MIGRATIONS:
+        if migration.version in applied:
+            continue
+        with bind.connect() as connection:
+            try:
+                migration.upgrade(connection)
+                connection.execute(schema_migrations.insert().values(
+                    version=migration.version,
+                    description=migration.description,
+                    applied_at=datetime.utcnow()
+                ))
+                connection.commit()
+            except Exception as e:
+                connection.rollback()
+                logger.error(f"마이그레이션 {migration.version} 실패: {e}")
+                raise
+        logger.info(f"마이그레이션 적용: {migration.version} {migration.description}")
+        newly_applied.append(migration.version)
+    return newly_applied
+
+
+def backfill_measured_at(bind=engine, batch_size: int = BACKFILL_BATCH_SIZE) -> Dict[str, int]:
+    """measured_at이 비어 있는 행 백필 (테이블별 갱신 행 수 반환)"""
+    report = {}
+    with bind.connect() as connection:
+        for table in MEASURED_AT_SOURCES:
+            if inspect(connection).has_table(table):
+                report[table] = _backfill_table(connection, table, batch_size)
+    return report
+
+
+def status(bind=engine) -> List[Dict[str, str]]:
+    """마이그레이션별 적용 현황"""
+    applied = applied_versions(bind)
+    return [
+        {
+            "version": migration.version,
+            "description": migration.description,
+            "applied_at": applied[migration.version].isoformat() if migration.version in applied else None,
+        }
+        for migration in MIGRATIONS
+    ]
+
+
+def hot_query_statements(member_id: int = 1, date: str = "2025-09-01",
+                         start_date: str = "2025-08-26", end_date: str = "2025-09-01") -> Dict[str, object]:
+    """조회 함수가 실제로 실행하는 문장에 예시 바인드 값을 채운 목록 (EXPLAIN 검사용)"""
+    from .database_utils import (
+        _EXERCISE_DAY_QUERY, _FOOD_DAY_QUERY, _GLUCOSE_DAY_QUERY, _GLUCOSE_VERSION_QUERY, _MEMBER_INFO_QUERY,
+        _QUESTS_BY_DATE_QUERY, _WEEKLY_GLUCOSE_SERIES_QUERY, _daily_bundle_statement, _day_params,
+        _exercise_period_statement, _food_period_statement, _glucose_history_statement, _period_params,
+        _weekly_glucose_statement
+    )
+    from .rollups import _aggregate_statement, _raw_day_versions_statement
+
+    day_params = _day_params(member_id, date)
+    period_params = _period_params(member_id, start_date, end_date)
+    return {
+        "get_member_info": _MEMBER_INFO_QUERY.params(member_id=member_id),
+        "get_glucose_data": _GLUCOSE_DAY_QUERY.params(**day_params),
+        "get_weekly_glucose_data": _weekly_glucose_statement(member_id, start_date, end_date),
+        "get_weekly_glucose_series": _WEEKLY_GLUCOSE_SERIES_QUERY.params(**period_params),
+        "get_weekly_glucose_series_version": _GLUCOSE_VERSION_QUERY.params(**period_params),
+        "iter_glucose_history": _glucose_history_statement(member_id, start_date, end_date, limit=1000),
+        "iter_glucose_history_next_page": _glucose_history_statement(
+            member_id, start_date, end_date, after=(date, "08:00", 1), limit=1000
+        ),
+        "get_glucose_range_aggregate": _aggregate_statement(start_date, end_date, [member_id], [date]),
+        "get_glucose_range_aggregate_day_versions": _raw_day_versions_statement(member_id, start_date, end_date),
+        "get_food_data": _FOOD_DAY_QUERY.params(**day_params),
+        "get_food_data_by_period": _food_period_statement(member_id, start_date, end_date),
+        "get_exercise_data": _EXERCISE_DAY_QUERY.params(**day_params),
+        "get_exercise_data_by_period": _exercise_period_statement(member_id, start_date, end_date),
+        "get_quests_by_date": _QUESTS_BY_DATE_QUERY.params(member_id=member_id, quest_date=date),
+        # 묶음 조회의 최종 정렬은 합친 결과에 대해 수행되므로 각 분기의 인덱스 사용만 의미가 있음
+        "get_daily_bundle": _daily_bundle_statement(member_id, date).order_by(None),
+    }
+
+
+def _explain_mysql(connection, sql: str) -> List[str]:
+    problems = []
+    for row in connection.exec_driver_sql(f"EXPLAIN {sql}").mappings():
+        table = row.get("table") or ""
+        extra = row.get("Extra") or ""
+        if table.startswith("<") or "no matching row" in extra or "Impossible WHERE" in extra:
+            continue
+        if row.get("key") is None or row.get("type") not in ("const", "eq_ref", "ref", "range"):
+            problems.append(f"{table}: 인덱스 범위 스캔이 아닙니다 (type={row.get('type')}, key={row.get('key')})")
+        if "Using filesort" in extra:
+            problems.append(f"{table}: filesort 발생 ({extra})")
+    return problems
+
+
+def _explain_sqlite(connection, sql: str) -> List[str]:
+    problems = []
+    for row in connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}"):
+        detail = row[-1]
+        if detail.startswith("SCAN") and "USING" not in detail:
+            problems.append(f"전체 스캔: {detail}")
+        if "TEMP B-TREE FOR ORDER BY" in detail:
+            problems.append(f"정렬용 임시 B-트리 사용: {detail}")
+    return problems
+
+
+def verify(bind=engine) -> Dict[str, List[str]]:
+    """핫 쿼리별 EXPLAIN 결과에서 인덱스 미사용/filesort 문제 목록 반환"""
+    explainers = {"mysql": _explain_mysql, "sqlite": _explain_sqlite}
+    explain = explainers.get(bind.dialect.name)
+    if explain is None:
+        raise ValueError(f"EXPLAIN 검사를 지원하지 않는 DB입니다: {bind.dialect.name}")
+
+    report = {}
+    with bind.connect() as connection:
+        for name, statement in hot_query_statements().items():
+            sql = str(statement.compile(dialect=bind.dialect, compile_kwargs={"literal_binds": True}))
+            report[name] = explain(connection, sql)
+    return report
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="스키마 마이그레이션")
+    parser.add_argument("command", choices=["upgrade", "status", "verify", "backfill"])
+    args = parser.parse_args(argv)
+
+    if args.command == "upgrade":
+        applied = upgrade()
+        print(f"적용된 마이그레이션: {', '.join(applied) if applied else '없음 (최신 상태)'}")
+        return 0
+
+    if args.command == "backfill":
+        for table, updated in backfill_measured_at().items():
+            print(f"{table}: {updated}행 백필")
+        return 0
+
+    if args.command == "status":
+        for item in status():
+            print(f"{item['version']}  {item['applied_at'] or '미적용':<26}  {item['description']}")
+        return 0
+
+    exit_code = 0
+    for name, problems in verify().items():
+        if problems:
+            exit_code = 1
+            for problem in problems:
+                print(f"[FAIL] {name}: {problem}", file=sys.stderr)
+        else:
+            print(f"[OK] {name}")
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
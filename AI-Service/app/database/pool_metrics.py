@@ -0,0 +1,157 @@
+"""커넥션 풀 텔레메트리 - 체크아웃 대기 시간/사용 중 커넥션/오버플로우 히스토그램, 풀 고갈, pre-ping 실패
+
+풀 대기 시간은 SQLAlchemy 이벤트로 잴 수 없어 QueuePool._do_get을 감싼 TimedQueuePool로 측정합니다.
+"""
+
+import bisect
+import logging
+import threading
+import time
+from typing import Dict, List, Sequence
+
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+logger = logging.getLogger(__name__)
+
+# 히스토그램 버킷 상한 (마지막 버킷은 +Inf)
+WAIT_MS_BUCKETS = (0.1, 0.5, 1, 5, 10, 50, 100, 500, 1000, 5000)
+CONNECTION_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 30, 50, 100)
+
+
+class Histogram:
+    """고정 버킷 히스토그램 (버킷별 누적이 아닌 개별 카운트 + 합계)"""
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.total += value
+        self.count += 1
+
+    def snapshot(self) -> Dict:
+        labels = [f"le_{bucket}" for bucket in self.buckets] + ["le_inf"]
+        return {
+            "buckets": dict(zip(labels, self.counts)),
+            "count": self.count,
+            "avg": round(self.total / self.count, 3) if self.count else 0,
+        }
+
+
+class PoolTelemetry:
+    """엔진(풀) 하나의 텔레메트리"""
+
+    def __init__(self, label: str, engine):
+        self.label = label
+        self.engine = engine
+        self.lock = threading.Lock()
+        self.wait_ms = Histogram(WAIT_MS_BUCKETS)
+        self.checked_out = Histogram(CONNECTION_COUNT_BUCKETS)
+        self.overflow = Histogram(CONNECTION_COUNT_BUCKETS)
+        self.max_wait_ms = 0.0
+        self.timeouts = 0
+        self.pre_ping_failures = 0
+        self.invalidations = 0
+
+    def record_wait(self, elapsed_ms: float, timed_out: bool):
+        with self.lock:
+            self.wait_ms.observe(elapsed_ms)
+            self.max_wait_ms = max(self.max_wait_ms, elapsed_ms)
+            if timed_out:
+                self.timeouts += 1
+
+    def record_checkout(self, pool):
+        with self.lock:
+            self.checked_out.observe(pool.checkedout())
+            self.overflow.observe(max(pool.overflow(), 0))
+
+    def snapshot(self) -> Dict:
+        pool = self.engine.pool
+        with self.lock:
+            stats = {
+                "wait_ms": self.wait_ms.snapshot(),
+                "max_wait_ms": round(self.max_wait_ms, 3),
+                "checked_out_at_checkout": self.checked_out.snapshot(),
+                "overflow_at_checkout": self.overflow.snapshot(),
+                "timeouts": self.timeouts,
+                "pre_ping_failures": self.pre_ping_failures,
+                "invalidations": self.invalidations,
+            }
+        if isinstance(pool, QueuePool):
+            stats.update(
+                pool_size=pool.size(),
+                checked_out=pool.checkedout(),
+                overflow=max(pool.overflow(), 0),
+                max_overflow=pool._max_overflow,
+            )
+        return stats
+
+
+_telemetry: Dict[int, PoolTelemetry] = {}
+
+
+class TimedQueuePool(QueuePool):
+    """체크아웃 대기 시간과 풀 고갈(타임아웃)을 기록하는 QueuePool"""
+
+    def _do_get(self):
+        start = time.perf_counter()
+        timed_out = False
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            timed_out = True
+            raise
+        finally:
+            telemetry = _telemetry.get(id(self))
+            if telemetry is not None:
+                telemetry.record_wait((time.perf_counter() - start) * 1000, timed_out)
+                if timed_out:
+                    logger.warning(f"커넥션 풀 고갈 ({telemetry.label}): {self.timeout()}초 내 커넥션을 얻지 못함")
+
+    def recreate(self):
+        # dispose() 후 새 풀도 같은 텔레메트리에 기록
+        new_pool = super().recreate()
+        if id(self) in _telemetry:
+            _telemetry[id(new_pool)] = _telemetry[id(self)]
+        return new_pool
+
+
+def instrument_pool(engine, label: str) -> PoolTelemetry:
+    """엔진 풀에 텔레메트리 리스너 등록"""
+    telemetry = PoolTelemetry(label, engine)
+    _telemetry[id(engine.pool)] = telemetry
+
+    @event.listens_for(engine, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        telemetry.record_checkout(engine.pool)
+
+    @event.listens_for(engine, "invalidate")
+    def _on_invalidate(dbapi_connection, connection_record, exception):
+        with telemetry.lock:
+            telemetry.invalidations += 1
+
+    @event.listens_for(engine, "handle_error")
+    def _on_error(context):
+        if getattr(context, "is_pre_ping", False):
+            with telemetry.lock:
+                telemetry.pre_ping_failures += 1
+            logger.warning(f"커넥션 pre-ping 실패 ({label}): {context.original_exception}")
+
+    return telemetry
+
+
+def get_pool_stats() -> List[Dict]:
+    """등록된 모든 풀의 텔레메트리 (같은 엔진이 재생성된 풀은 한 번만)"""
+    seen = set()
+    stats = []
+    for telemetry in _telemetry.values():
+        if id(telemetry) in seen:
+            continue
+        seen.add(id(telemetry))
+        stats.append(dict(label=telemetry.label, **telemetry.snapshot()))
+    return stats
@@ -0,0 +1,122 @@
+"""기간 혈당 시계열 결과 캐시
+
+(member_id, 시작일, 종료일) → GlucoseSeries를 데이터 버전과 함께 보관합니다 (LRU 방식으로 최대 크기 유지).
+조회 시 커버링 인덱스만 읽는 가벼운 버전 쿼리(건수, 혈당 합계, 최대 id, 최근 수정 시각,
+측정 시각 가중 합계)를 먼저 실행하고, 버전이 같으면 전체 범위 스캔과 시계열 변환 없이 캐시된 시계열을 돌려줍니다.
+워커 프로세스마다 캐시가 따로 있어도 버전 비교로 다른 워커의 쓰기를 감지하며,
+같은 프로세스의 일괄 적재는 invalidate_glucose_series 훅으로 바로 제거합니다.
+버전으로 잡지 못하는 변경에 대비해 항목은 GLUCOSE_SERIES_CACHE_TTL_SECONDS가 지나면 만료됩니다.
+GLUCOSE_SERIES_CACHE_MAX_ENTRIES=0이면 캐시와 버전 쿼리를 모두 생략합니다.
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, Optional, Tuple
+
+from .rows import GlucoseSeries
+
+logger = logging.getLogger(__name__)
+
+GLUCOSE_SERIES_CACHE_MAX_ENTRIES = int(os.getenv("GLUCOSE_SERIES_CACHE_MAX_ENTRIES", "512"))
+GLUCOSE_SERIES_CACHE_TTL_SECONDS = float(os.getenv("GLUCOSE_SERIES_CACHE_TTL_SECONDS", "300"))
+
+SeriesKey = Tuple[int, str, str]
+
+
+class GlucoseSeriesCache:
+    """(member_id, start_date, end_date) → (버전, GlucoseSeries) LRU 캐시"""
+
+    def __init__(self, max_entries: int = GLUCOSE_SERIES_CACHE_MAX_ENTRIES,
+                 ttl_seconds: float = GLUCOSE_SERIES_CACHE_TTL_SECONDS):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[SeriesKey, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "stale": 0, "expired": 0, "invalidations": 0, "evictions": 0}
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    def get(self, key: SeriesKey, version: Hashable) -> Optional[GlucoseSeries]:
+        """버전이 같고 만료되지 않았을 때만 캐시된 시계열 반환 (아니면 항목 제거)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+            cached_version, series, expires_at = entry
+            if cached_version != version or time.monotonic() >= expires_at:
+                del self._entries[key]
+                self._stats["stale" if cached_version != version else "expired"] += 1
+                self._stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            return series
+
+    def put(self, key: SeriesKey, version: Hashable, series: GlucoseSeries):
+        """시계열 저장 (요청 간에 공유되므로 배열은 읽기 전용으로 고정)"""
+        if not self.enabled:
+            return
+        series.timestamps.setflags(write=False)
+        series.values.setflags(write=False)
+        with self._lock:
+            self._entries[key] = (version, series, time.monotonic() + self.ttl_seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def invalidate(self, member_id: Optional[int] = None, dates: Optional[Iterable[str]] = None) -> int:
+        """회원의 캐시 항목 제거 (dates를 주면 그 날짜가 기간에 걸친 항목만, member_id가 없으면 전체)"""
+        dates = sorted(dates) if dates is not None else None
+        with self._lock:
+            stale = [
+                key for key in self._entries
+                if member_id is None or (
+                    key[0] == member_id
+                    and (dates is None or any(key[1] <= date <= key[2] for date in dates))
+                )
+            ]
+            for key in stale:
+                del self._entries[key]
+            self._stats["invalidations"] += len(stale)
+        return len(stale)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 적중률 등 통계"""
+        with self._lock:
+            stats = dict(self._stats, size=len(self._entries))
+            stats["bytes"] = sum(
+                series.timestamps.nbytes + series.values.nbytes for _, series, _ in self._entries.values()
+            )
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / lookups, 4) if lookups else 0
+        stats["max_entries"] = self.max_entries
+        stats["ttl_seconds"] = self.ttl_seconds
+        return stats
+
+
+# 전역 기간 혈당 시계열 캐시
+glucose_series_cache = GlucoseSeriesCache()
+
+
+def invalidate_glucose_series(member_id: Optional[int] = None, dates: Optional[Iterable[str]] = None) -> int:
+    """혈당이 바뀌었을 때 캐시 무효화 훅 (제거한 항목 수 반환)"""
+    removed = glucose_series_cache.invalidate(member_id=member_id, dates=dates)
+    if removed:
+        logger.debug(f"혈당 시계열 캐시 무효화 (회원 {member_id}): {removed}건")
+    return removed
+
+
+def get_glucose_series_cache_stats() -> Dict[str, Any]:
+    """혈당 시계열 캐시 통계"""
+    return glucose_series_cache.stats()
@@ -0,0 +1,296 @@
+"""일일 혈당 롤업 유지 및 기간 집계
+
+마감된 날짜(오늘/어제를 제외한 날짜)는 glucose_daily_rollup 행을 그대로 합치고,
+아직 데이터가 들어올 수 있는 최근 날짜와 롤업이 없는 날짜만 원본에서 GROUP BY로 집계합니다.
+롤업 이후 원본이 바뀐 날짜(건수 변화 또는 롤업보다 최근의 updated_at)는 롤업 대신 원본에서 집계합니다.
+롤업 행은 해당 날짜에 측정값이 없으면 reading_count=0으로 저장되므로, 행이 없다는 것은
+"아직 롤업되지 않음"을 뜻합니다.
+
+사용법:
+    python -m app.database.rollups catch-up --days 120           # 마감된 최근 N일 롤업 갱신
+    python -m app.database.rollups verify --member-id 1 --start 2025-06-01 --end 2025-08-29
+"""
+
+import argparse
+import logging
+import os
+import sys
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import BigInteger, and_, case, cast, delete, exists, func, insert, select
+
+from .database import ROUTE_REPLICA, session_scope
+from .rows import GlucoseAggregate, GlucoseSeries
+from app.models.database_models import Glucose, GlucoseArchive, GlucoseDailyRollup, GlucoseHourlyRollup
+
+logger = logging.getLogger(__name__)
+
+# 오늘/어제는 늦게 동기화되는 측정값이 있을 수 있어 항상 원본에서 집계
+ROLLUP_OPEN_DAYS = int(os.getenv("GLUCOSE_ROLLUP_OPEN_DAYS", "2"))
+ROLLUP_INSERT_BATCH_SIZE = 1000
+
+
+def last_closed_date(today: Optional[datetime] = None) -> str:
+    """롤업을 신뢰할 수 있는 마지막 날짜"""
+    today = today or datetime.now()
+    return (today - timedelta(days=ROLLUP_OPEN_DAYS)).strftime("%Y-%m-%d")
+
+
+def _date_strings(start_date: str, end_date: str) -> List[str]:
+    start = datetime.strptime(start_date, "%Y-%m-%d")
+    end = datetime.strptime(end_date, "%Y-%m-%d")
+    return [(start + timedelta(days=i)).strftime("%Y-%m-%d") for i in range((end - start).days + 1)]
+
+
+def _aggregate_statement(start_date: str, end_date: str, member_ids: Optional[Iterable[int]] = None,
+                         dates: Optional[List[str]] = None):
+    """원본 혈당을 (member_id, date)별로 집계하는 쿼리 (값은 mg/dL × 1000 정수로 반올림)"""
+    from .database_utils import period_bounds
+
+    period_start, period_end = period_bounds(start_date, end_date)
+    milli = cast(func.round(Glucose.glucose_mg_dl * 1000), BigInteger)
+    filters = [Glucose.measured_at >= period_start, Glucose.measured_at < period_end]
+    if member_ids is not None:
+        filters.append(Glucose.member_id.in_(list(member_ids)))
+    if dates is not None:
+        filters.append(Glucose.date.in_(dates))
+
+    return (
+        select(
+            Glucose.member_id,
+            Glucose.date,
+            func.count(),
+            func.sum(milli),
+            func.sum(milli * milli),
+            func.min(milli),
+            func.max(milli),
+            func.sum(case((milli.between(70000, 180000), 1), else_=0)),
+            func.sum(case((milli > 180000, 1), else_=0)),
+            func.sum(case((milli < 70000, 1), else_=0)),
+        )
+        .where(*filters)
+        .group_by(Glucose.member_id, Glucose.date)
+    )
+
+
+def _aggregate_raw(db, start_date: str, end_date: str, member_ids: Optional[Iterable[int]] = None,
+                   dates: Optional[List[str]] = None) -> Dict[Tuple[int, str], GlucoseAggregate]:
+    rows = db.execute(_aggregate_statement(start_date, end_date, member_ids, dates))
+    return {
+        (member_id, date): GlucoseAggregate(*(int(value) if value is not None else None for value in values))
+        for member_id, date, *values in rows
+    }
+
+
+def refresh_glucose_rollups(start_date: str, end_date: str, member_ids: Optional[List[int]] = None) -> int:
+    """기간 내 마감된 날짜의 롤업을 원본에서 다시 계산해 교체 (한 트랜잭션)
+
+    member_ids를 주면 해당 회원은 측정값이 없는 날도 0건 행으로 저장합니다.
+    보관 처리된 (회원, 날짜)는 원본이 없으므로 건드리지 않습니다 (보관 처리 시 롤업을 다시 씀).
+
+    Returns:
+        저장된 롤업 행 수
+    """
+    end_date = min(end_date, last_closed_date())
+    if start_date > end_date:
+        return 0
+
+    with session_scope() as db:
+        try:
+            aggregates = _aggregate_raw(db, start_date, end_date, member_ids)
+            if member_ids is None:
+                targets = {member_id for member_id, _ in aggregates}
+                delete_filter = []
+            else:
+                targets = set(member_ids)
+                delete_filter = [GlucoseDailyRollup.member_id.in_(list(targets))]
+
+            archive_filter = [GlucoseArchive.date >= start_date, GlucoseArchive.date <= end_date]
+            if member_ids is not None:
+                archive_filter.append(GlucoseArchive.member_id.in_(list(targets)))
+            archived = set(db.execute(select(GlucoseArchive.member_id, GlucoseArchive.date).where(*archive_filter)).all())
+
+            now = datetime.utcnow()
+            empty = GlucoseAggregate()
+            rows = [
+                dict(aggregates.get((member_id, date), empty)._asdict(), member_id=member_id, date=date, updated_at=now)
+                for member_id in sorted(targets)
+                for date in _date_strings(start_date, end_date)
+                if (member_id, date) not in archived
+            ]
+
+            if archived:
+                delete_filter.append(~exists().where(and_(
+                    GlucoseArchive.member_id == GlucoseDailyRollup.member_id,
+                    GlucoseArchive.date == GlucoseDailyRollup.date
+                )))
+            db.execute(
+                delete(GlucoseDailyRollup.__table__).where(
+                    GlucoseDailyRollup.date >= start_date,
+                    GlucoseDailyRollup.date <= end_date,
+                    *delete_filter
+                )
+            )
+            for offset in range(0, len(rows), ROLLUP_INSERT_BATCH_SIZE):
+                db.execute(insert(GlucoseDailyRollup.__table__).values(rows[offset:offset + ROLLUP_INSERT_BATCH_SIZE]))
+            db.commit()
+        except Exception as e:
+            logger.error(f"혈당 롤업 갱신 실패 ({start_date} ~ {end_date}): {e}")
+            raise
+
+    logger.info(f"혈당 롤업 갱신: {start_date} ~ {end_date}, {len(rows)}행")
+    return len(rows)
+
+
+def _raw_day_versions_statement(member_id: int, start_date: str, end_date: str):
+    """회원의 날짜별 원본 (건수, 최근 수정 시각) 쿼리 - ix_glucose_member_measured 커버링 인덱스만 읽음"""
+    from .database_utils import period_bounds
+
+    period_start, period_end = period_bounds(start_date, end_date)
+    day = func.date(Glucose.measured_at)
+    return (
+        select(day, func.count(), func.max(Glucose.updated_at))
+        .where(Glucose.member_id == member_id, Glucose.measured_at >= period_start, Glucose.measured_at < period_end)
+        .group_by(day)
+    )
+
+
+def _raw_day_versions(db, member_id: int, start_date: str, end_date: str) -> Dict[str, Tuple[int, Optional[datetime]]]:
+    rows = db.execute(_raw_day_versions_statement(member_id, start_date, end_date))
+    return {str(row_day): (count, updated_at) for row_day, count, updated_at in rows}
+
+
+def _stale_rollup_dates(db, member_id: int, start_date: str, end_date: str,
+                        rollup_versions: Dict[str, Tuple[int, Optional[datetime]]]) -> List[str]:
+    """롤업 이후 원본이 바뀐 날짜 (건수가 다르거나 롤업보다 최근에 수정된 원본이 있음)
+
+    배치 적재 외의 쓰기(다른 서비스, 직접 UPDATE/DELETE)는 롤업을 갱신하지 않으므로 조회 시 확인합니다.
+    보관 처리된 날짜는 원본이 롤업의 일부뿐이라 비교하지 않습니다 (늦게 들어온 원본은 다음 보관 처리 때 반영).
+    """
+    raw = _raw_day_versions(db, member_id, start_date, end_date)
+    archived = set(db.execute(
+        select(GlucoseArchive.date).where(
+            GlucoseArchive.member_id == member_id, GlucoseArchive.date >= start_date, GlucoseArchive.date <= end_date
+        )
+    ).scalars())
+    stale = []
+    for date, (rollup_count, rollup_updated_at) in rollup_versions.items():
+        if date in archived:
+            continue
+        raw_count, raw_updated_at = raw.get(date, (0, None))
+        if raw_count != rollup_count or (
+            raw_updated_at is not None and (rollup_updated_at is None or raw_updated_at > rollup_updated_at)
+        ):
+            stale.append(date)
+    return stale
+
+
+def get_glucose_range_aggregate(member_id: int, start_date: str, end_date: str) -> GlucoseAggregate:
+    """기간 혈당 집계 (마감된 날짜는 롤업 행, 롤업 이후 원본이 바뀐 날짜와 나머지는 원본 집계)"""
+    closed_through = last_closed_date()
+    with session_scope(ROUTE_REPLICA) as db:
+        stored = {}
+        if start_date <= closed_through:
+            rollup_end = min(end_date, closed_through)
+            rollup_rows = db.execute(
+                select(GlucoseDailyRollup).where(
+                    GlucoseDailyRollup.member_id == member_id,
+                    GlucoseDailyRollup.date >= start_date,
+                    GlucoseDailyRollup.date <= rollup_end
+                )
+            ).scalars().all()
+            stored = {
+                row.date: GlucoseAggregate(*(getattr(row, field) for field in GlucoseAggregate._fields))
+                for row in rollup_rows
+            }
+            rollup_versions = {row.date: (row.reading_count, row.updated_at) for row in rollup_rows}
+            for date in _stale_rollup_dates(db, member_id, start_date, rollup_end, rollup_versions):
+                del stored[date]
+
+        missing = [date for date in _date_strings(start_date, end_date) if date not in stored]
+        live = {}
+        if missing:
+            live = _aggregate_raw(db, missing[0], missing[-1], [member_id], missing)
+
+    return GlucoseAggregate.merge(list(stored.values()) + list(live.values()))
+
+
+def get_glucose_hourly_series(member_id: int, start_date: str, end_date: str) -> GlucoseSeries:
+    """기간 혈당의 시간대별 평균 시계열 (장기 추이용, 타임스탬프는 각 시간의 시작)
+
+    보관 처리된 날짜는 시간대별 롤업, 나머지 날짜는 원본을 시간대별로 집계합니다.
+    """
+    from .database_utils import period_bounds
+
+    period_start, period_end = period_bounds(start_date, end_date)
+    milli = cast(func.round(Glucose.glucose_mg_dl * 1000), BigInteger)
+    hour = cast(func.substr(Glucose.time, 1, 2), BigInteger)
+    with session_scope(ROUTE_REPLICA) as db:
+        hourly = {
+            (row_date, int(row_hour)): (int(count), int(total))
+            for row_date, row_hour, count, total in db.execute(
+                select(Glucose.date, hour, func.count(), func.sum(milli))
+                .where(Glucose.member_id == member_id, Glucose.measured_at >= period_start,
+                       Glucose.measured_at < period_end)
+                .group_by(Glucose.date, hour)
+            )
+        }
+        # 시간대별 롤업은 보관된 날짜에만 있음 - 늦게 들어온 원본이 있으면 원본 집계보다 롤업(보관분 전체)을 우선
+        for row_date, row_hour, count, total in db.execute(
+            select(GlucoseHourlyRollup.date, GlucoseHourlyRollup.hour,
+                   GlucoseHourlyRollup.reading_count, GlucoseHourlyRollup.glucose_sum_milli)
+            .where(GlucoseHourlyRollup.member_id == member_id, GlucoseHourlyRollup.date >= start_date,
+                   GlucoseHourlyRollup.date <= end_date)
+        ):
+            hourly[(row_date, row_hour)] = (count, total)
+
+    keys = sorted(key for key, (count, _) in hourly.items() if count)
+    timestamps = np.array(
+        [np.datetime64(row_date, "s").astype(np.int64) + row_hour * 3600 for row_date, row_hour in keys],
+        dtype=np.int64
+    )
+    values = np.array([hourly[key][1] / hourly[key][0] / 1000 for key in keys], dtype=np.float32)
+    return GlucoseSeries(timestamps, values)
+
+
+def catch_up(days: int, member_ids: Optional[List[int]] = None) -> int:
+    """마감된 최근 N일 롤업 갱신 (주기 실행용)"""
+    end_date = last_closed_date()
+    start_date = (datetime.strptime(end_date, "%Y-%m-%d") - timedelta(days=days - 1)).strftime("%Y-%m-%d")
+    return refresh_glucose_rollups(start_date, end_date, member_ids)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="일일 혈당 롤업")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    catch_up_parser = subparsers.add_parser("catch-up", help="마감된 최근 N일 롤업 갱신")
+    catch_up_parser.add_argument("--days", type=int, default=120)
+    catch_up_parser.add_argument("--member-id", type=int, action="append", dest="member_ids")
+
+    verify_parser = subparsers.add_parser("verify", help="롤업 기반 요약과 원본 기반 요약 비교")
+    verify_parser.add_argument("--member-id", type=int, required=True)
+    verify_parser.add_argument("--start", required=True)
+    verify_parser.add_argument("--end", required=True)
+    args = parser.parse_args(argv)
+
+    if args.command == "catch-up":
+        print(f"롤업 {catch_up(args.days, args.member_ids)}행 갱신")
+        return 0
+
+    from .database_utils import get_weekly_glucose_series
+    from app.utils.business.glucose_utils import calculate_weekly_glucose_summary
+
+    from_rollup = calculate_weekly_glucose_summary(get_glucose_range_aggregate(args.member_id, args.start, args.end))
+    from_raw = calculate_weekly_glucose_summary(get_weekly_glucose_series(args.member_id, args.start, args.end))
+    if from_rollup != from_raw:
+        print(f"[FAIL] 롤업 요약 {from_rollup} != 원본 요약 {from_raw}", file=sys.stderr)
+        return 1
+    print(f"[OK] {from_rollup}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,154 @@
+"""ORM 객체 대신 사용하는 경량 조회 결과 행 타입"""
+
+from datetime import datetime
+from typing import List, NamedTuple, Optional
+
+import numpy as np
+
+
+class GlucoseRow(NamedTuple):
+    """혈당 측정 행"""
+    id: int
+    date: str
+    time: str
+    glucose_mg_dl: float
+    measured_at: Optional[datetime] = None
+
+
+class FoodRow(NamedTuple):
+    """음식 기록 행"""
+    id: int
+    date: str
+    time: str
+    name: str
+    type: Optional[str]
+    calories: Optional[float]
+    carbs: Optional[float]
+    measured_at: Optional[datetime] = None
+
+
+class ExerciseRow(NamedTuple):
+    """운동 기록 행"""
+    id: int
+    exercise_date: str
+    exercise_name: str
+    exercise_duration: Optional[int]
+    created_at: Optional[datetime]
+    measured_at: Optional[datetime] = None
+
+
+class DailyBundle(NamedTuple):
+    """하루치 혈당/음식/운동 데이터 묶음"""
+    glucose: List[GlucoseRow]
+    food: List[FoodRow]
+    exercise: List[ExerciseRow]
+
+
+class GlucoseAggregate(NamedTuple):
+    """혈당 집계값 (일별 롤업 행 또는 여러 행을 합친 결과)
+
+    합계는 mg/dL × 1000 정수(milli)로 보관해 합산 순서와 관계없이 정확히 같은 결과를 냅니다.
+    """
+    reading_count: int = 0
+    glucose_sum_milli: int = 0
+    glucose_sum_sq_milli: int = 0
+    glucose_min_milli: Optional[int] = None
+    glucose_max_milli: Optional[int] = None
+    in_range_count: int = 0  # 70-180mg/dL
+    hyper_count: int = 0     # >180mg/dL
+    hypo_count: int = 0      # <70mg/dL
+
+    def combine(self, other: "GlucoseAggregate") -> "GlucoseAggregate":
+        """두 집계값 합치기"""
+        mins = [v for v in (self.glucose_min_milli, other.glucose_min_milli) if v is not None]
+        maxs = [v for v in (self.glucose_max_milli, other.glucose_max_milli) if v is not None]
+        return GlucoseAggregate(
+            self.reading_count + other.reading_count,
+            self.glucose_sum_milli + other.glucose_sum_milli,
+            self.glucose_sum_sq_milli + other.glucose_sum_sq_milli,
+            min(mins) if mins else None,
+            max(maxs) if maxs else None,
+            self.in_range_count + other.in_range_count,
+            self.hyper_count + other.hyper_count,
+            self.hypo_count + other.hypo_count,
+        )
+
+    @classmethod
+    def merge(cls, aggregates) -> "GlucoseAggregate":
+        """여러 집계값 합치기"""
+        result = cls()
+        for aggregate in aggregates:
+            result = result.combine(aggregate)
+        return result
+
+    @classmethod
+    def from_milli(cls, milli: np.ndarray) -> "GlucoseAggregate":
+        """milli 정수 배열 집계"""
+        if len(milli) == 0:
+            return cls()
+        milli = milli.astype(np.int64)
+        return cls(
+            reading_count=len(milli),
+            glucose_sum_milli=int(milli.sum()),
+            glucose_sum_sq_milli=int(np.dot(milli, milli)),
+            glucose_min_milli=int(milli.min()),
+            glucose_max_milli=int(milli.max()),
+            in_range_count=int(np.count_nonzero((milli >= 70000) & (milli <= 180000))),
+            hyper_count=int(np.count_nonzero(milli > 180000)),
+            hypo_count=int(np.count_nonzero(milli < 70000)),
+        )
+
+
+class GlucoseSeries:
+    """컬럼형 혈당 시계열 (epoch 초 int64 타임스탬프 + float32 혈당값 병렬 배열)
+
+    타임스탬프는 measured_at(현지 시각, naive)을 UTC로 간주해 변환한 값입니다.
+    """
+
+    __slots__ = ("timestamps", "values")
+
+    def __init__(self, timestamps: np.ndarray, values: np.ndarray):
+        self.timestamps = timestamps
+        self.values = values
+
+    @classmethod
+    def from_rows(cls, rows) -> "GlucoseSeries":
+        """(measured_at, glucose_mg_dl) 튜플 목록으로 생성 (measured_at은 datetime 또는 ISO 문자열)"""
+        if not rows:
+            return cls(np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32))
+        
+        measured_at, values = zip(*rows)
+        stamps = np.array(measured_at, dtype="datetime64[s]").astype(np.int64)
+        return cls(stamps, np.array(values, dtype=np.float32))
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def values_float64(self) -> np.ndarray:
+        """집계용 float64 값 (float32 저장 오차는 소수점 셋째 자리에서 반올림해 제거)"""
+        return np.round(self.values.astype(np.float64), 3)
+
+    def aggregate(self) -> GlucoseAggregate:
+        """일별 롤업과 같은 방식(milli 정수)으로 전체 구간 집계"""
+        return GlucoseAggregate.from_milli(np.round(self.values.astype(np.float64) * 1000))
+
+    def overlay(self, newer: "GlucoseSeries") -> "GlucoseSeries":
+        """두 시계열을 시간순으로 합치기 (같은 타임스탬프는 newer 값 사용)"""
+        if len(self) == 0:
+            return newer
+        if len(newer) == 0:
+            return self
+        timestamps = np.concatenate([self.timestamps, newer.timestamps])
+        values = np.concatenate([self.values, newer.values])
+        order = np.argsort(timestamps, kind="stable")
+        timestamps, values = timestamps[order], values[order]
+        keep = np.append(timestamps[1:] != timestamps[:-1], True)
+        return GlucoseSeries(timestamps[keep], values[keep])
+
+    def to_cgm_readings(self) -> List[dict]:
+        """기존 CGM 형식 readings 목록으로 변환"""
+        times = self.timestamps.astype("datetime64[s]").astype(str)
+        return [
+            {"time": t, "glucose_mg_dl": float(v)}
+            for t, v in zip(times, self.values_float64())
+        ]
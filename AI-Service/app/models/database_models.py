@@ -1,12 +1,25 @@
 """데이터베이스 모델 정의"""
 
-from sqlalchemy import Column, Integer, String, DateTime, Float, Text, Boolean, Date, Time, ForeignKey, Enum, BigInteger
+from sqlalchemy import Column, Integer, String, DateTime, Float, Text, Boolean, Date, Time, ForeignKey, Enum, BigInteger, Index, LargeBinary
+from sqlalchemy import event
 from sqlalchemy.orm import declarative_base, relationship
 from datetime import datetime
 import enum
 
 Base = declarative_base()
 
+# 운동 기록에는 시간 컬럼이 없으므로 운동 날짜의 정오로 가정
+EXERCISE_ASSUMED_TIME = "12:00:00"
+
+
+def combine_date_time(date_str, time_str):
+    """varchar 날짜/시간을 datetime으로 변환 (HH:MM, HH:MM:SS 모두 허용)"""
+    if not date_str:
+        return None
+    time_str = time_str or "00:00"
+    time_format = "%H:%M:%S" if time_str.count(":") == 2 else "%H:%M"
+    return datetime.strptime(f"{date_str} {time_str}", f"%Y-%m-%d {time_format}")
+
 
 class ExerciseType(enum.Enum):
     """운동 타입 열거형"""
@@ -53,12 +66,21 @@ class Member(Base, BaseTimeEntity):
 class Glucose(Base):
     """혈당 모델"""
     __tablename__ = "glucose"
+    __table_args__ = (
+        # 회원+날짜 조회 후 시간순 정렬을 인덱스만으로 처리 (혈당값까지 포함한 커버링 인덱스)
+        Index("ix_glucose_member_date_time", "member_id", "date", "time", "glucose_mg_dl"),
+        # 기간 조회와 결과 캐시 버전 쿼리(updated_at 포함)를 인덱스만으로 처리
+        Index("ix_glucose_member_measured", "member_id", "measured_at", "glucose_mg_dl", "updated_at"),
+        # 같은 회원의 같은 측정 시각은 한 행만 (일괄 적재 upsert의 충돌 키)
+        Index("uq_glucose_member_date_time", "member_id", "date", "time", unique=True),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     member_id = Column(Integer, nullable=False, index=True)
     glucose_mg_dl = Column(Float, nullable=False)
     time = Column(String(8), nullable=False)  # varchar(8) in database
     date = Column(String(10), nullable=False, index=True)  # varchar(10) in database
+    measured_at = Column(DateTime)  # date + time (쓰기 시 자동 갱신)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
@@ -66,6 +88,10 @@ class Glucose(Base):
 class Food(Base):
     """음식 모델"""
     __tablename__ = "food"
+    __table_args__ = (
+        Index("ix_food_member_date_time", "member_id", "date", "time"),
+        Index("ix_food_member_measured", "member_id", "measured_at"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     member_id = Column(Integer, nullable=False, index=True)
@@ -76,6 +102,7 @@ class Food(Base):
     # 실제 DB에 없는 컬럼들은 제거
     date = Column(String(10), nullable=False, index=True)  # varchar(10) in database
     time = Column(String(8), nullable=False)  # varchar(8) in database
+    measured_at = Column(DateTime)  # date + time (쓰기 시 자동 갱신)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
@@ -106,12 +133,17 @@ class ParentChild(Base, BaseTimeEntity):
 class Exercise(Base):
     """운동 모델 (기존 DB 구조 유지)"""
     __tablename__ = "exercise"
+    __table_args__ = (
+        Index("ix_exercise_member_date_created", "member_id", "exercise_date", "created_at"),
+        Index("ix_exercise_member_measured", "member_id", "measured_at", "created_at"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     member_id = Column(BigInteger, ForeignKey("member.member_id"), nullable=False, index=True)
     exercise_name = Column(String(100), nullable=False)  # 기존 DB 컬럼명 유지
     exercise_duration = Column(Integer)  # 기존 DB 컬럼명 유지
     exercise_date = Column(String(10), nullable=False, index=True)  # 기존 DB 컬럼명 유지
+    measured_at = Column(DateTime)  # exercise_date + EXERCISE_ASSUMED_TIME (쓰기 시 자동 갱신)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
@@ -119,9 +151,66 @@ class Exercise(Base):
     member = relationship("Member", back_populates="exercises")
 
 
+class GlucoseDailyRollup(Base):
+    """회원별 일일 혈당 롤업 (합계는 mg/dL × 1000 정수)"""
+    __tablename__ = "glucose_daily_rollup"
+    
+    member_id = Column(Integer, primary_key=True)
+    date = Column(String(10), primary_key=True)  # YYYY-MM-DD
+    reading_count = Column(Integer, nullable=False, default=0)
+    glucose_sum_milli = Column(BigInteger, nullable=False, default=0)
+    glucose_sum_sq_milli = Column(BigInteger, nullable=False, default=0)
+    glucose_min_milli = Column(Integer)
+    glucose_max_milli = Column(Integer)
+    in_range_count = Column(Integer, nullable=False, default=0)  # 70-180mg/dL
+    hyper_count = Column(Integer, nullable=False, default=0)     # >180mg/dL
+    hypo_count = Column(Integer, nullable=False, default=0)      # <70mg/dL
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class GlucoseHourlyRollup(Base):
+    """회원별 시간대별 혈당 롤업 (보관 처리된 날짜용, 필드는 일일 롤업과 같음)"""
+    __tablename__ = "glucose_hourly_rollup"
+    
+    member_id = Column(Integer, primary_key=True)
+    date = Column(String(10), primary_key=True)  # YYYY-MM-DD
+    hour = Column(Integer, primary_key=True)     # 0-23
+    reading_count = Column(Integer, nullable=False, default=0)
+    glucose_sum_milli = Column(BigInteger, nullable=False, default=0)
+    glucose_sum_sq_milli = Column(BigInteger, nullable=False, default=0)
+    glucose_min_milli = Column(Integer)
+    glucose_max_milli = Column(Integer)
+    in_range_count = Column(Integer, nullable=False, default=0)
+    hyper_count = Column(Integer, nullable=False, default=0)
+    hypo_count = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class GlucoseArchive(Base):
+    """보관 기간이 지난 원본 혈당 (회원/날짜별 한 행, 압축된 측정값 묶음)
+    
+    payload는 zlib으로 압축한 [자정 기준 초 델타 int32 × n][혈당 milli 델타 int32 × n] 배열입니다.
+    """
+    __tablename__ = "glucose_archive"
+    __table_args__ = (
+        # 롤업 갱신 시 날짜 범위의 보관된 (회원, 날짜) 조회
+        Index("ix_glucose_archive_date", "date"),
+    )
+    
+    member_id = Column(Integer, primary_key=True)
+    date = Column(String(10), primary_key=True)  # YYYY-MM-DD
+    reading_count = Column(Integer, nullable=False)
+    payload = Column(LargeBinary(16777215), nullable=False)  # MySQL MEDIUMBLOB
+    archived_at = Column(DateTime, default=datetime.utcnow)
+
+
 class Quest(Base):
     """퀘스트 모델"""
     __tablename__ = "quest"
+    __table_args__ = (
+        Index("ix_quest_member_date_created", "member_id", "quest_date", "created_at"),
+        Index("uq_quest_member_date_title", "member_id", "quest_date", "quest_title", unique=True),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     member_id = Column(Integer, nullable=False, index=True)
@@ -134,3 +223,18 @@ class Quest(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+
+@event.listens_for(Glucose, "before_insert")
+@event.listens_for(Glucose, "before_update")
+@event.listens_for(Food, "before_insert")
+@event.listens_for(Food, "before_update")
+def _sync_measured_at(mapper, connection, target):
+    """ORM 쓰기 시 measured_at을 date/time과 동기화"""
+    target.measured_at = combine_date_time(target.date, target.time)
+
+
+@event.listens_for(Exercise, "before_insert")
+@event.listens_for(Exercise, "before_update")
+def _sync_exercise_measured_at(mapper, connection, target):
+    """ORM 쓰기 시 운동 measured_at을 exercise_date와 동기화"""
+    target.measured_at = combine_date_time(target.exercise_date, EXERCISE_ASSUMED_TIME)
@@ -1,36 +1,96 @@
 import os
 import json
-import chromadb
-from typing import List, Dict, Any, Optional
+import logging
+import threading
+import time
+from typing import List, Dict, Any, Optional, Tuple
 from app.core.ai import call_openai_api
 from app.core.config import settings
+from app.services.rag_context_packer import TOKEN_COUNTER, pack_context
+from app.services.embedding_sidecar import EmbeddingSidecarClient, SidecarError
+
+logger = logging.getLogger(__name__)
+
+RAG_SIDECAR_SOCKET = os.getenv("RAG_SIDECAR_SOCKET", "")  # 설정 시 워커 간 공유 임베딩 사이드카 사용
+RAG_SIDECAR_RETRY_SECONDS = float(os.getenv("RAG_SIDECAR_RETRY_SECONDS", "30"))  # 사이드카 장애 후 재연결 시도 간격
+RAG_CANDIDATE_COUNT = int(os.getenv("RAG_CANDIDATE_COUNT", "6"))  # 컨텍스트 패킹 전 검색 후보 수
+RAG_CATEGORY_ROUTING = os.getenv("RAG_CATEGORY_ROUTING", "true").lower() == "true"
+
+# 분석 타입별 검색 대상 카테고리 (embedding_data의 category 값)
+ANALYSIS_CATEGORY_ROUTES = {
+    "child": ["소아 당뇨와 혈당 관리", "혈당 관리", "영양 관리", "운동 관리"],
+    "parent": ["소아 당뇨와 혈당 관리", "혈당 관리", "혈당 패턴과 트렌드", "혈당 모니터링"],
+}
+# 고혈당(>180) 또는 저혈당(<70)이 있으면 분석 타입과 관계없이 추가로 검색할 카테고리
+EMERGENCY_CATEGORIES = ["응급 관리", "혈당 응급상황 대처"]
 
 
 class ChromaRAGService:
     """ChromaDB 기반 RAG 서비스"""
     
-    def __init__(self):
+    def __init__(self, embedding_backend: Optional[str] = None, sidecar_socket: Optional[str] = None):
+        from app.services.embedding_backends import EMBEDDING_BACKEND
+
         self.client = None
         self.collection = None
+        self.sidecar = None
+        self._sidecar_client = None
+        self._sidecar_retry_at = 0.0
+        self._sidecar_lock = threading.Lock()
+        self._fallback_lock = threading.Lock()
+        self._in_process_initialized = False
+        self.embedding_backend = embedding_backend or EMBEDDING_BACKEND
+        self.embedding_function = None
         self.embedding_data_path = os.path.join(os.path.dirname(__file__), "..", "embedding_data")
         self.cache_path = os.path.join(os.path.dirname(__file__), "..", "cache", "rag", "chroma_db")
-        self._initialize_chromadb()
+        
+        # 사이드카가 떠 있으면 임베딩 모델/ChromaDB를 워커에 올리지 않고 공유
+        sidecar_socket = RAG_SIDECAR_SOCKET if sidecar_socket is None else sidecar_socket
+        if sidecar_socket:
+            self._sidecar_client = EmbeddingSidecarClient(sidecar_socket)
+            if self._sidecar_client.ping():
+                self.sidecar = self._sidecar_client
+                print(f"임베딩 사이드카 사용: {sidecar_socket}")
+            else:
+                self._sidecar_retry_at = time.monotonic() + RAG_SIDECAR_RETRY_SECONDS
+                print(f"임베딩 사이드카 연결 실패, in-process 모드로 동작: {sidecar_socket}")
+        
+        if self.sidecar is None:
+            self._initialize_chromadb()
     
     def _initialize_chromadb(self):
         """ChromaDB 초기화 및 컬렉션 설정"""
+        # chromadb는 import만 1초 가까이 걸려 워커 부팅 경로에서 빼고 RAG 첫 사용 시 로드
+        import chromadb
+        from app.services.embedding_backends import get_embedding_function, get_collection_name
+
+        self._in_process_initialized = True
         try:
             # ChromaDB 클라이언트 초기화
             self.client = chromadb.PersistentClient(path=self.cache_path)
             
-            # 컬렉션 생성 또는 가져오기
-            collection_name = "medical_knowledge"
+            # 임베딩 백엔드 선택 (실패 시 ChromaDB 기본 임베딩으로 fallback)
             try:
-                self.collection = self.client.get_collection(name=collection_name)
+                self.embedding_function = get_embedding_function(self.embedding_backend)
+            except Exception as e:
+                print(f"임베딩 백엔드 '{self.embedding_backend}' 초기화 실패, 기본 백엔드 사용: {e}")
+                self.embedding_backend = "default"
+                self.embedding_function = None
+            
+            collection_kwargs = {}
+            if self.embedding_function is not None:
+                collection_kwargs["embedding_function"] = self.embedding_function
+            
+            # 컬렉션 생성 또는 가져오기 (백엔드마다 임베딩 공간이 달라 컬렉션 분리)
+            collection_name = get_collection_name(self.embedding_backend)
+            try:
+                self.collection = self.client.get_collection(name=collection_name, **collection_kwargs)
                 print(f"기존 컬렉션 '{collection_name}' 로드됨")
             except Exception:
                 self.collection = self.client.create_collection(
                     name=collection_name,
-                    metadata={"description": "의료 지식 데이터베이스"}
+                    metadata={"description": "의료 지식 데이터베이스"},
+                    **collection_kwargs
                 )
                 print(f"새 컬렉션 '{collection_name}' 생성됨")
                 self._load_embedding_data()
@@ -95,55 +155,169 @@ class ChromaRAGService:
         except Exception as e:
             print(f"임베딩 데이터 로드 실패: {e}")
     
-    def _search_relevant_documents(self, query: str, n_results: int = 3) -> List[Dict[str, Any]]:
-        """관련 문서 검색"""
+    def _ensure_in_process(self):
+        """in-process 컬렉션을 한 번만 초기화 (동시 요청은 초기화가 끝날 때까지 대기)"""
+        if self._in_process_initialized:
+            return
+        with self._fallback_lock:
+            if not self._in_process_initialized:
+                self._initialize_chromadb()
+    
+    def _reconnect_sidecar(self):
+        """사이드카 장애 후 재시도 간격이 지났으면 한 스레드만 ping으로 재연결 시도"""
+        if self._sidecar_client is None or time.monotonic() < self._sidecar_retry_at:
+            return
+        if not self._sidecar_lock.acquire(blocking=False):
+            return
+        try:
+            if self.sidecar is None and time.monotonic() >= self._sidecar_retry_at:
+                if self._sidecar_client.ping():
+                    self.sidecar = self._sidecar_client
+                    print(f"임베딩 사이드카 재연결: {self._sidecar_client.socket_path}")
+                else:
+                    self._sidecar_retry_at = time.monotonic() + RAG_SIDECAR_RETRY_SECONDS
+        finally:
+            self._sidecar_lock.release()
+    
+    def _query_collection(self, query_texts: List[str], n_results: int, where: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """사이드카 또는 in-process 컬렉션으로 검색
+        
+        사이드카 장애 시 in-process로 전환하고, RAG_SIDECAR_RETRY_SECONDS마다 사이드카 재연결을 시도합니다.
+        """
+        if self.sidecar is None:
+            self._reconnect_sidecar()
+        sidecar = self.sidecar
+        if sidecar is not None:
+            try:
+                return sidecar.query(query_texts, n_results, where)
+            except SidecarError as e:
+                print(f"사이드카 검색 실패, in-process 모드로 전환: {e}")
+                self._sidecar_retry_at = time.monotonic() + RAG_SIDECAR_RETRY_SECONDS
+                self.sidecar = None
+        
+        self._ensure_in_process()
         if not self.collection:
-            return []
+            return None
         
+        query_kwargs = {"query_texts": query_texts, "n_results": n_results}
+        if where:
+            query_kwargs["where"] = where
+        return self.collection.query(**query_kwargs)
+    
+    def _search_relevant_documents(self, query: str, n_results: int = 3, where: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """관련 문서 검색"""
         try:
-            results = self.collection.query(
-                query_texts=[query],
-                n_results=n_results
-            )
-            
-            documents = []
-            if results['documents'] and results['documents'][0]:
-                for i, doc in enumerate(results['documents'][0]):
-                    documents.append({
-                        'content': doc,
-                        'metadata': results['metadatas'][0][i] if results['metadatas'] and results['metadatas'][0] else {},
-                        'distance': results['distances'][0][i] if results['distances'] and results['distances'][0] else 0
-                    })
+            results = self._query_collection([query], n_results, where)
+            if results is None:
+                return []
             
-            return documents
+            return self._parse_query_results(results, 0)
             
         except Exception as e:
             print(f"문서 검색 실패: {e}")
             return []
     
+    def search_many(self, queries: Dict[Any, str], n_results: int = 3, where: Optional[Dict[str, Any]] = None) -> Dict[Any, List[Dict[str, Any]]]:
+        """여러 회원의 관련 문서를 한 번에 검색 (배치 리포트/퀘스트 생성용)
+        
+        queries는 {member_id: 검색 쿼리} 형식이며, 동일한 쿼리는 한 번만 임베딩한 뒤
+        단일 collection.query 호출로 검색하고 회원별 결과로 다시 나눠 반환합니다.
+        """
+        if not queries:
+            return {}
+        
+        # 중복 쿼리 제거 (입력 순서 유지)
+        unique_queries = list(dict.fromkeys(queries.values()))
+        
+        try:
+            results = self._query_collection(unique_queries, n_results, where)
+        except Exception as e:
+            print(f"배치 문서 검색 실패: {e}")
+            return {key: [] for key in queries}
+        
+        if results is None:
+            return {key: [] for key in queries}
+        
+        documents_by_query = {
+            query: self._parse_query_results(results, i)
+            for i, query in enumerate(unique_queries)
+        }
+        
+        # 같은 쿼리를 공유하는 회원끼리 결과 리스트를 공유하지 않도록 복사
+        return {key: list(documents_by_query[query]) for key, query in queries.items()}
+    
+    def _parse_query_results(self, results: Dict[str, Any], index: int) -> List[Dict[str, Any]]:
+        """collection.query 결과에서 index번째 쿼리의 문서 목록 추출"""
+        documents = []
+        if results['documents'] and len(results['documents']) > index and results['documents'][index]:
+            metadatas = results['metadatas'][index] if results['metadatas'] and results['metadatas'][index] else None
+            distances = results['distances'][index] if results['distances'] and results['distances'][index] else None
+            ids = results['ids'][index] if results.get('ids') and results['ids'][index] else None
+            for i, doc in enumerate(results['documents'][index]):
+                documents.append({
+                    'id': ids[i] if ids else None,
+                    'content': doc,
+                    'metadata': metadatas[i] if metadatas else {},
+                    'distance': distances[i] if distances else 0
+                })
+        
+        return documents
+    
+    def build_search_query(self, metrics: Dict[str, Any]) -> str:
+        """혈당 지표 기반 검색 쿼리 생성"""
+        avg_glucose = metrics.get('average_glucose', 0)
+        spike_count = metrics.get('spike_count', 0)
+        
+        if avg_glucose <= 120:
+            glucose_status = "정상 혈당"
+        elif avg_glucose <= 140:
+            glucose_status = "경계 혈당"
+        else:
+            glucose_status = "고혈당"
+        
+        return f"{glucose_status} 관리 혈당 {avg_glucose}mg/dL 스파이크 {spike_count}회"
+    
+    def build_category_filter(self, metrics: Dict[str, Any], analysis_type: str = "child") -> Optional[Dict[str, Any]]:
+        """분석 타입/혈당 상태에 맞는 카테고리 where 필터 생성 (라우팅 비활성화 시 None)"""
+        if not RAG_CATEGORY_ROUTING:
+            return None
+        
+        categories = list(ANALYSIS_CATEGORY_ROUTES.get(analysis_type, ANALYSIS_CATEGORY_ROUTES["parent"]))
+        if metrics.get('max_glucose', 0) > 180 or 0 < metrics.get('min_glucose', 0) < 70:
+            categories.extend(EMERGENCY_CATEGORIES)
+        
+        return {"category": {"$in": categories}}
+    
+    def search_for_analysis(self, query: str, metrics: Dict[str, Any], analysis_type: str = "child",
+                            n_results: int = RAG_CANDIDATE_COUNT) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]], bool]:
+        """분석 타입 카테고리 필터로 검색하고, 필터에 걸리는 문서가 없으면 전체 컬렉션에서 다시 검색
+        
+        Returns:
+            (검색 결과, 적용한 카테고리 필터, 필터 없이 다시 검색했는지 여부)
+        """
+        category_filter = self.build_category_filter(metrics, analysis_type)
+        documents = self._search_relevant_documents(query, n_results=n_results, where=category_filter)
+        if not documents and category_filter:
+            return self._search_relevant_documents(query, n_results=n_results), category_filter, True
+        return documents, category_filter, False
+    
     def generate_rag_enhanced_analysis(self, metrics: Dict[str, Any], member_id: str, analysis_type: str = "child") -> Dict[str, Any]:
         """RAG 강화된 혈당 분석 생성"""
         try:
-            # 혈당 지표 기반 검색 쿼리 생성
             avg_glucose = metrics.get('average_glucose', 0)
             spike_count = metrics.get('spike_count', 0)
             health_index = metrics.get('health_index', 0)
             
-            # 검색 쿼리 생성
-            if avg_glucose <= 120:
-                glucose_status = "정상 혈당"
-            elif avg_glucose <= 140:
-                glucose_status = "경계 혈당"
-            else:
-                glucose_status = "고혈당"
-            
-            query = f"{glucose_status} 관리 혈당 {avg_glucose}mg/dL 스파이크 {spike_count}회"
+            # 혈당 지표 기반 검색 쿼리 생성
+            query = self.build_search_query(metrics)
             
-            # 관련 문서 검색
-            relevant_docs = self._search_relevant_documents(query, n_results=3)
+            # 관련 문서 검색 (패킹 단계에서 다양성/예산 기준으로 추려내도록 후보를 넉넉히 조회)
+            candidate_docs, category_filter, category_fallback = self.search_for_analysis(query, metrics, analysis_type)
             
             # RAG 강화 프롬프트 생성
-            rag_context = self._build_rag_context(relevant_docs)
+            rag_context, relevant_docs, packing_stats = self._build_rag_context(candidate_docs, analysis_type)
+            logger.debug(f"RAG 컨텍스트 {packing_stats['context_tokens']}토큰 사용 "
+                         f"(예산 {packing_stats['token_budget']}, 절감 {packing_stats['tokens_saved']}토큰)")
             
             # 분석 타입에 따른 프롬프트 선택
             if analysis_type == "child":
@@ -171,26 +345,29 @@ class ChromaRAGService:
             # OpenAI API 호출
             response = call_openai_api(enhanced_prompt)
             
+            rag_metadata = {
+                "knowledge_sources_used": len(relevant_docs),
+                "search_query": query,
+                "search_categories": category_filter["category"]["$in"] if category_filter and not category_fallback else [],
+                "category_fallback": category_fallback,
+                "relevant_docs": [doc['metadata']['title'] for doc in relevant_docs],
+                "context_tokens": packing_stats['context_tokens'],
+                "tokens_saved": packing_stats['tokens_saved'],
+                "token_counter": packing_stats['token_counter']
+            }
+            
             # JSON 파싱 시도
             try:
                 result = json.loads(response)
             except json.JSONDecodeError:
                 result = {
                     "analysis": response,
-                    "rag_metadata": {
-                        "knowledge_sources_used": len(relevant_docs),
-                        "search_query": query,
-                        "relevant_docs": [doc['metadata']['title'] for doc in relevant_docs]
-                    }
+                    "rag_metadata": rag_metadata
                 }
             
             # RAG 메타데이터 추가
             if 'rag_metadata' not in result:
-                result['rag_metadata'] = {
-                    "knowledge_sources_used": len(relevant_docs),
-                    "search_query": query,
-                    "relevant_docs": [doc['metadata']['title'] for doc in relevant_docs]
-                }
+                result['rag_metadata'] = rag_metadata
             
             return result
             
@@ -202,23 +379,18 @@ class ChromaRAGService:
                 "fallback": True
             }
     
-    def _build_rag_context(self, relevant_docs: List[Dict[str, Any]]) -> str:
-        """검색된 문서들로부터 컨텍스트 구성"""
+    def _build_rag_context(self, relevant_docs: List[Dict[str, Any]], analysis_type: str = "child") -> Tuple[str, List[Dict[str, Any]], Dict[str, Any]]:
+        """검색된 문서들로부터 컨텍스트 구성 (MMR 다양성 + 중복 문장 제거 + 토큰 예산)"""
         if not relevant_docs:
-            return "관련 의료 지식이 없습니다."
+            empty_stats = {"token_budget": 0, "baseline_tokens": 0, "context_tokens": 0, "tokens_saved": 0, "sentences_dropped": 0,
+                           "token_counter": TOKEN_COUNTER}
+            return "관련 의료 지식이 없습니다.", [], empty_stats
         
-        context_parts = []
-        for i, doc in enumerate(relevant_docs, 1):
-            title = doc['metadata'].get('title', f'문서 {i}')
-            content = doc['content']
-            category = doc['metadata'].get('category', '기타')
-            
-            context_parts.append(f"""
-[{i}] {title} ({category})
-{content}
-""")
+        context, used_docs, stats = pack_context(relevant_docs, analysis_type)
+        if not context:
+            return "관련 의료 지식이 없습니다.", [], stats
         
-        return "\n".join(context_parts)
+        return context, used_docs, stats
     
     def _get_child_analysis_prompt(self) -> str:
         """아이용 분석 프롬프트"""
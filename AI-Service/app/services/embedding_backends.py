@@ -0,0 +1,157 @@
+"""RAG 임베딩 백엔드 선택
+
+RAG_EMBEDDING_BACKEND 환경 변수로 임베딩 백엔드를 고릅니다.
+- default: ChromaDB 기본 임베딩 함수 (all-MiniLM-L6-v2, fp32 ONNX)
+- sentence_transformers: sentence-transformers(torch) fp32 모델
+- onnx_int8: 같은 모델을 ONNX로 내보내 int8 동적 양자화 후 onnxruntime으로 실행 (CPU 전용)
+"""
+
+import os
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from chromadb.api.types import Documents, EmbeddingFunction, Embeddings
+
+DEFAULT_BACKEND = "default"
+SUPPORTED_BACKENDS = ("default", "sentence_transformers", "onnx_int8")
+
+EMBEDDING_BACKEND = os.getenv("RAG_EMBEDDING_BACKEND", DEFAULT_BACKEND)
+EMBEDDING_MODEL_NAME = os.getenv("RAG_EMBEDDING_MODEL", "sentence-transformers/all-MiniLM-L6-v2")
+ONNX_MODEL_DIR = os.getenv(
+    "RAG_ONNX_MODEL_DIR",
+    os.path.join(os.path.dirname(__file__), "..", "cache", "onnx")
+)
+ONNX_NUM_THREADS = int(os.getenv("RAG_ONNX_NUM_THREADS", "0"))  # 0이면 onnxruntime 기본값 사용
+
+
+class QuantizedONNXEmbeddingFunction(EmbeddingFunction[Documents]):
+    """int8 동적 양자화 ONNX 모델 기반 임베딩 함수 (mean pooling + L2 정규화)"""
+
+    def __init__(self, model_name: str = EMBEDDING_MODEL_NAME, model_dir: Optional[str] = None,
+                 max_length: int = 256, batch_size: int = 32):
+        from transformers import AutoTokenizer
+        import onnxruntime as ort
+
+        self.model_name = model_name
+        self.model_dir = model_dir or os.path.join(ONNX_MODEL_DIR, model_name.replace("/", "__"))
+        self.max_length = max_length
+        self.batch_size = batch_size
+
+        quantized_path = os.path.join(self.model_dir, "model.int8.onnx")
+        if not os.path.exists(quantized_path):
+            export_quantized_onnx_model(model_name, self.model_dir)
+
+        self.tokenizer = AutoTokenizer.from_pretrained(self.model_dir)
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if ONNX_NUM_THREADS > 0:
+            options.intra_op_num_threads = ONNX_NUM_THREADS
+        self.session = ort.InferenceSession(quantized_path, options, providers=["CPUExecutionProvider"])
+        self.input_names = {model_input.name for model_input in self.session.get_inputs()}
+
+    def __call__(self, input: Documents) -> Embeddings:
+        embeddings = []
+        for start in range(0, len(input), self.batch_size):
+            embeddings.extend(self._embed_batch(list(input[start:start + self.batch_size])))
+        return embeddings
+
+    def _embed_batch(self, texts: List[str]) -> List[np.ndarray]:
+        """토큰화 → ONNX 추론 → mean pooling → L2 정규화"""
+        encoded = self.tokenizer(
+            texts,
+            padding=True,
+            truncation=True,
+            max_length=self.max_length,
+            return_tensors="np"
+        )
+        feeds = {
+            name: encoded[name].astype(np.int64)
+            for name in ("input_ids", "attention_mask", "token_type_ids")
+            if name in self.input_names and name in encoded
+        }
+        last_hidden_state = self.session.run(None, feeds)[0]
+
+        mask = encoded["attention_mask"][..., None].astype(np.float32)
+        pooled = (last_hidden_state * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+        norms = np.linalg.norm(pooled, axis=1, keepdims=True)
+        pooled = pooled / np.clip(norms, 1e-12, None)
+        return [row.astype(np.float32) for row in pooled]
+
+    @staticmethod
+    def name() -> str:
+        return "danjjang_onnx_int8"
+
+    def get_config(self) -> Dict[str, Any]:
+        return {"model_name": self.model_name, "model_dir": self.model_dir, "max_length": self.max_length}
+
+    @staticmethod
+    def build_from_config(config: Dict[str, Any]) -> "QuantizedONNXEmbeddingFunction":
+        return QuantizedONNXEmbeddingFunction(
+            model_name=config.get("model_name", EMBEDDING_MODEL_NAME),
+            model_dir=config.get("model_dir"),
+            max_length=config.get("max_length", 256)
+        )
+
+
+def export_quantized_onnx_model(model_name: str, model_dir: str) -> str:
+    """Hugging Face 모델을 ONNX로 내보낸 뒤 int8 동적 양자화하여 저장"""
+    import torch
+    from transformers import AutoModel, AutoTokenizer
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    os.makedirs(model_dir, exist_ok=True)
+    fp32_path = os.path.join(model_dir, "model.fp32.onnx")
+    int8_path = os.path.join(model_dir, "model.int8.onnx")
+
+    tokenizer = AutoTokenizer.from_pretrained(model_name)
+    model = AutoModel.from_pretrained(model_name)
+    model.eval()
+
+    sample = tokenizer(["혈당 관리"], return_tensors="pt")
+    input_names = [name for name in ("input_ids", "attention_mask", "token_type_ids") if name in sample]
+    dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in input_names}
+    dynamic_axes["last_hidden_state"] = {0: "batch", 1: "sequence"}
+
+    with torch.no_grad():
+        torch.onnx.export(
+            model,
+            tuple(sample[name] for name in input_names),
+            fp32_path,
+            input_names=input_names,
+            output_names=["last_hidden_state"],
+            dynamic_axes=dynamic_axes,
+            opset_version=14
+        )
+
+    quantize_dynamic(fp32_path, int8_path, weight_type=QuantType.QInt8)
+    tokenizer.save_pretrained(model_dir)
+    print(f"int8 ONNX 임베딩 모델 생성 완료: {int8_path}")
+    return int8_path
+
+
+def get_embedding_function(backend: Optional[str] = None):
+    """백엔드 이름에 맞는 임베딩 함수 반환 (default는 None → ChromaDB 기본값 사용)"""
+    backend = backend or EMBEDDING_BACKEND
+
+    if backend == "default":
+        return None
+    if backend == "sentence_transformers":
+        from chromadb.utils.embedding_functions import SentenceTransformerEmbeddingFunction
+        return SentenceTransformerEmbeddingFunction(
+            model_name=EMBEDDING_MODEL_NAME,
+            device="cpu",
+            normalize_embeddings=True
+        )
+    if backend == "onnx_int8":
+        return QuantizedONNXEmbeddingFunction()
+
+    raise ValueError(f"지원하지 않는 임베딩 백엔드: {backend} (지원: {', '.join(SUPPORTED_BACKENDS)})")
+
+
+def get_collection_name(backend: Optional[str] = None, base_name: str = "medical_knowledge") -> str:
+    """백엔드별 컬렉션 이름 (임베딩 공간이 다르므로 컬렉션을 분리)"""
+    backend = backend or EMBEDDING_BACKEND
+    if backend == "default":
+        return base_name
+    return f"{base_name}_{backend}"
@@ -0,0 +1,243 @@
+"""임베딩/검색 사이드카 - 모든 웹 워커가 하나의 임베딩 모델과 ChromaDB를 공유
+
+워커마다 임베딩 모델과 Chroma 클라이언트를 따로 올리지 않도록, 호스트당 하나의 사이드카 프로세스가
+Unix 소켓으로 배치 임베딩과 top-k 검색을 제공합니다.
+
+실행:
+    python -m app.services.embedding_sidecar --socket /tmp/danjjang-rag.sock
+워커 설정:
+    RAG_SIDECAR_SOCKET=/tmp/danjjang-rag.sock  (연결 실패 시 워커는 in-process 모드로 동작)
+
+프로토콜 (네트워크 바이트 순서):
+    요청  = op(uint8) + payload_len(uint32) + payload
+    응답  = status(uint8) + payload_len(uint32) + payload   (status 0=성공, 1=오류 → payload는 UTF-8 메시지)
+    텍스트 목록 = count(uint32) + [len(uint32) + UTF-8 bytes] * count
+    OP_PING  : payload 없음 → b"pong"
+    OP_EMBED : 텍스트 목록 → rows(uint32) + dim(uint32) + float32 행렬
+    OP_QUERY : n_results(uint16) + where_len(uint32) + where JSON + 텍스트 목록
+               → collection.query 결과(ids/documents/metadatas/distances) JSON
+"""
+
+import argparse
+import json
+import os
+import socket
+import socketserver
+import struct
+import threading
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+OP_PING = 0
+OP_EMBED = 1
+OP_QUERY = 2
+
+STATUS_OK = 0
+STATUS_ERROR = 1
+
+_HEADER = struct.Struct("!BI")
+_UINT32 = struct.Struct("!I")
+_QUERY_HEADER = struct.Struct("!HI")
+
+DEFAULT_SOCKET_PATH = os.getenv("RAG_SIDECAR_SOCKET", "")
+SIDECAR_TIMEOUT_SECONDS = float(os.getenv("RAG_SIDECAR_TIMEOUT", "10"))
+
+
+class SidecarError(Exception):
+    """사이드카 통신/처리 오류"""
+
+
+def _recv_exact(sock: socket.socket, size: int) -> bytes:
+    buffer = bytearray()
+    while len(buffer) < size:
+        chunk = sock.recv(size - len(buffer))
+        if not chunk:
+            raise ConnectionError("사이드카 연결이 종료되었습니다")
+        buffer.extend(chunk)
+    return bytes(buffer)
+
+
+def _send_frame(sock: socket.socket, code: int, payload: bytes = b""):
+    sock.sendall(_HEADER.pack(code, len(payload)) + payload)
+
+
+def _recv_frame(sock: socket.socket):
+    code, length = _HEADER.unpack(_recv_exact(sock, _HEADER.size))
+    return code, _recv_exact(sock, length) if length else b""
+
+
+def pack_texts(texts: List[str]) -> bytes:
+    parts = [_UINT32.pack(len(texts))]
+    for text in texts:
+        encoded = text.encode("utf-8")
+        parts.append(_UINT32.pack(len(encoded)))
+        parts.append(encoded)
+    return b"".join(parts)
+
+
+def unpack_texts(payload: bytes, offset: int = 0) -> List[str]:
+    (count,) = _UINT32.unpack_from(payload, offset)
+    offset += _UINT32.size
+    texts = []
+    for _ in range(count):
+        (length,) = _UINT32.unpack_from(payload, offset)
+        offset += _UINT32.size
+        texts.append(payload[offset:offset + length].decode("utf-8"))
+        offset += length
+    return texts
+
+
+def pack_embeddings(embeddings) -> bytes:
+    matrix = np.asarray(embeddings, dtype=np.float32)
+    if matrix.ndim != 2:
+        matrix = matrix.reshape(len(matrix), -1)
+    return _UINT32.pack(matrix.shape[0]) + _UINT32.pack(matrix.shape[1]) + matrix.tobytes()
+
+
+def unpack_embeddings(payload: bytes) -> np.ndarray:
+    (rows,) = _UINT32.unpack_from(payload, 0)
+    (dim,) = _UINT32.unpack_from(payload, _UINT32.size)
+    return np.frombuffer(payload, dtype=np.float32, offset=_UINT32.size * 2).reshape(rows, dim)
+
+
+class EmbeddingSidecarClient:
+    """사이드카 클라이언트 (스레드별로 연결을 하나씩 유지)"""
+
+    def __init__(self, socket_path: str = DEFAULT_SOCKET_PATH, timeout: float = SIDECAR_TIMEOUT_SECONDS):
+        self.socket_path = socket_path
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _connection(self) -> socket.socket:
+        sock = getattr(self._local, "sock", None)
+        if sock is None:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(self.timeout)
+            sock.connect(self.socket_path)
+            self._local.sock = sock
+        return sock
+
+    def _close(self):
+        sock = getattr(self._local, "sock", None)
+        if sock is not None:
+            try:
+                sock.close()
+            finally:
+                self._local.sock = None
+
+    def _request(self, op: int, payload: bytes = b"") -> bytes:
+        try:
+            sock = self._connection()
+            _send_frame(sock, op, payload)
+            status, response = _recv_frame(sock)
+        except (OSError, ConnectionError, struct.error) as e:
+            self._close()
+            raise SidecarError(f"사이드카 통신 실패: {e}") from e
+
+        if status != STATUS_OK:
+            raise SidecarError(response.decode("utf-8", errors="replace"))
+        return response
+
+    def ping(self) -> bool:
+        try:
+            return self._request(OP_PING) == b"pong"
+        except SidecarError:
+            return False
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        return unpack_embeddings(self._request(OP_EMBED, pack_texts(texts)))
+
+    def query(self, query_texts: List[str], n_results: int = 3, where: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        where_bytes = json.dumps(where, ensure_ascii=False).encode("utf-8") if where else b""
+        payload = _QUERY_HEADER.pack(n_results, len(where_bytes)) + where_bytes + pack_texts(query_texts)
+        return json.loads(self._request(OP_QUERY, payload).decode("utf-8"))
+
+
+class _SidecarRequestHandler(socketserver.BaseRequestHandler):
+    """연결 하나에서 여러 요청 프레임을 순서대로 처리"""
+
+    def handle(self):
+        while True:
+            try:
+                op, payload = _recv_frame(self.request)
+            except (ConnectionError, OSError):
+                return
+
+            try:
+                response = self.server.dispatch(op, payload)
+                _send_frame(self.request, STATUS_OK, response)
+            except Exception as e:
+                _send_frame(self.request, STATUS_ERROR, str(e).encode("utf-8"))
+
+
+class EmbeddingSidecarServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """ChromaRAGService 하나를 in-process로 올려 여러 워커의 요청을 처리하는 서버"""
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: str, service=None):
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        super().__init__(socket_path, _SidecarRequestHandler)
+        os.chmod(socket_path, 0o660)
+
+        if service is None:
+            from app.services.chroma_rag_service import ChromaRAGService
+            service = ChromaRAGService(sidecar_socket="")
+        self.service = service
+
+    def _embedding_function(self):
+        collection = self.service.collection
+        if self.service.embedding_function is not None:
+            return self.service.embedding_function
+        if collection is not None and getattr(collection, "_embedding_function", None) is not None:
+            return collection._embedding_function
+        from chromadb.utils.embedding_functions import DefaultEmbeddingFunction
+        return DefaultEmbeddingFunction()
+
+    def dispatch(self, op: int, payload: bytes) -> bytes:
+        if op == OP_PING:
+            return b"pong"
+
+        if op == OP_EMBED:
+            return pack_embeddings(self._embedding_function()(unpack_texts(payload)))
+
+        if op == OP_QUERY:
+            if self.service.collection is None:
+                raise SidecarError("사이드카의 ChromaDB 컬렉션이 초기화되지 않았습니다")
+            n_results, where_length = _QUERY_HEADER.unpack_from(payload, 0)
+            offset = _QUERY_HEADER.size
+            where = json.loads(payload[offset:offset + where_length].decode("utf-8")) if where_length else None
+            query_texts = unpack_texts(payload, offset + where_length)
+
+            query_kwargs = {"query_texts": query_texts, "n_results": n_results}
+            if where:
+                query_kwargs["where"] = where
+            results = self.service.collection.query(**query_kwargs)
+            response = {
+                key: results.get(key)
+                for key in ("ids", "documents", "metadatas", "distances")
+            }
+            return json.dumps(response, ensure_ascii=False).encode("utf-8")
+
+        raise SidecarError(f"알 수 없는 요청 코드: {op}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="RAG 임베딩/검색 사이드카")
+    parser.add_argument("--socket", default=DEFAULT_SOCKET_PATH or "/tmp/danjjang-rag.sock")
+    args = parser.parse_args(argv)
+
+    server = EmbeddingSidecarServer(args.socket)
+    print(f"임베딩 사이드카 시작: {args.socket} (백엔드: {server.service.embedding_backend})")
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        if os.path.exists(args.socket):
+            os.unlink(args.socket)
+
+
+if __name__ == "__main__":
+    main()
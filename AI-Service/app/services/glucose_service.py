@@ -1,12 +1,18 @@
 import json
+import numpy as np
 from app.core.ai import call_openai_api
+from app.database.rows import GlucoseSeries
 from app.services.chroma_rag_service import get_chroma_rag_service
 
 
 def calculate_glucose_metrics(data):
     """
     data는 {"cgm_data": {"readings": [{"time": "2025-09-03T08:00", "glucose_mg_dl": 95}, ...]}} 형식
+    또는 get_weekly_glucose_series가 반환한 GlucoseSeries
     """
+    if isinstance(data, GlucoseSeries):
+        return _calculate_series_metrics(data)
+    
     if not isinstance(data, dict) or "cgm_data" not in data:
         return {"error": "올바르지 않은 혈당 데이터 형식입니다."}
     
@@ -41,6 +47,25 @@ def calculate_glucose_metrics(data):
     }
 
 
+def _calculate_series_metrics(series):
+    """GlucoseSeries 기반 혈당 지표 계산 (calculate_glucose_metrics와 같은 결과 형식)"""
+    if len(series) == 0:
+        return {"error": "혈당 데이터가 없습니다."}
+    
+    values = series.values_float64()
+    avg_glucose = float(values.mean())
+    spike_count = int(np.count_nonzero(np.diff(values) >= 30))
+    health_index = max(0, 100 - (avg_glucose - 100) - (spike_count * 5))
+    
+    return {
+        "average_glucose": round(avg_glucose, 2),
+        "max_glucose": float(values.max()),
+        "min_glucose": float(values.min()),
+        "spike_count": spike_count,
+        "health_index": round(health_index, 2)
+    }
+
+
 def analyze_glucose(metrics, prompt_text, user_age=None, member_id=None, use_rag=True, analysis_type="child"):
     """혈당 데이터를 분석하여 맞춤 퀘스트를 생성 (Hugging Face RAG 지원)"""
     
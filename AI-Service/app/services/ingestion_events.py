@@ -0,0 +1,57 @@
+"""측정값 적재 이벤트 훅
+
+혈당 일괄 적재가 커밋되면 emit_glucose_ingested가 등록된 리스너를 등록 순서대로 호출합니다.
+다운스트림 캐시(롤업, 결과 캐시 등)는 register_ingestion_listener로 무효화/재계산 훅을 붙입니다.
+리스너 예외는 적재 결과에 영향을 주지 않도록 로그만 남기고 다음 리스너로 넘어갑니다.
+"""
+
+import logging
+from typing import Callable, List, NamedTuple, Tuple
+
+from app.database.result_cache import invalidate_glucose_series
+from app.database.rollups import last_closed_date, refresh_glucose_rollups
+
+logger = logging.getLogger(__name__)
+
+
+class GlucoseIngestedEvent(NamedTuple):
+    """혈당 적재 이벤트 (dates는 새로 들어오거나 값이 바뀐 날짜)"""
+    member_id: int
+    dates: Tuple[str, ...]
+    inserted: int
+    updated: int
+
+
+_listeners: List[Callable[[GlucoseIngestedEvent], None]] = []
+
+
+def register_ingestion_listener(listener: Callable[[GlucoseIngestedEvent], None]):
+    """적재 이벤트 리스너 등록 (데코레이터로도 사용 가능)"""
+    if listener not in _listeners:
+        _listeners.append(listener)
+    return listener
+
+
+def emit_glucose_ingested(event: GlucoseIngestedEvent):
+    """등록된 리스너에 적재 이벤트 전달 (바뀐 날짜가 없으면 생략)"""
+    if not event.dates:
+        return
+    for listener in list(_listeners):
+        try:
+            listener(event)
+        except Exception:
+            logger.exception(f"적재 이벤트 리스너 오류 ({getattr(listener, '__name__', listener)})")
+
+
+@register_ingestion_listener
+def refresh_closed_day_rollups(event: GlucoseIngestedEvent):
+    """늦게 도착한 측정값이 마감된 날짜에 들어오면 해당 회원의 일일 롤업 재계산"""
+    closed = [date for date in event.dates if date <= last_closed_date()]
+    if closed:
+        refresh_glucose_rollups(min(closed), max(closed), [event.member_id])
+
+
+@register_ingestion_listener
+def invalidate_weekly_series_cache(event: GlucoseIngestedEvent):
+    """바뀐 날짜가 걸린 기간 혈당 시계열 캐시 항목 제거 (다른 워커는 버전 비교로 감지)"""
+    invalidate_glucose_series(event.member_id, event.dates)
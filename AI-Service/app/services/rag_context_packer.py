@@ -0,0 +1,159 @@
+"""RAG 컨텍스트 패킹 - MMR 다양성 선택, 유사 문장 제거, 분석 타입별 토큰 예산 적용"""
+
+import logging
+import os
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# tiktoken은 선택 의존성 (없으면 문자 기반 추정치 사용)
+try:
+    import tiktoken
+    _encoding = tiktoken.get_encoding("cl100k_base")
+    TIKTOKEN_AVAILABLE = True
+except Exception as e:
+    _encoding = None
+    TIKTOKEN_AVAILABLE = False
+    logger.warning(f"tiktoken을 사용할 수 없어 문자 기반 토큰 추정치로 예산을 적용합니다: {e}")
+TOKEN_COUNTER = "tiktoken" if TIKTOKEN_AVAILABLE else "heuristic"
+
+# 분석 타입별 컨텍스트 토큰 예산
+CONTEXT_TOKEN_BUDGETS = {
+    "child": int(os.getenv("RAG_CONTEXT_TOKEN_BUDGET_CHILD", "220")),
+    "parent": int(os.getenv("RAG_CONTEXT_TOKEN_BUDGET_PARENT", "360")),
+}
+DEFAULT_TOKEN_BUDGET = int(os.getenv("RAG_CONTEXT_TOKEN_BUDGET", "300"))
+
+MMR_LAMBDA = float(os.getenv("RAG_MMR_LAMBDA", "0.7"))  # 1에 가까울수록 관련도 우선, 0에 가까울수록 다양성 우선
+MAX_CONTEXT_DOCUMENTS = int(os.getenv("RAG_MAX_CONTEXT_DOCUMENTS", "3"))
+SENTENCE_DUPLICATE_THRESHOLD = 0.6  # 문자 bigram Jaccard 유사도가 이 이상이면 중복 문장으로 간주
+
+_SENTENCE_SPLIT_PATTERN = re.compile(r'(?<=[.!?])\s+')
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+
+
+def estimate_tokens(text: str) -> int:
+    """프롬프트 토큰 수 추정"""
+    if not text:
+        return 0
+    if _encoding is not None:
+        return len(_encoding.encode(text))
+    # 한글 등 비ASCII 문자는 대략 문자당 1토큰, ASCII는 4문자당 1토큰
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    return (len(text) - ascii_chars) + (ascii_chars + 3) // 4
+
+
+def _shingles(text: str) -> set:
+    """공백을 제거한 문자 bigram 집합"""
+    compact = _WHITESPACE_PATTERN.sub('', text)
+    if len(compact) < 2:
+        return {compact} if compact else set()
+    return {compact[i:i + 2] for i in range(len(compact) - 1)}
+
+
+def _jaccard(a: set, b: set) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def split_sentences(text: str) -> List[str]:
+    """문서를 문장 단위로 분리"""
+    return [sentence.strip() for sentence in _SENTENCE_SPLIT_PATTERN.split(text or '') if sentence.strip()]
+
+
+def select_diverse_documents(documents: List[Dict[str, Any]], max_documents: int = MAX_CONTEXT_DOCUMENTS,
+                             mmr_lambda: float = MMR_LAMBDA) -> List[Dict[str, Any]]:
+    """MMR(Maximal Marginal Relevance)로 관련성이 높으면서 서로 겹치지 않는 문서 선택
+
+    관련도는 검색 거리(distance)로, 문서 간 유사도는 문자 bigram Jaccard로 계산해
+    추가 임베딩 호출 없이 동작합니다.
+    """
+    candidates = [
+        (doc, 1.0 / (1.0 + float(doc.get('distance') or 0)), _shingles(doc.get('content', '')))
+        for doc in documents
+    ]
+    selected = []
+    while candidates and len(selected) < max_documents:
+        best_index, best_score = 0, None
+        for i, (_, relevance, shingles) in enumerate(candidates):
+            redundancy = max((_jaccard(shingles, chosen[2]) for chosen in selected), default=0.0)
+            score = mmr_lambda * relevance - (1 - mmr_lambda) * redundancy
+            if best_score is None or score > best_score:
+                best_index, best_score = i, score
+        selected.append(candidates.pop(best_index))
+
+    return [doc for doc, _, _ in selected]
+
+
+def format_context_entry(index: int, doc: Dict[str, Any], content: Optional[str] = None) -> str:
+    """컨텍스트 항목 포맷 ([번호] 제목 (카테고리) + 본문)"""
+    title = doc['metadata'].get('title', f'문서 {index}')
+    category = doc['metadata'].get('category', '기타')
+    return f"""
+[{index}] {title} ({category})
+{doc['content'] if content is None else content}
+"""
+
+
+def pack_context(documents: List[Dict[str, Any]], analysis_type: str = "child",
+                 token_budget: Optional[int] = None) -> Tuple[str, List[Dict[str, Any]], Dict[str, Any]]:
+    """검색 결과를 토큰 예산 안에서 중복 없이 컨텍스트 문자열로 구성
+
+    Returns:
+        (컨텍스트 문자열, 실제 사용된 문서 목록, 패킹 통계)
+    """
+    budget = CONTEXT_TOKEN_BUDGETS.get(analysis_type, DEFAULT_TOKEN_BUDGET) if token_budget is None else token_budget
+
+    # 기존 방식(상위 3개 문서 원문 연결) 대비 절감량을 보고하기 위한 기준값
+    baseline = "\n".join(format_context_entry(i, doc) for i, doc in enumerate(documents[:3], 1))
+    baseline_tokens = estimate_tokens(baseline)
+
+    kept_shingles: List[set] = []
+    context_parts = []
+    used_documents = []
+    used_tokens = 0
+    dropped_sentences = 0
+
+    for doc in select_diverse_documents(documents):
+        sentences = []
+        for sentence in split_sentences(doc.get('content', '')):
+            shingles = _shingles(sentence)
+            if any(_jaccard(shingles, kept) >= SENTENCE_DUPLICATE_THRESHOLD for kept in kept_shingles):
+                dropped_sentences += 1
+                continue
+            sentences.append((sentence, shingles))
+
+        # 예산을 넘는 첫 문장에서 멈춤 (뒤 문장을 골라 넣으면 문서 흐름이 끊김)
+        index = len(context_parts) + 1
+        header_tokens = estimate_tokens(format_context_entry(index, doc, ""))
+        included = []
+        entry_tokens = header_tokens
+        for position, (sentence, shingles) in enumerate(sentences):
+            sentence_tokens = estimate_tokens(sentence) + 1
+            if used_tokens + entry_tokens + sentence_tokens > budget:
+                dropped_sentences += len(sentences) - position
+                break
+            included.append(sentence)
+            kept_shingles.append(shingles)
+            entry_tokens += sentence_tokens
+
+        if not included:
+            continue
+
+        context_parts.append(format_context_entry(index, doc, " ".join(included)))
+        used_documents.append(doc)
+        used_tokens += entry_tokens
+
+    context = "\n".join(context_parts)
+    context_tokens = estimate_tokens(context)
+    stats = {
+        "token_budget": budget,
+        "baseline_tokens": baseline_tokens,
+        "context_tokens": context_tokens,
+        "tokens_saved": max(0, baseline_tokens - context_tokens),
+        "sentences_dropped": dropped_sentences,
+        "token_counter": TOKEN_COUNTER,
+    }
+    return context, used_documents, stats
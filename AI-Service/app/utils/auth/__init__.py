@@ -4,6 +4,10 @@ from .jwt_auth import (
     jwt_auth, jwt_auth_member_id, jwt_auth_code,
     get_member_by_code
 )
+from .member_cache import (
+    member_cache, get_cached_member_info, get_cached_member_by_code,
+    invalidate_member, get_member_cache_stats
+)
 from .authorization import Permission, Role, require_permission, has_permission
 from .input_validator import InputValidator, validate_request_data
 from .security_logger import log_security_event
@@ -11,6 +15,8 @@ from .security_logger import log_security_event
 __all__ = [
     'jwt_auth', 'jwt_auth_member_id', 'jwt_auth_code',
     'get_member_by_code',
+    'member_cache', 'get_cached_member_info', 'get_cached_member_by_code',
+    'invalidate_member', 'get_member_cache_stats',
     'Permission', 'Role', 'require_permission', 'has_permission',
     'InputValidator', 'validate_request_data',
     'log_security_event'
@@ -4,10 +4,12 @@ import jwt
 from functools import wraps
 from flask import request, g, current_app
 from app.utils.error import AuthenticationError, ValidationError, get_user_friendly_error
-from app.database import get_member_info
 from .input_validator import InputValidator
+from .member_cache import get_cached_member_info, get_cached_member_by_code
 from .security_logger import log_security_event
 from app.core.config import settings
+from app.models.database_models import Member
+from sqlalchemy import bindparam, select
 from typing import Optional, Dict, Any, Callable
 import logging
 import os
@@ -146,7 +148,7 @@ def authenticate_by_member_id(payload: Dict[str, Any]) -> Optional[Dict[str, Any
                           error_message=str(e))
         raise
     
-    member_info = get_member_info(member_id)
+    member_info = get_cached_member_info(member_id)
     if not member_info:
         log_security_event("auth_attempt", 
                           user_identifier=str(member_id), 
@@ -155,6 +157,7 @@ def authenticate_by_member_id(payload: Dict[str, Any]) -> Optional[Dict[str, Any
                           error_message=f"회원 ID {member_id}를 찾을 수 없습니다")
         raise AuthenticationError(f"회원 ID {member_id}를 찾을 수 없습니다.")
     
+    member_info['member_id'] = member_id
     member_info['auth_type'] = 'member_id'
     member_info['auth_value'] = member_id
     
@@ -175,7 +178,7 @@ def authenticate_by_code(payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     if not isinstance(code, str) or len(code.strip()) == 0:
         raise ValidationError("code는 비어있지 않은 문자열이어야 합니다.")
     
-    member_info = get_member_by_code(code)
+    member_info = get_cached_member_by_code(code)
     if not member_info:
         raise AuthenticationError(f"코드 {code}에 해당하는 회원을 찾을 수 없습니다.")
     
@@ -221,42 +224,46 @@ def jwt_auth(auth_type: str):
 jwt_auth_member_id = lambda f: jwt_auth("member_id")(f)
 jwt_auth_code = lambda f: jwt_auth("code")(f)
 
+# code로 회원 조회 (모듈 로드 시 한 번 구성하고 바인드 값만 바꿔 실행)
+_MEMBER_BY_CODE_QUERY = select(Member).where(Member.code == bindparam("code"))
+
+
+def load_member_by_code(code):
+    """code로 회원 정보를 조회합니다. (DB 오류는 호출자에게 전파)"""
+    from app.database import session_scope
+    from datetime import datetime
+    
+    with session_scope() as db:
+        member = db.execute(_MEMBER_BY_CODE_QUERY, {"code": code}).scalars().first()
+        if member:
+            # 생년월일에서 나이 계산
+            if member.birth:
+                if isinstance(member.birth, int):
+                    birth_year = member.birth // 10000
+                else:
+                    birth_year = member.birth.year
+                current_year = datetime.now().year
+                age = current_year - birth_year
+            else:
+                age = None
+            
+            return {
+                'member_id': member.member_id,
+                'username': member.username,
+                'email': member.email,
+                'age': age,
+                'diabetes_type': member.diabetes_type,
+                'gender': member.gender,
+                'height': member.height,
+                'weight': member.weight,
+                'code': member.code
+            }
+        return None
+
 def get_member_by_code(code):
     """code로 회원 정보를 조회합니다."""
     try:
-        from app.database import SessionLocal
-        from app.models.database_models import Member
-        from datetime import datetime
-        
-        db = SessionLocal()
-        try:
-            member = db.query(Member).filter(Member.code == code).first()
-            if member:
-                # 생년월일에서 나이 계산
-                if member.birth:
-                    if isinstance(member.birth, int):
-                        birth_year = member.birth // 10000
-                    else:
-                        birth_year = member.birth.year
-                    current_year = datetime.now().year
-                    age = current_year - birth_year
-                else:
-                    age = None
-                
-                return {
-                    'member_id': member.member_id,
-                    'username': member.username,
-                    'email': member.email,
-                    'age': age,
-                    'diabetes_type': member.diabetes_type,
-                    'gender': member.gender,
-                    'height': member.height,
-                    'weight': member.weight,
-                    'code': member.code
-                }
-            return None
-        finally:
-            db.close()
+        return load_member_by_code(code)
     except Exception as e:
         logger.error(f"회원 조회 오류: {str(e)}")
         return None
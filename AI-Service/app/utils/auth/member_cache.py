@@ -0,0 +1,129 @@
+"""JWT 인증용 회원 프로필 TTL 캐시
+
+member_id / code별 회원 정보를 짧은 TTL 동안 보관해 인증 시 DB 조회를 생략합니다.
+존재하지 않는 회원도 더 짧은 TTL로 캐시(negative caching)하고,
+DB 오류로 조회하지 못한 경우는 캐시하지 않습니다.
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from app.database import get_member_info
+
+logger = logging.getLogger(__name__)
+
+MEMBER_CACHE_TTL_SECONDS = float(os.getenv("MEMBER_CACHE_TTL_SECONDS", "60"))
+MEMBER_CACHE_NEGATIVE_TTL_SECONDS = float(os.getenv("MEMBER_CACHE_NEGATIVE_TTL_SECONDS", "10"))
+MEMBER_CACHE_MAX_ENTRIES = int(os.getenv("MEMBER_CACHE_MAX_ENTRIES", "10000"))
+
+_MISSING = object()
+
+
+class MemberProfileCache:
+    """(종류, 키) → 회원 정보 dict TTL 캐시 (LRU 방식으로 최대 크기 유지)"""
+
+    def __init__(self, ttl: float = MEMBER_CACHE_TTL_SECONDS, negative_ttl: float = MEMBER_CACHE_NEGATIVE_TTL_SECONDS,
+                 max_entries: int = MEMBER_CACHE_MAX_ENTRIES):
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "negative_hits": 0, "misses": 0, "expired": 0, "invalidations": 0}
+
+    def _get(self, key: Hashable):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats["misses"] += 1
+                return _MISSING
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self._stats["expired"] += 1
+                self._stats["misses"] += 1
+                return _MISSING
+            self._entries.move_to_end(key)
+            self._stats["hits" if value is not None else "negative_hits"] += 1
+            return value
+
+    def _set(self, key: Hashable, value: Optional[Dict[str, Any]]):
+        ttl = self.ttl if value is not None else self.negative_ttl
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get_or_load(self, kind: str, key: Hashable, loader: Callable[[Any], Optional[Dict[str, Any]]]):
+        """캐시에서 조회하고 없으면 loader로 읽어 저장 (호출자가 수정해도 되도록 복사본 반환)
+
+        loader가 예외를 던지면 캐시하지 않고 그대로 전파합니다.
+        """
+        value = self._get((kind, key))
+        if value is _MISSING:
+            value = loader(key)
+            self._set((kind, key), value)
+        return dict(value) if value is not None else None
+
+    def invalidate(self, member_id: Optional[int] = None, code: Optional[str] = None):
+        """회원 캐시 무효화 (member_id로 무효화하면 같은 회원의 code 항목도 제거)"""
+        with self._lock:
+            if code is not None and self._entries.pop(("code", code), None) is not None:
+                self._stats["invalidations"] += 1
+            if member_id is not None:
+                stale = [
+                    key for key, (_, value) in self._entries.items()
+                    if key == ("member_id", member_id)
+                    or (key[0] == "code" and value is not None and value.get("member_id") == member_id)
+                ]
+                for key in stale:
+                    del self._entries[key]
+                self._stats["invalidations"] += len(stale)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 적중률 등 통계"""
+        with self._lock:
+            stats = dict(self._stats, size=len(self._entries))
+        lookups = stats["hits"] + stats["negative_hits"] + stats["misses"]
+        stats["hit_rate"] = round((stats["hits"] + stats["negative_hits"]) / lookups, 4) if lookups else 0
+        stats["ttl_seconds"] = self.ttl
+        stats["negative_ttl_seconds"] = self.negative_ttl
+        return stats
+
+
+# 전역 회원 프로필 캐시
+member_cache = MemberProfileCache()
+
+
+def get_cached_member_info(member_id: int) -> Optional[Dict[str, Any]]:
+    """member_id로 회원 정보 조회 (캐시 우선)"""
+    return member_cache.get_or_load("member_id", member_id, get_member_info)
+
+
+def get_cached_member_by_code(code: str) -> Optional[Dict[str, Any]]:
+    """code로 회원 정보 조회 (캐시 우선, DB 오류 시 None 반환하고 캐시하지 않음)"""
+    from .jwt_auth import load_member_by_code
+    try:
+        return member_cache.get_or_load("code", code, load_member_by_code)
+    except Exception as e:
+        logger.error(f"회원 조회 오류: {str(e)}")
+        return None
+
+
+def invalidate_member(member_id: Optional[int] = None, code: Optional[str] = None):
+    """회원 정보가 바뀌었을 때 캐시 무효화 훅"""
+    member_cache.invalidate(member_id=member_id, code=code)
+
+
+def get_member_cache_stats() -> Dict[str, Any]:
+    """회원 캐시 통계"""
+    return member_cache.stats()
@@ -2,7 +2,8 @@
 
 from .glucose_utils import (
     format_glucose_data, calculate_weekly_glucose_summary,
-    generate_glucose_quest_pool, select_daily_quests, get_default_date_range
+    generate_glucose_quest_pool, select_daily_quests, get_default_date_range,
+    parse_glucose_readings
 )
 from .glucose_analysis_utils import (
     calculate_glucose_change, calculate_gl_index, calculate_glucose_score,
@@ -24,6 +25,7 @@ from .ai_utils import (
 __all__ = [
     'format_glucose_data', 'calculate_weekly_glucose_summary',
     'generate_glucose_quest_pool', 'select_daily_quests', 'get_default_date_range',
+    'parse_glucose_readings',
     'calculate_glucose_change', 'calculate_gl_index', 'calculate_glucose_score',
     'classify_glucose_status', 'analyze_food_glucose_impact', 'analyze_exercise_glucose_impact',
     'calculate_expected_glucose_decrease', 'calculate_exercise_score',
@@ -54,29 +54,44 @@ def classify_glucose_status(glucose_value: float) -> str:
         return "고혈당"
 
 
+def _measured_at(record) -> datetime:
+    """기록의 측정 시각 (measured_at이 있으면 그대로 사용하고, 없으면 date/time 문자열 파싱)"""
+    measured_at = getattr(record, 'measured_at', None)
+    if measured_at is not None:
+        return measured_at
+    return datetime.strptime(f"{record.date} {record.time}", "%Y-%m-%d %H:%M")
+
+
+def _find_surrounding_glucose(event_time: datetime, timed_glucose: List[Tuple[datetime, Any]],
+                              after_min_hours: float, after_max_hours: float) -> Tuple[Optional[Any], Optional[Any]]:
+    """이벤트 직전의 가장 가까운 측정값과, 이벤트 후 지정 구간 내 가장 이른 측정값 찾기"""
+    before_glucose, before_diff = None, None
+    after_glucose, after_diff = None, None
+    
+    for glucose_time, glucose in timed_glucose:
+        time_diff = (glucose_time - event_time).total_seconds() / 3600  # 시간 단위
+        
+        if time_diff <= 0:
+            if before_glucose is None or time_diff > before_diff:
+                before_glucose, before_diff = glucose, time_diff
+        elif after_min_hours <= time_diff <= after_max_hours:
+            if after_glucose is None or time_diff < after_diff:
+                after_glucose, after_diff = glucose, time_diff
+    
+    return before_glucose, after_glucose
+
+
 def analyze_food_glucose_impact(food_data: List[Any], glucose_data: List[Any]) -> List[Dict[str, Any]]:
     """음식이 혈당에 미친 영향 분석"""
     results = []
+    # 혈당 측정 시각은 한 번만 계산
+    timed_glucose = [(_measured_at(glucose), glucose) for glucose in glucose_data]
     
     for food in food_data:
-        food_time = datetime.strptime(f"{food.date} {food.time}", "%Y-%m-%d %H:%M")
-        
-        # 음식 섭취 전후 2시간 내의 혈당 데이터 찾기
-        before_glucose = None
-        after_glucose = None
+        food_time = _measured_at(food)
         
-        for glucose in glucose_data:
-            glucose_time = datetime.strptime(f"{glucose.date} {glucose.time}", "%Y-%m-%d %H:%M")
-            time_diff = (glucose_time - food_time).total_seconds() / 3600  # 시간 단위
-            
-            # 음식 섭취 전 혈당 (섭취 시점 이전의 가장 가까운 측정값)
-            if time_diff <= 0:
-                if before_glucose is None or time_diff > (datetime.strptime(f"{before_glucose.date} {before_glucose.time}", "%Y-%m-%d %H:%M") - food_time).total_seconds() / 3600:
-                    before_glucose = glucose
-            # 음식 섭취 후 혈당 (섭취 후 1-4시간 사이의 측정값)
-            elif 1 <= time_diff <= 4:
-                if after_glucose is None or time_diff < (datetime.strptime(f"{after_glucose.date} {after_glucose.time}", "%Y-%m-%d %H:%M") - food_time).total_seconds() / 3600:
-                    after_glucose = glucose
+        # 음식 섭취 전 가장 가까운 혈당과 섭취 후 1-4시간 사이의 혈당
+        before_glucose, after_glucose = _find_surrounding_glucose(food_time, timed_glucose, 1, 4)
         
         if before_glucose and after_glucose:
             # 혈당 변화량 계산
@@ -123,28 +138,14 @@ def analyze_food_glucose_impact(food_data: List[Any], glucose_data: List[Any]) -
 def analyze_exercise_glucose_impact(exercise_data: List[Any], glucose_data: List[Any]) -> List[Dict[str, Any]]:
     """운동이 혈당에 미친 영향 분석"""
     results = []
+    timed_glucose = [(_measured_at(glucose), glucose) for glucose in glucose_data]
     
     for exercise in exercise_data:
-        # 기존 Exercise 모델 구조에 맞게 수정
-        # time 컬럼이 없으므로 created_at을 사용하되, 날짜만 사용
-        exercise_time = exercise.created_at.replace(hour=12, minute=0, second=0, microsecond=0)  # 오후 12시로 가정
+        # time 컬럼이 없으므로 measured_at(운동 날짜 정오)을 사용하고, 없으면 created_at 날짜의 정오로 가정
+        exercise_time = getattr(exercise, 'measured_at', None) or exercise.created_at.replace(hour=12, minute=0, second=0, microsecond=0)
         
-        # 운동 전후 혈당 데이터 찾기
-        before_glucose = None
-        after_glucose = None
-        
-        for glucose in glucose_data:
-            glucose_time = datetime.strptime(f"{glucose.date} {glucose.time}", "%Y-%m-%d %H:%M")
-            time_diff = (glucose_time - exercise_time).total_seconds() / 3600  # 시간 단위
-            
-            # 운동 전 혈당 (운동 시점 이전의 가장 가까운 측정값)
-            if time_diff <= 0:
-                if before_glucose is None or time_diff > (datetime.strptime(f"{before_glucose.date} {before_glucose.time}", "%Y-%m-%d %H:%M") - exercise_time).total_seconds() / 3600:
-                    before_glucose = glucose
-            # 운동 후 혈당 (운동 후 1-3시간 사이의 측정값)
-            elif 1 <= time_diff <= 3:
-                if after_glucose is None or time_diff < (datetime.strptime(f"{after_glucose.date} {after_glucose.time}", "%Y-%m-%d %H:%M") - exercise_time).total_seconds() / 3600:
-                    after_glucose = glucose
+        # 운동 전 가장 가까운 혈당과 운동 후 1-3시간 사이의 혈당
+        before_glucose, after_glucose = _find_surrounding_glucose(exercise_time, timed_glucose, 1, 3)
         
         if before_glucose and after_glucose:
             # 혈당 변화량 계산
@@ -1,11 +1,26 @@
 """혈당 관련 유틸리티 함수들"""
 
+import math
 import random
+import re
 from datetime import datetime, timedelta
 
+from app.database.rows import GlucoseAggregate, GlucoseSeries
+
+# 일괄 적재 측정값 검증 (정규식은 모듈 로드 시 한 번만 컴파일)
+GLUCOSE_READING_MIN = 20
+GLUCOSE_READING_MAX = 600
+GLUCOSE_READING_FUTURE_SKEW = timedelta(minutes=10)
+_MEASURED_AT_PATTERN = re.compile(r"^(\d{4})-(\d{2})-(\d{2})[T ](\d{2}):(\d{2})(?::(\d{2})(?:\.\d+)?)?$")
+_DATE_PATTERN = re.compile(r"^(\d{4})-(\d{2})-(\d{2})$")
+_TIME_PATTERN = re.compile(r"^(\d{2}):(\d{2})(?::(\d{2}))?$")
+
 
 def format_glucose_data(readings):
     """혈당 데이터를 CGM 형식으로 변환"""
+    if isinstance(readings, GlucoseSeries):
+        return {"cgm_data": {"readings": readings.to_cgm_readings()}}
+    
     cgm_readings = []
     for r in readings:
         # 시간 처리를 안전하게 수정
@@ -26,8 +41,12 @@ def format_glucose_data(readings):
 
 
 def calculate_weekly_glucose_summary(glucose_data):
-    """주간 혈당 데이터 요약 계산"""
-    if not glucose_data:
+    """주간 혈당 데이터 요약 계산 (ORM 목록, GlucoseSeries, GlucoseAggregate 모두 허용)"""
+    if isinstance(glucose_data, GlucoseSeries):
+        glucose_data = glucose_data.aggregate()
+    
+    reading_count = glucose_data.reading_count if isinstance(glucose_data, GlucoseAggregate) else len(glucose_data or [])
+    if not reading_count:
         return {
             'average_glucose': 0,
             'tir_percentage': 0,
@@ -37,20 +56,31 @@ def calculate_weekly_glucose_summary(glucose_data):
             'exercise_recovery_pattern': "데이터 부족"
         }
     
-    glucose_values = [log.glucose_mg_dl for log in glucose_data]
-    average_glucose = sum(glucose_values) / len(glucose_values)
-    
-    # TIR 계산 (70-180mg/dL)
-    tir_count = sum(1 for glucose in glucose_values if 70 <= glucose <= 180)
-    tir_percentage = round((tir_count / len(glucose_values)) * 100, 1)
-    
-    # 고혈당/저혈당 횟수
-    hyperglycemia_count = sum(1 for glucose in glucose_values if glucose > 180)
-    hypoglycemia_count = sum(1 for glucose in glucose_values if glucose < 70)
+    if isinstance(glucose_data, GlucoseAggregate):
+        # 롤업/시계열 집계는 milli 정수 합으로 계산 (합산 순서와 무관하게 같은 결과)
+        average_glucose = glucose_data.glucose_sum_milli / reading_count / 1000
+        tir_count = glucose_data.in_range_count
+        hyperglycemia_count = glucose_data.hyper_count
+        hypoglycemia_count = glucose_data.hypo_count
+        variance = (
+            reading_count * glucose_data.glucose_sum_sq_milli - glucose_data.glucose_sum_milli ** 2
+        ) / (reading_count * reading_count) / 1_000_000
+    else:
+        glucose_values = [log.glucose_mg_dl for log in glucose_data]
+        average_glucose = sum(glucose_values) / len(glucose_values)
+        
+        # TIR 계산 (70-180mg/dL)
+        tir_count = sum(1 for glucose in glucose_values if 70 <= glucose <= 180)
+        
+        # 고혈당/저혈당 횟수
+        hyperglycemia_count = sum(1 for glucose in glucose_values if glucose > 180)
+        hypoglycemia_count = sum(1 for glucose in glucose_values if glucose < 70)
+        
+        # 혈당 변동성 (분산)
+        variance = sum((glucose - average_glucose) ** 2 for glucose in glucose_values) / len(glucose_values)
     
-    # 혈당 변동성 (표준편차)
-    variance = sum((glucose - average_glucose) ** 2 for glucose in glucose_values) / len(glucose_values)
-    glucose_variability = round(variance ** 0.5, 1)
+    tir_percentage = round((tir_count / reading_count) * 100, 1)
+    glucose_variability = round(max(variance, 0) ** 0.5, 1)
     
     # 운동 후 회복 패턴 분석
     if glucose_variability < 30:
@@ -177,3 +207,68 @@ def get_default_date_range():
     end_date = datetime.now().strftime("%Y-%m-%d")
     start_date = (datetime.now() - timedelta(days=6)).strftime("%Y-%m-%d")
     return start_date, end_date
+
+
+def _reading_datetime(reading):
+    """측정값의 측정 시각 파싱 (measured_at 또는 date + time, 형식이 틀리면 None)"""
+    measured_at = reading.get("measured_at")
+    if isinstance(measured_at, str):
+        match = _MEASURED_AT_PATTERN.match(measured_at)
+        if not match:
+            return None
+        parts = match.groups()
+    else:
+        date_str, time_str = reading.get("date"), reading.get("time")
+        if not isinstance(date_str, str) or not isinstance(time_str, str):
+            return None
+        date_match, time_match = _DATE_PATTERN.match(date_str), _TIME_PATTERN.match(time_str)
+        if not date_match or not time_match:
+            return None
+        parts = date_match.groups() + time_match.groups()
+    try:
+        return datetime(*(int(part) for part in parts if part is not None))
+    except ValueError:
+        return None
+
+
+def parse_glucose_readings(readings, now=None):
+    """일괄 적재용 측정값 검증 및 정규화
+    
+    측정 시각은 measured_at(YYYY-MM-DDTHH:MM[:SS]) 또는 date + time으로 받고,
+    기존 데이터와 같은 HH:MM 형식(분 단위)으로 맞춥니다.
+    
+    Returns:
+        (유효한 측정값 목록, [{"index", "error"}] 형태의 거부 목록)
+    """
+    latest_allowed = (now or datetime.now()) + GLUCOSE_READING_FUTURE_SKEW
+    valid, rejected = [], []
+    for index, reading in enumerate(readings):
+        if not isinstance(reading, dict):
+            rejected.append({"index": index, "error": "측정값은 객체여야 합니다"})
+            continue
+        
+        measured_at = _reading_datetime(reading)
+        if measured_at is None:
+            rejected.append({"index": index, "error": "measured_at 또는 date/time 형식이 올바르지 않습니다"})
+            continue
+        if measured_at > latest_allowed:
+            rejected.append({"index": index, "error": "미래 시각의 측정값입니다"})
+            continue
+        
+        value = reading.get("glucose_mg_dl")
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value):
+            rejected.append({"index": index, "error": "glucose_mg_dl은 숫자여야 합니다"})
+            continue
+        if not GLUCOSE_READING_MIN <= value <= GLUCOSE_READING_MAX:
+            rejected.append({
+                "index": index,
+                "error": f"glucose_mg_dl은 {GLUCOSE_READING_MIN}-{GLUCOSE_READING_MAX} 범위여야 합니다"
+            })
+            continue
+        
+        valid.append({
+            "date": measured_at.strftime("%Y-%m-%d"),
+            "time": measured_at.strftime("%H:%M"),
+            "glucose_mg_dl": float(value),
+        })
+    return valid, rejected
@@ -6,7 +6,7 @@ from .error_handler import (
     RateLimitError, ServiceUnavailableError, TimeoutError,
     DataIntegrityError, ResourceExhaustedError, QuestError, ConflictError,
     handle_api_error, safe_json_response, log_request_info,
-    validate_glucose_value, validate_quest_status, validate_approval_status,
+    validate_date_format, validate_glucose_value, validate_quest_status, validate_approval_status,
     validate_age, validate_diabetes_type, handle_ai_service_error,
     handle_database_error, handle_glucose_data_error, handle_quest_error
 )
@@ -18,7 +18,7 @@ __all__ = [
     'RateLimitError', 'ServiceUnavailableError', 'TimeoutError',
     'DataIntegrityError', 'ResourceExhaustedError', 'QuestError', 'ConflictError',
     'handle_api_error', 'safe_json_response', 'log_request_info',
-    'validate_glucose_value', 'validate_quest_status', 'validate_approval_status',
+    'validate_date_format', 'validate_glucose_value', 'validate_quest_status', 'validate_approval_status',
     'validate_age', 'validate_diabetes_type', 'handle_ai_service_error',
     'handle_database_error', 'handle_glucose_data_error', 'handle_quest_error',
     'get_user_friendly_error', 'get_user_friendly_success'